@@ -0,0 +1,109 @@
+"""
+CrewAI Tool Adaptation Benchmark
+
+Measures how long it takes to adapt MCP tools to CrewAI tools for toolsets of
+different sizes, with the adaptation cache cold and warm.
+
+Usage:
+    python benchmarks/bench_adaptation.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+
+import mcp.types as types
+
+from frontegg_ai_sdk.core.crewai_tools import adapt_mcp_tool_to_crewai_tool, clear_adaptation_cache
+
+TOOL_COUNTS = (1, 50, 500)
+
+
+def make_tools(count: int) -> List[types.Tool]:
+    """
+    Build a synthetic toolset with nested, $ref-based input schemas.
+    """
+    tools = []
+    for index in range(count):
+        tools.append(types.Tool(
+            name=f"tool_{index}",
+            description=f"Synthetic tool number {index}",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string", "description": "Search query"},
+                    "limit": {"type": "integer", "default": 10},
+                    "filters": {"$ref": "#/$defs/Filters"},
+                },
+                "required": ["query"],
+                "$defs": {
+                    "Filters": {
+                        "type": "object",
+                        "properties": {
+                            "owner": {"type": "string"},
+                            "tags": {"type": "array", "items": {"type": "string"}},
+                            "index": {"type": "integer", "const": index},
+                        },
+                    },
+                },
+            },
+        ))
+    return tools
+
+
+def time_adaptation(tools: List[types.Tool]) -> float:
+    started = time.perf_counter()
+    for tool in tools:
+        adapt_mcp_tool_to_crewai_tool(tool)
+    return time.perf_counter() - started
+
+
+def run(repeat: int) -> List[Dict[str, Any]]:
+    results = []
+    for count in TOOL_COUNTS:
+        tools = make_tools(count)
+        cold, warm = [], []
+        for _ in range(repeat):
+            clear_adaptation_cache()
+            cold.append(time_adaptation(tools))
+            warm.append(time_adaptation(tools))
+        for cache_state, samples in (("cold", cold), ("warm", warm)):
+            median = statistics.median(samples)
+            results.append({
+                "benchmark": "crewai_adaptation",
+                "tools": count,
+                "cache": cache_state,
+                "median_ms": round(median * 1000, 3),
+                "per_tool_us": round(median / count * 1e6, 1),
+                "repeat": repeat,
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Samples per measurement")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        print(
+            f"{result['tools']:>4} tools, {result['cache']} cache: "
+            f"{result['median_ms']:>10.3f} ms ({result['per_tool_us']:.1f} us/tool)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""
+Client Hot Path Benchmark
+
+Measures list_tools and call_tool latency and throughput, session
+initialization overhead and memory allocated per call, against the in-process
+stub MCP server in `stub_server.py`.
+
+Usage:
+    python benchmarks/bench_client.py [--calls N] [--concurrency N] [--latency S]
+                                      [--payload-size BYTES] [--tools N] [--sse] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Add the src and benchmarks directories to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from frontegg_ai_sdk import (
+    Environment,
+    FronteggAiClient,
+    FronteggAiClientConfig,
+    InMemoryMetricsSink,
+    setup_logger,
+)
+from stub_server import StubMcpServer
+
+QUIET_LOGGER = setup_logger(name="frontegg_ai_sdk_bench", level=logging.CRITICAL)
+
+
+def make_client(server: StubMcpServer, metrics: Any = None, **config: Any) -> FronteggAiClient:
+    """
+    Build a client whose requests, vendor JWT included, are served by the stub.
+    """
+    config.setdefault("tools_cache_ttl", 0)
+    config.setdefault("circuit_breaker", False)
+    return FronteggAiClient(
+        FronteggAiClientConfig(
+            environment=Environment.US,
+            agent_id="bench-agent",
+            client_id="bench-client",
+            client_secret="bench-secret",
+            **config,
+        ),
+        logger=QUIET_LOGGER,
+        http_client=server.http_client(),
+        metrics=metrics,
+    )
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[max(int(len(ordered) * 0.95) - 1, 0)] * 1000, 3),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 3),
+    }
+
+
+async def sample(operation: Callable[[], Awaitable[Any]], count: int) -> List[float]:
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await operation()
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def bench_latency(server: StubMcpServer, calls: int) -> List[Dict[str, Any]]:
+    """
+    Sequential list_tools and call_tool latency over a warm pooled session.
+    """
+    async with make_client(server) as client:
+        await client.call_tool("tool_0", {"query": "warmup"})
+        list_samples = await sample(client.list_tools, calls)
+        call_samples = await sample(lambda: client.call_tool("tool_0", {"query": "bench"}), calls)
+    return [
+        {"benchmark": "list_tools_latency", "calls": calls, **summarize(list_samples)},
+        {"benchmark": "call_tool_latency", "calls": calls, **summarize(call_samples)},
+    ]
+
+
+async def bench_throughput(server: StubMcpServer, calls: int, concurrency: int) -> Dict[str, Any]:
+    """
+    Concurrent call_tool throughput over the shared pooled session.
+    """
+    async with make_client(server) as client:
+        await client.call_tool("tool_0", {"query": "warmup"})
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(index: int) -> None:
+            async with semaphore:
+                await client.call_tool(f"tool_{index % server.tool_count}", {"query": str(index)})
+
+        started = time.perf_counter()
+        await asyncio.gather(*(call(index) for index in range(calls)))
+        elapsed = time.perf_counter() - started
+    return {
+        "benchmark": "call_tool_throughput",
+        "calls": calls,
+        "concurrency": concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(calls / elapsed, 1),
+    }
+
+
+async def bench_session_init(server: StubMcpServer, calls: int) -> Dict[str, Any]:
+    """
+    Cost of the initialize handshake: one-off sessions against a pooled session.
+    """
+    metrics = InMemoryMetricsSink()
+    async with make_client(server, metrics=metrics, persistent_sessions=False) as client:
+        await client.call_tool("tool_0", {"query": "warmup"})
+        metrics.reset()
+        one_off = await sample(lambda: client.call_tool("tool_0", {"query": "bench"}), calls)
+    handshake = metrics.histogram("session.initialize.duration")
+
+    async with make_client(server) as client:
+        await client.call_tool("tool_0", {"query": "warmup"})
+        pooled = await sample(lambda: client.call_tool("tool_0", {"query": "bench"}), calls)
+
+    return {
+        "benchmark": "session_init_overhead",
+        "calls": calls,
+        "initialize_p50_ms": round((handshake.percentile(50) or 0) * 1000, 3),
+        "one_off_call_p50_ms": summarize(one_off)["p50_ms"],
+        "pooled_call_p50_ms": summarize(pooled)["p50_ms"],
+        "overhead_per_call_ms": round((statistics.median(one_off) - statistics.median(pooled)) * 1000, 3),
+    }
+
+
+async def bench_memory(server: StubMcpServer, calls: int) -> Dict[str, Any]:
+    """
+    Memory allocated and retained per call_tool, traced with tracemalloc.
+    """
+    async with make_client(server) as client:
+        await client.call_tool("tool_0", {"query": "warmup"})
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            for index in range(calls):
+                await client.call_tool("tool_0", {"query": str(index)})
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {
+        "benchmark": "call_tool_memory",
+        "calls": calls,
+        "retained_bytes_per_call": round((after - before) / calls, 1),
+        "peak_kib": round((peak - before) / 1024, 1),
+    }
+
+
+async def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    def server() -> StubMcpServer:
+        return StubMcpServer(
+            tool_count=args.tools,
+            payload_size=args.payload_size,
+            latency=args.latency,
+            sse=args.sse,
+        )
+
+    results = await bench_latency(server(), args.calls)
+    results.append(await bench_throughput(server(), args.calls * 4, args.concurrency))
+    results.append(await bench_session_init(server(), max(args.calls // 4, 1)))
+    results.append(await bench_memory(server(), args.calls))
+
+    parameters = {
+        "transport": "sse" if args.sse else "json",
+        "latency_ms": args.latency * 1000,
+        "payload_size": args.payload_size,
+        "tools": args.tools,
+    }
+    return [{**result, **parameters} for result in results]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200, help="Calls per latency measurement")
+    parser.add_argument("--concurrency", type=int, default=32, help="Calls in flight in the throughput run")
+    parser.add_argument("--latency", type=float, default=0.0, help="Stub server latency in seconds")
+    parser.add_argument("--payload-size", type=int, default=1024, help="Bytes returned by each tool call")
+    parser.add_argument("--tools", type=int, default=50, help="Number of tools served by the stub")
+    parser.add_argument("--sse", action="store_true", help="Answer with SSE streams instead of JSON")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        details = ", ".join(
+            f"{key}={value}" for key, value in result.items()
+            if key not in ("benchmark", "transport", "latency_ms", "payload_size", "tools")
+        )
+        print(f"{result['benchmark']:<24} {details}")
+
+
+if __name__ == "__main__":
+    main()
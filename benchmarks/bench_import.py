@@ -0,0 +1,102 @@
+"""
+Import Time Benchmark
+
+Measures the cold-start cost of importing the SDK, and of loading its CrewAI and
+LangChain adapters, each in a fresh interpreter: wall time, modules loaded and
+resident memory added.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+TARGETS = {
+    "base_client": "from frontegg_ai_sdk import FronteggAiClient",
+    "crewai_adapter": "from frontegg_ai_sdk.core import adapt_mcp_tool_to_crewai_tool",
+    "langchain_adapter": "from frontegg_ai_sdk.core import adapt_mcp_tool_to_langchain_tool",
+}
+
+# Run in the child interpreter; prints the measurements as JSON
+PROBE = """
+import json, resource, sys, time
+modules = len(sys.modules)
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{
+    "seconds": elapsed,
+    "modules": len(sys.modules) - modules,
+    "rss_kib": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+    "crewai_loaded": "crewai" in sys.modules,
+    "langchain_loaded": "langchain_core" in sys.modules,
+}}))
+"""
+
+
+def measure(statement: str) -> Dict[str, Any]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")]))}
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(statement=statement)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> List[Dict[str, Any]]:
+    results = []
+    for target, statement in TARGETS.items():
+        try:
+            samples = [measure(statement) for _ in range(repeat)]
+        except subprocess.CalledProcessError as error:
+            # The adapter's framework is not installed
+            results.append({"benchmark": "import_time", "target": target, "error": error.stderr.strip().splitlines()[-1]})
+            continue
+        results.append({
+            "benchmark": "import_time",
+            "target": target,
+            "median_ms": round(statistics.median(sample["seconds"] for sample in samples) * 1000, 1),
+            "modules": samples[-1]["modules"],
+            "rss_kib": samples[-1]["rss_kib"],
+            "crewai_loaded": samples[-1]["crewai_loaded"],
+            "langchain_loaded": samples[-1]["langchain_loaded"],
+            "repeat": repeat,
+        })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for result in results:
+        if "error" in result:
+            print(f"{result['target']:<18} unavailable: {result['error']}")
+            continue
+        print(
+            f"{result['target']:<18} {result['median_ms']:>8.1f} ms, {result['modules']:>5} modules, "
+            f"+{result['rss_kib'] / 1024:.1f} MiB RSS"
+        )
+
+
+if __name__ == "__main__":
+    main()
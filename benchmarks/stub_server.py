@@ -0,0 +1,266 @@
+"""
+Stub MCP Server
+
+An in-process stand-in for the Frontegg MCP endpoint and the vendor auth
+endpoint, served through `httpx.MockTransport`, so benchmarks and tests run
+offline and without network noise.
+
+It speaks enough of the Streamable HTTP transport for the client: session IDs,
+initialize, tools/list, tools/call and ping, answered as JSON or as SSE streams.
+Tests can make it fail requests, expire sessions and drop SSE streams so they
+have to be resumed with Last-Event-ID.
+"""
+
+import asyncio
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+
+SESSION_ID_HEADER = "mcp-session-id"
+LAST_EVENT_ID_HEADER = "last-event-id"
+PROTOCOL_VERSION = "2024-11-05"
+
+
+@dataclass
+class StubStats:
+    """
+    Requests served by the stub.
+    """
+    auth_requests: int = 0
+    sessions: int = 0
+    terminated_sessions: int = 0
+    posts: int = 0
+    tool_calls: int = 0
+    bytes_received: int = 0
+    bytes_sent: int = 0
+    resumptions: int = 0
+    # JSON-RPC methods of each POST, in the order they arrived
+    posted_methods: List[List[str]] = field(default_factory=list)
+
+
+@dataclass
+class StubFault:
+    """
+    Failure served instead of the next POST carrying `method`.
+    """
+    method: str
+    status: int = 503
+    headers: Dict[str, str] = field(default_factory=dict)
+    error: Optional[Exception] = None
+
+
+class _DroppedStream(httpx.AsyncByteStream):
+    """
+    SSE body that ends with a transport error after its events.
+    """
+
+    def __init__(self, content: bytes):
+        self.content = content
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.content
+        raise httpx.ReadError("Stub dropped the stream")
+
+
+class StubMcpServer:
+    """
+    Streamable HTTP MCP server stub.
+
+    Every tool echoes its arguments followed by a text payload of
+    `payload_size` bytes.
+    """
+
+    def __init__(
+        self,
+        tool_count: int = 10,
+        payload_size: int = 256,
+        latency: float = 0.0,
+        sse: bool = False,
+        tool_annotations: Optional[Dict[str, Dict[str, Any]]] = None,
+        tool_latency: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the stub.
+
+        Args:
+            tool_count: Number of tools returned by tools/list
+            payload_size: Size in bytes of the text returned by each tool call
+            latency: Seconds each request is delayed before it is answered
+            sse: Whether to answer requests with SSE streams instead of JSON
+            tool_annotations: MCP annotations of tools, by tool name (optional)
+            tool_latency: Extra seconds calls of a tool take, by tool name (optional)
+        """
+        self.tool_count = tool_count
+        self.payload_size = payload_size
+        self.latency = latency
+        self.sse = sse
+        self.tool_annotations = tool_annotations or {}
+        self.tool_latency = tool_latency or {}
+        self.stats = StubStats()
+        self._payload = "x" * payload_size
+        self._tools = [self._tool(index) for index in range(tool_count)]
+        self._faults: List[StubFault] = []
+        self._live_sessions: set = set()
+        # SSE streams to drop, and the events of dropped streams left to replay
+        self._streams_to_drop = 0
+        self._resumable = True
+        self._unsent_events: Dict[str, bytes] = {}
+        self._event_ids = itertools.count(1)
+
+    def fail(
+        self,
+        method: str,
+        count: int = 1,
+        status: int = 503,
+        headers: Optional[Dict[str, str]] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """
+        Fail the next `count` POSTs carrying `method`, with an HTTP status or by raising `error`.
+        """
+        for _ in range(count):
+            self._faults.append(StubFault(method, status, dict(headers or {}), error))
+
+    def expire_sessions(self) -> None:
+        """
+        Forget every session, so requests made on them are answered with 404.
+        """
+        self._live_sessions.clear()
+
+    def drop_sse_streams(self, count: int = 1, resumable: bool = True) -> None:
+        """
+        Drop the next `count` SSE responses to tools/call after their first event,
+        keeping the response for the client to resume with Last-Event-ID unless
+        `resumable` is False.
+        """
+        self._streams_to_drop += count
+        self._resumable = resumable
+
+    def http_client(self, **kwargs: Any) -> httpx.AsyncClient:
+        """
+        Return an HTTP client whose requests are served by the stub.
+        """
+        return httpx.AsyncClient(transport=httpx.MockTransport(self.handle), **kwargs)
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.stats.bytes_received += len(request.content)
+
+        if request.url.path.startswith("/auth/vendor"):
+            self.stats.auth_requests += 1
+            return self._json({"token": "stub-token", "expiresIn": 3600})
+        if request.method == "GET":
+            return self._resume(request)
+        if request.method == "DELETE":
+            self.stats.terminated_sessions += 1
+            self._live_sessions.discard(request.headers.get(SESSION_ID_HEADER))
+            return httpx.Response(200)
+
+        self.stats.posts += 1
+        body = json.loads(request.content)
+        messages = body if isinstance(body, list) else [body]
+        methods = [message.get("method") for message in messages if "method" in message]
+        self.stats.posted_methods.append(methods)
+
+        fault = next((fault for fault in self._faults if fault.method in methods), None)
+        if fault is not None:
+            self._faults.remove(fault)
+            if fault.error is not None:
+                raise fault.error
+            return httpx.Response(fault.status, headers=fault.headers)
+
+        session_id = request.headers.get(SESSION_ID_HEADER)
+        if "initialize" not in methods and session_id not in self._live_sessions:
+            return httpx.Response(404)
+
+        headers: Dict[str, str] = {}
+        responses = []
+        for message in messages:
+            if "id" not in message or "method" not in message:
+                continue
+            params = message.get("params") or {}
+            if message["method"] == "initialize":
+                self.stats.sessions += 1
+                headers[SESSION_ID_HEADER] = f"stub-session-{self.stats.sessions}"
+                self._live_sessions.add(headers[SESSION_ID_HEADER])
+            elif message["method"] == "tools/call":
+                await asyncio.sleep(self.tool_latency.get(params.get("name"), 0))
+            responses.append({
+                "jsonrpc": "2.0",
+                "id": message["id"],
+                "result": self._result(message["method"], params),
+            })
+
+        if not responses:
+            return httpx.Response(202)
+        if self.sse:
+            data = "".join(f"event: message\ndata: {json.dumps(response)}\n\n" for response in responses)
+            if self._streams_to_drop and "tools/call" in methods:
+                self._streams_to_drop -= 1
+                event_id = f"event-{next(self._event_ids)}"
+                if self._resumable:
+                    self._unsent_events[event_id] = data.encode()
+                return httpx.Response(
+                    200,
+                    headers={**headers, "content-type": "text/event-stream"},
+                    stream=_DroppedStream(f"id: {event_id}\ndata:\n\n".encode()),
+                )
+            return self._respond(data.encode(), "text/event-stream", headers)
+        payload = responses if isinstance(body, list) else responses[0]
+        return self._json(payload, headers)
+
+    def _resume(self, request: httpx.Request) -> httpx.Response:
+        events = self._unsent_events.pop(request.headers.get(LAST_EVENT_ID_HEADER, ""), None)
+        if events is None:
+            # No standalone server-to-client stream
+            return httpx.Response(405)
+        self.stats.resumptions += 1
+        return self._respond(events, "text/event-stream", None)
+
+    def _result(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if method == "initialize":
+            return {
+                "protocolVersion": PROTOCOL_VERSION,
+                "capabilities": {"tools": {"listChanged": True}},
+                "serverInfo": {"name": "stub", "version": "1.0.0"},
+            }
+        if method == "tools/list":
+            return {"tools": self._tools}
+        if method == "tools/call":
+            self.stats.tool_calls += 1
+            return {
+                "content": [
+                    {"type": "text", "text": json.dumps(params.get("arguments") or {})},
+                    {"type": "text", "text": self._payload},
+                ],
+                "isError": False,
+            }
+        return {}
+
+    def _json(self, payload: Any, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        return self._respond(json.dumps(payload).encode(), "application/json", headers)
+
+    def _respond(self, content: bytes, content_type: str, headers: Optional[Dict[str, str]]) -> httpx.Response:
+        self.stats.bytes_sent += len(content)
+        return httpx.Response(200, headers={**(headers or {}), "content-type": content_type}, content=content)
+
+    def _tool(self, index: int) -> Dict[str, Any]:
+        tool = {
+            "name": f"tool_{index}",
+            "description": f"Stub tool number {index}",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {"type": "string"},
+                    "limit": {"type": "integer", "default": 10},
+                },
+                "required": ["query"],
+            },
+        }
+        if tool["name"] in self.tool_annotations:
+            tool["annotations"] = self.tool_annotations[tool["name"]]
+        return tool
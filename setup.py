@@ -22,6 +22,14 @@ setup(
         'mcp',
         'crewai[tools]>=0.5.0',
         'mcpadapt>=0.1.3',
-        'nest-asyncio',
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'fast': ['orjson'],
+        'langchain': ['langchain-core'],
+        'prometheus': ['prometheus-client'],
+        'opentelemetry': ['opentelemetry-api'],
+        'redis': ['redis'],
+        'test': ['pytest', 'anyio'],
+    },
 ) 
\ No newline at end of file
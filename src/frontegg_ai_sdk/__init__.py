@@ -7,8 +7,27 @@ A Python SDK for interacting with Frontegg AI Agents.
 # Re-export components from the core package
 from .core import (
     FronteggAiClient,
+    FronteggAiClientContext,
     FronteggAiClientConfig,
     Environment,
+    CircuitState,
+    CircuitOpenError,
+    ConcurrencyLimitExceededError,
+    MetricsSink,
+    InMemoryMetricsSink,
+    PrometheusMetricsSink,
+    OpenTelemetryMetricsSink,
+    ResultCache,
+    MemoryResultCache,
+    DiskResultCache,
+    RedisResultCache,
+    BinaryContent,
+    BinaryToolResult,
+    ToolCallOutcome,
+    ToolProgress,
+    ToolContent,
+    ToolResult,
+    ToolStreamEvent,
     setup_logger
 )
 
@@ -16,7 +35,26 @@ __version__ = "1.0.0"
 
 __all__ = [
     "FronteggAiClient",
+    "FronteggAiClientContext",
     "FronteggAiClientConfig",
     "Environment",
+    "CircuitState",
+    "CircuitOpenError",
+    "ConcurrencyLimitExceededError",
+    "MetricsSink",
+    "InMemoryMetricsSink",
+    "PrometheusMetricsSink",
+    "OpenTelemetryMetricsSink",
+    "ResultCache",
+    "MemoryResultCache",
+    "DiskResultCache",
+    "RedisResultCache",
+    "BinaryContent",
+    "BinaryToolResult",
+    "ToolCallOutcome",
+    "ToolProgress",
+    "ToolContent",
+    "ToolResult",
+    "ToolStreamEvent",
     "setup_logger",
 ] 
\ No newline at end of file
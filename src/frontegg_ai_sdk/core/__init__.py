@@ -2,17 +2,75 @@
 Core functionality for the Frontegg AI SDK.
 """
 
-from .enums import Environment
+import importlib
+from typing import Any
+
+from .enums import CircuitState, Environment
 from .config import FronteggAiClientConfig
 from .logger import setup_logger, default_logger
 from .client import FronteggAiClient
+from .context import FronteggAiClientContext
 from .httpTransport import streamablehttp_client
+from .metrics import (
+    InMemoryMetricsSink,
+    MetricsSink,
+    NoopMetricsSink,
+    OpenTelemetryMetricsSink,
+    PrometheusMetricsSink,
+)
+from .result_cache import DiskResultCache, MemoryResultCache, RedisResultCache, ResultCache
+from .resilience import CircuitOpenError, ConcurrencyLimitExceededError
+from .tool_results import (
+    BinaryContent,
+    BinaryToolResult,
+    ToolCallOutcome,
+    ToolContent,
+    ToolProgress,
+    ToolResult,
+    ToolStreamEvent,
+)
 
 __all__ = [
     "Environment",
+    "CircuitState",
+    "CircuitOpenError",
+    "ConcurrencyLimitExceededError",
     "FronteggAiClientConfig",
     "FronteggAiClient",
+    "FronteggAiClientContext",
     "setup_logger",
     "default_logger",
     "streamablehttp_client",
-] 
\ No newline at end of file
+    "MetricsSink",
+    "NoopMetricsSink",
+    "InMemoryMetricsSink",
+    "PrometheusMetricsSink",
+    "OpenTelemetryMetricsSink",
+    "ResultCache",
+    "MemoryResultCache",
+    "DiskResultCache",
+    "RedisResultCache",
+    "BinaryContent",
+    "BinaryToolResult",
+    "ToolCallOutcome",
+    "ToolProgress",
+    "ToolContent",
+    "ToolResult",
+    "ToolStreamEvent",
+    "adapt_mcp_tool_to_crewai_tool",
+    "adapt_mcp_tool_to_langchain_tool",
+]
+
+# Framework adapters are imported on first access, so that importing the SDK
+# does not load CrewAI or LangChain
+_LAZY_EXPORTS = {
+    "adapt_mcp_tool_to_crewai_tool": ".crewai_tools",
+    "adapt_mcp_tool_to_langchain_tool": ".langchain_tools",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
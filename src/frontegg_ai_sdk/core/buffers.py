@@ -0,0 +1,120 @@
+"""
+Buffers Module
+
+This module provides the byte buffer decoded binary tool content is held in,
+kept in memory while small and moved to a temporary file, read back through
+mmap, once it grows past a threshold.
+"""
+
+import mmap
+import tempfile
+from typing import IO, Optional, Union
+
+# Default size above which a buffer moves to a temporary file
+DEFAULT_SPILL_THRESHOLD = 16 * 1024 * 1024
+
+
+class SpillBuffer:
+    """
+    Append-only byte buffer that spills to a temporary file.
+
+    Data is written into a single bytearray, preallocated when the final size
+    is known, so no intermediate chunks or joined copies are kept. Once the
+    size passes `spill_threshold`, the data moves to an anonymous temporary
+    file and `view()` maps it instead of holding it on the heap.
+    """
+
+    def __init__(self, spill_threshold: int = DEFAULT_SPILL_THRESHOLD, size_hint: Optional[int] = None):
+        """
+        Initialize the buffer.
+
+        Args:
+            spill_threshold: Size in bytes above which the data is kept in a temporary file
+            size_hint: Expected final size, to preallocate the memory buffer (optional)
+        """
+        self.spill_threshold = spill_threshold
+        self._size = 0
+        self._memory: Optional[bytearray] = bytearray()
+        self._file: Optional[IO[bytes]] = None
+        self._mapped: Optional[mmap.mmap] = None
+        self._view: Optional[memoryview] = None
+        if size_hint and size_hint > spill_threshold:
+            self._spill()
+        elif size_hint:
+            self._memory = bytearray(size_hint)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __enter__(self) -> "SpillBuffer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Whether the data is kept in a temporary file.
+        """
+        return self._file is not None
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """
+        Append data to the buffer.
+        """
+        if self._view is not None:
+            raise ValueError("Buffer is read-only once viewed")
+        end = self._size + len(data)
+        if self._file is None and end > self.spill_threshold:
+            self._spill()
+        if self._file is not None:
+            self._file.write(data)
+        elif end <= len(self._memory):
+            # Fills the preallocated space in place
+            self._memory[self._size:end] = data
+        else:
+            del self._memory[self._size:]
+            self._memory += data
+        self._size = end
+
+    def view(self) -> memoryview:
+        """
+        Return a read-only view of the data, and stop accepting writes.
+
+        The view is valid until the buffer is closed.
+        """
+        if self._view is None:
+            if self._file is None:
+                # Drops preallocated space the data did not fill
+                del self._memory[self._size:]
+                self._view = memoryview(self._memory).toreadonly()
+            elif self._size == 0:
+                self._view = memoryview(b"")
+            else:
+                self._file.flush()
+                self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._view = memoryview(self._mapped)
+        return self._view
+
+    def close(self) -> None:
+        """
+        Release the memory or temporary file holding the data.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._memory = bytearray()
+        self._size = 0
+
+    def _spill(self) -> None:
+        self._file = tempfile.TemporaryFile(prefix="frontegg-ai-")
+        if self._size:
+            self._file.write(memoryview(self._memory)[:self._size])
+        self._memory = None
@@ -5,249 +5,1196 @@ This module provides the main client interface for the AI Agents SDK.
 """
 
 import logging
-from typing import Any, Dict, Optional, Callable, Union, List, Type, ClassVar
+from typing import (
+    TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, Awaitable, Dict, Optional, Callable, Union, Iterator, List, Mapping,
+    Sequence, Tuple, Type, TypeVar, ClassVar
+)
 import os
 import json
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import replace
 from datetime import datetime, timedelta
 
 import mcp
 from mcp import ClientSession
 import mcp.types as types
-from .httpTransport import streamablehttp_client
+from .httpTransport import request_timeout, streamablehttp_client
+import anyio
 import httpx
-import jsonref  # Added import for jsonref
+from anyio.streams.memory import MemoryObjectSendStream
 
-from .config import FronteggAiClientConfig
-from .enums import Environment
+from .cache import TTLCache, stable_hash
+from .client_utils import is_retryable_tool_call_error, retry_async, run_alongside, tool_hint
+from .coalescing import CoalescingStats, RequestCoalescer
+from .config import ClientRetryConfiguration, FronteggAiClientConfig, TimeoutConfig
+from .context import FronteggAiClientContext
+from .enums import CircuitState, Environment
 from .logger import default_logger
-
-from mcpadapt.utils.modeling import create_model_from_json_schema
-from crewai.tools import BaseTool
-from pydantic import BaseModel
+from .loop_thread import EventLoopThread
+from .metrics import (
+    LIST_TOOLS_DURATION,
+    NOOP_METRICS,
+    SESSION_INIT_DURATION,
+    TOOL_CALL_COALESCED,
+    TOOL_CALL_DURATION,
+    TOOL_CALL_ERRORS,
+    TOOL_RESULT_CACHE_HITS,
+    TOOL_RESULT_CACHE_MISSES,
+    MetricsSink,
+    error_code,
+    guard_metrics,
+)
+from .result_cache import MemoryResultCache, ResultCache, result_cache_key
+from .resilience import AdaptiveConcurrencyLimiter, CircuitBreaker, CircuitOpenError, is_endpoint_failure
+from .session_pool import SessionPool, make_context_key
+from .tracing import get_tracer, inject_trace_context, set_attribute, start_span
+from .token_manager import TokenRefreshStats, VendorTokenManager
+from .tool_dispatcher import ToolDispatcher, ToolDispatchStats
+from .tool_results import (
+    BinaryToolResult, ToolCallOutcome, ToolContent, ToolProgress, ToolResult, ToolStreamEvent, decode_binary_content
+)
 import asyncio
-import nest_asyncio
+
+if TYPE_CHECKING:
+    # Framework integrations are imported on first use, keeping `import frontegg_ai_sdk` light
+    from crewai.tools import BaseTool
+
+T = TypeVar('T')
 
 
 class FronteggAiClient:
     """
     Client for interacting with Frontegg AI Agents.
-    Implements the singleton pattern to ensure only one instance exists.
-    """
-    _instance = None
-    _initialized = False
 
-    def __new__(cls, config: FronteggAiClientConfig, logger: Optional[logging.Logger] = None):
-        """
-        Create a new instance if none exists, otherwise return the existing instance.
-        
-        Args:
-            config: Configuration for the client
-            logger: Logger instance (optional)
-        """
-        if cls._instance is None:
-            cls._instance = super(FronteggAiClient, cls).__new__(cls)
-            cls._instance.__init__(config, logger)
-        return cls._instance
+    Each client owns its vendor token, connection pool, session pool and caches.
+    Use `for_context` to derive per-tenant and per-user contexts that share them.
+    """
 
     def __init__(
         self,
         config: FronteggAiClientConfig,
         logger: Optional[logging.Logger] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        metrics: Optional[MetricsSink] = None,
+        result_cache: Optional[ResultCache] = None,
     ):
         """
         Initialize a new Frontegg AI Agents client.
-        Will only initialize once, even if called multiple times.
 
         Args:
             config: Configuration for the client
             logger: Logger instance (optional)
+            http_client: HTTP client to send all requests through (optional).
+                A client passed in is not closed by `aclose()`; by default the
+                client creates and owns a pooled one built from `config`.
+            metrics: Sink latencies, traffic and errors are reported to (optional).
+                See `frontegg_ai_sdk.core.metrics` for the available sinks.
+            result_cache: Backend of the tool result cache (optional). Defaults to an
+                in-process cache of `result_cache_max_bytes`; see
+                `frontegg_ai_sdk.core.result_cache` for the available backends.
         """
-        if not self._initialized:
-            self.config = config
-            self.logger = logger or default_logger
-            self.vendorJwt = None
-            
-            if os.environ.get("FRONTEGG_STAGING_OVERRIDE") == "true":
-                base_domain = "stg.frontegg.com"
-            else:
-                base_domain = config.environment.value
-            
-            self.mcp_url = f"https://mcp.{base_domain}/mcp/v1"
-            self.base_url = f"https://api.{base_domain}"
-            
-            self.headers = {
-                "agent-id": config.agent_id,
-                "Authorization": f"Bearer {config.client_secret}",
-                "tenant-id": config.client_id,
-            }
-            
-            self.__class__._initialized = True
+        self.config = config
+        self.logger = logger or default_logger
+        self.metrics = metrics or NOOP_METRICS
+        # Errors of the sink are logged rather than failing requests
+        self._metrics = guard_metrics(self.metrics, self.logger)
+        self._tracer = get_tracer(config.tracing)
+        self._token_manager = VendorTokenManager(
+            self._create_vendor_jwt,
+            logger=self.logger,
+            background_refresh=config.jwt_background_refresh,
+            refresh_fraction=config.jwt_refresh_fraction,
+            metrics=self._metrics,
+        )
+
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+        # Connections and sessions are bound to the event loop that opened them, so
+        # owned HTTP clients and session pools are kept per loop the client is used from
+        self._loop_resources_lock = threading.Lock()
+        self._http_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._session_pools: Dict[asyncio.AbstractEventLoop, SessionPool] = {}
+        
+        if os.environ.get("FRONTEGG_STAGING_OVERRIDE") == "true":
+            base_domain = "stg.frontegg.com"
+        else:
+            base_domain = config.environment.value
+        
+        self.mcp_url = f"https://mcp.{base_domain}/mcp/v1"
+        self.base_url = f"https://api.{base_domain}"
+        
+        self.headers = {
+            "agent-id": config.agent_id,
+            "Authorization": f"Bearer {config.client_secret}",
+            "tenant-id": config.client_id,
+        }
+
+        self._circuit_breaker: Optional[CircuitBreaker] = None
+        if config.circuit_breaker:
+            self._circuit_breaker = CircuitBreaker(
+                failure_threshold=config.circuit_failure_threshold,
+                recovery_timeout=config.circuit_recovery_timeout,
+            )
+        self._concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+        if config.adaptive_concurrency:
+            self._concurrency_limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=config.adaptive_concurrency_initial_limit,
+                max_limit=config.adaptive_concurrency_max_limit,
+                queue_timeout=config.adaptive_concurrency_queue_timeout,
+            )
+
+        # Event loop the synchronous methods run on, started on first use
+        self._loop_thread = EventLoopThread()
+        self._tool_dispatcher = ToolDispatcher(
+            max_concurrency=config.tool_max_concurrency,
+            max_concurrency_per_tool=config.tool_max_concurrency_per_tool,
+        )
+
+        # Streams of in-flight call_tool_stream calls, keyed by progress token
+        self._progress_streams: Dict[str, MemoryObjectSendStream] = {}
+
+        self._tools_cache: TTLCache[types.ListToolsResult] = TTLCache(
+            max_entries=config.tools_cache_max_entries,
+            ttl=config.tools_cache_ttl,
+        )
+
+        # Identical concurrent calls of idempotent tools share one request
+        self._coalescer = RequestCoalescer()
+        self._result_cache = result_cache or MemoryResultCache(max_bytes=config.result_cache_max_bytes)
+        # Last listed definition of each tool, for its annotations
+        self._tool_definitions: Dict[str, types.Tool] = {}
+
+    @property
+    def vendorJwt(self) -> Optional[Dict[str, Any]]:
+        return self._token_manager.token
+
+    @property
+    def token_refresh_stats(self) -> TokenRefreshStats:
+        """
+        Refresh count, latency and failures of the vendor JWT.
+        """
+        return self._token_manager.stats
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """
+        Circuit breaker guarding the MCP endpoint, if enabled.
+        """
+        return self._circuit_breaker
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """
+        Current state of the circuit breaker; always closed when it is disabled.
+        """
+        if self._circuit_breaker is None:
+            return CircuitState.CLOSED
+        return self._circuit_breaker.state
+
+    @property
+    def concurrency_limiter(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """
+        Adaptive limit on concurrent MCP requests, if enabled.
+        """
+        return self._concurrency_limiter
+
+    @property
+    def tool_dispatch_stats(self) -> ToolDispatchStats:
+        """
+        Call counts, in-flight calls and queue wait times of synchronous tool calls.
+        """
+        return self._tool_dispatcher.stats
+
+    def tool_dispatch_stats_by_tool(self) -> Dict[str, ToolDispatchStats]:
+        """
+        Per-tool call counts, in-flight calls and queue wait times of synchronous tool calls.
+        """
+        return self._tool_dispatcher.tool_stats()
+
+    @property
+    def coalescing_stats(self) -> CoalescingStats:
+        """
+        Tool calls executed through the coalescer, and calls that joined one in flight.
+        """
+        return self._coalescer.stats
+
+    def for_context(
+        self,
+        tenant_id: str,
+        user_id: Optional[str] = None,
+        user_jwt: Optional[str] = None,
+    ) -> FronteggAiClientContext:
+        """
+        Derive a context bound to a tenant and optionally a user.
+
+        The context shares the vendor token, connection pool, pooled sessions
+        and caches of this client, but carries its own immutable headers, so
+        requests for different tenants and users can run concurrently without
+        touching `set_context`.
+
+        Args:
+            tenant_id: Tenant the requests are made for
+            user_id: Optional user the requests are made for
+            user_jwt: Optional user access token identifying the user
+
+        Returns:
+            A context exposing the tool calling methods of the client
+        """
+        headers = {
+            "agent-id": self.config.agent_id,
+            "tenant-id": tenant_id,
+        }
+        if user_id:
+            headers["user-id"] = user_id
+        if user_jwt:
+            headers["frontegg-user-access-token"] = user_jwt
+        return FronteggAiClientContext(self, headers)
 
     async def list_tools(self) -> List[types.Tool]:
         """
         List all available tools.
+
+        Results are cached per agent, tenant and user for `tools_cache_ttl` seconds,
+        and dropped early when the server reports that its tool list changed.
         
         Returns:
             List of available tools
         """
-        await self._refresh_transport_if_needed()
-        self._update_headers(self.config.client_id, None)
-        async with streamablehttp_client(f"{self.mcp_url}", self.headers) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            async with ClientSession(
-                read_stream,
-                write_stream,
-            ) as session:
-                result = await session.initialize()
-                tools = await session.list_tools()  
-                return tools
+        return await self._list_tools(self.headers)
+
+    def list_tools_sync(self) -> List[types.Tool]:
+        """
+        Synchronous version of list_tools.
+
+        Returns:
+            List of available tools
+        """
+        return self._run_sync(self.list_tools)
+
+    def list_tools_as_crewai_tools_sync(self) -> List["BaseTool"]:
+        """
+        Synchronous version of list_tools_as_crewai_tools.
+        """
+        return self._run_sync(self.list_tools_as_crewai_tools)
 
-    async def list_tools_as_crewai_tools(self) -> List[BaseTool]:
+    def invalidate_tools_cache(self) -> None:
+        """
+        Drop all cached list_tools results.
+        """
+        self._tools_cache.invalidate()
+
+    async def invalidate_result_cache(self) -> None:
+        """
+        Drop all cached call_tool results.
+        """
+        await self._result_cache.clear()
+
+    async def list_tools_as_crewai_tools(self) -> List["BaseTool"]:
         """
         List all available tools as CrewAI tools.
         """
-        tools_response = await self.list_tools()
-        if hasattr(tools_response, 'tools'):
-            return [self._adapt_mcp_tool_to_crewai_tool(tool) for tool in tools_response.tools]
-        else:
-            self.logger.error(f"Unexpected response type from list_tools: {type(tools_response)}")
-            return []
+        return self._adapt_tools(await self.list_tools(), self)
 
-    async def call_tool(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
+    async def list_tools_as_langchain_tools(self) -> List[Any]:
+        """
+        List all available tools as LangChain structured tools.
+
+        Requires the `langchain` extra.
+        """
+        from .langchain_tools import adapt_mcp_tool_to_langchain_tool
+
+        return self._adapt_tools(await self.list_tools(), self, adapt_mcp_tool_to_langchain_tool)
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> Any:
         """
         Call a tool by name.
+
+        Timeouts come from `config.tool_timeouts` for the tool, falling back to
+        `config.timeouts`. The deadline covers session setup, the request, the
+        response stream and any retries; when it passes, the call is cancelled
+        and raises `TimeoutError`.
         
         Args:
             name: Name of the tool
             arguments: Optional arguments for the tool
-            user_id: Optional user ID for the tool call
+            timeout: Optional deadline in seconds, or timeouts replacing the configured ones
             
         Returns:
             The tool result
         """
-        await self._refresh_transport_if_needed()
-        async with streamablehttp_client(f"{self.mcp_url}", self.headers) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            async with ClientSession(
-                read_stream,
-                write_stream,
-            ) as session:
-                result = await session.initialize()
-                tools = await session.call_tool(name, arguments or {})  
-                return tools
+        return await self._call_tool(self.headers, name, arguments, timeout)
+
+    async def call_tool_binary(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        threshold: Optional[int] = None,
+    ) -> BinaryToolResult:
+        """
+        Call a tool, decoding its large image and embedded blob content into buffers.
+
+        Once the result arrives, base64 content longer than `threshold`
+        characters is decoded in a worker thread, a chunk at a time, into
+        `BinaryContent` buffers that move to a temporary file once larger than
+        `config.binary_spill_threshold`. The returned result is a copy with that
+        content emptied.
+
+        Args:
+            name: Name of the tool
+            arguments: Optional arguments for the tool
+            timeout: Optional deadline in seconds, or timeouts replacing the configured ones
+            threshold: Base64 length above which content is decoded (defaults to
+                `config.binary_content_threshold`)
+
+        Returns:
+            The result and its decoded content; close it to release the buffers
+        """
+        return await self._call_tool_binary(self.headers, name, arguments, timeout, threshold)
+
+    def call_tool_binary_sync(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        threshold: Optional[int] = None,
+    ) -> BinaryToolResult:
+        """
+        Synchronous version of call_tool_binary.
+        """
+        return self._call_tool_binary_sync(dict(self.headers), name, arguments, timeout, threshold)
+
+    def call_tool_stream(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        max_buffered_events: int = 16,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> AsyncContextManager[AsyncIterator[ToolStreamEvent]]:
+        """
+        Call a tool and stream its progress and content as events.
+
+        Entering the returned context manager starts the call in a task group
+        and gives an async iterator of its events; leaving it cancels the call
+        if it is still running. The iterator yields a `ToolProgress` for each
+        progress notification the server sends while the tool runs, then a
+        `ToolContent` per item of the result, and finally a `ToolResult`
+        carrying the complete result. MCP delivers a tool result in a single
+        message, so the `ToolContent` events follow once it has fully arrived.
+        If the call fails, iterating raises its error after any progress events.
+
+        At most `max_buffered_events` events are buffered for a slow consumer;
+        progress notifications beyond that are dropped rather than stalling the
+        session.
+
+        The call is retried, and its result cached, like `call_tool`. It is never
+        coalesced with other calls, since its progress is reported to this
+        caller only.
+
+        Args:
+            name: Name of the tool
+            arguments: Optional arguments for the tool
+            max_buffered_events: Maximum number of events buffered ahead of the consumer
+            timeout: Optional deadline in seconds, or timeouts replacing the configured ones
+
+        Returns:
+            Context manager giving the stream events, ending with the final result
+        """
+        return self._call_tool_stream(self.headers, name, arguments, max_buffered_events, timeout)
 
-    def call_tool_sync(self, name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
+    async def call_tools_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[ToolCallOutcome]:
+        """
+        Call several tools concurrently over a shared session.
+
+        A failing call does not affect the others; its error is reported on
+        its outcome instead of being raised.
+
+        Args:
+            calls: Sequence of (name, arguments) pairs
+            concurrency: Maximum number of calls in flight at once
+            timeout: Optional per-call timeout in seconds
+
+        Returns:
+            One outcome per call, in the order of `calls`
+        """
+        return await self._call_tools_many(self.headers, calls, concurrency, timeout)
+
+    def call_tools_as_completed(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> AsyncContextManager[AsyncIterator[ToolCallOutcome]]:
+        """
+        Call several tools concurrently, receiving outcomes as they complete.
+
+        Entering the returned context manager starts the calls in a task group
+        and gives an async iterator of their outcomes; leaving it cancels the
+        calls still running.
+
+        Args:
+            calls: Sequence of (name, arguments) pairs
+            concurrency: Maximum number of calls in flight at once
+            timeout: Optional per-call timeout in seconds
+
+        Returns:
+            Context manager giving one outcome per call; `outcome.index` is the position in `calls`
+        """
+        return self._call_tools_as_completed(self.headers, calls, concurrency, timeout)
+
+    def call_tool_sync(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> Any:
         """
         Synchronous version of call_tool.
+
+        Runs on an event loop thread owned by the client, so sessions and
+        connections are reused across synchronous calls from any thread. At most
+        `tool_max_concurrency` calls, and `tool_max_concurrency_per_tool` calls
+        of the same tool, run at once; further callers wait in their thread.
         
         Args:
             name: Name of the tool
             arguments: Optional arguments for the tool
-            user_id: Optional user ID for the tool call
+            timeout: Optional deadline in seconds, or timeouts replacing the configured ones
             
         Returns:
             The tool result
         """
+        return self._call_tool_sync(dict(self.headers), name, arguments, timeout)
+
+    async def aclose(self) -> None:
+        """
+        Close all pooled MCP sessions, stop the background token renewal and
+        close the connection pool owned by the client.
+
+        Resources of every event loop the client was used from are closed on
+        their own loop; the event loop thread of the synchronous methods is
+        stopped afterwards.
+        """
+        current = asyncio.get_running_loop()
+        for loop in self._resource_loops():
+            if loop is not current and loop.is_running():
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._close_resources(), loop))
+        if self._loop_thread.is_running and not self._loop_thread.in_loop_thread():
+            self._loop_thread.stop()
+        await self._close_resources()
+        self._drop_loop_resources()
+
+    def close(self) -> None:
+        """
+        Synchronous version of aclose, for clients used through the synchronous methods.
+
+        Resources of event loops that are not running, other than the one
+        calling, cannot be closed and are dropped.
+        """
         try:
-            # Check if we're already in an event loop
-            if asyncio.get_event_loop().is_running():
-                nest_asyncio.apply()
-                return asyncio.get_event_loop().run_until_complete(
-                    self.call_tool(name, arguments)
-                )
-            else:
-                # If we're not in an event loop, use run_until_complete
-                loop = asyncio.get_event_loop()
-                return loop.run_until_complete(self.call_tool(name, arguments))
+            current: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
         except RuntimeError:
-            # If there's no event loop in the current thread, create one
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                return loop.run_until_complete(self.call_tool(name, arguments))
-            finally:
-                loop.close()
+            current = None
+        for loop in self._resource_loops():
+            if loop is not current and loop.is_running():
+                asyncio.run_coroutine_threadsafe(self._close_resources(), loop).result()
+        if self._loop_thread.is_running and not self._loop_thread.in_loop_thread():
+            self._loop_thread.stop()
+        self._drop_loop_resources()
+
+    def __enter__(self) -> "FronteggAiClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def _close_resources(self) -> None:
+        """
+        Close the resources bound to the running event loop.
+        """
+        await self._token_manager.aclose()
+        loop = asyncio.get_running_loop()
+        with self._loop_resources_lock:
+            pool = self._session_pools.pop(loop, None)
+            http_client = self._http_clients.pop(loop, None)
+        if pool is not None:
+            await pool.aclose()
+        if http_client is not None:
+            await http_client.aclose()
+
+    def _resource_loops(self) -> List[asyncio.AbstractEventLoop]:
+        """
+        Event loops holding resources of the client, the synchronous methods' loop included.
+        """
+        with self._loop_resources_lock:
+            loops = set(self._http_clients) | set(self._session_pools)
+        if self._loop_thread.is_running and self._loop_thread.loop is not None:
+            loops.add(self._loop_thread.loop)
+        return list(loops)
+
+    def _drop_loop_resources(self) -> None:
+        """
+        Forget the resources of loops that can no longer close them.
+        """
+        with self._loop_resources_lock:
+            for resources in (self._http_clients, self._session_pools):
+                for loop in list(resources):
+                    if loop.is_closed() or not loop.is_running():
+                        del resources[loop]
+
+    async def __aenter__(self) -> "FronteggAiClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
 
-        
     def set_context(self, tenant_id: str, user_id: Optional[str] = None) -> None:
         self._update_headers(tenant_id, user_id)
 
     def set_user_context_by_jwt(self, user_jwt: str) -> None:
         self.headers['frontegg-user-access-token'] = user_jwt
 
-    def _adapt_mcp_tool_to_crewai_tool(self, mcp_tool: types.Tool) -> BaseTool:
-        # Check if inputSchema exists, if not, create an empty model
-        if hasattr(mcp_tool, 'inputSchema') and mcp_tool.inputSchema:
-            ToolInput = create_model_from_json_schema(mcp_tool.inputSchema)
+    def _adapt_mcp_tool_to_crewai_tool(self, mcp_tool: types.Tool) -> "BaseTool":
+        from .crewai_tools import adapt_mcp_tool_to_crewai_tool
+
+        return adapt_mcp_tool_to_crewai_tool(mcp_tool, self)
+
+    async def _list_tools(self, context_headers: Mapping[str, str]) -> List[types.Tool]:
+        with start_span(self._tracer, "frontegg.list_tools") as span:
+            # Tools are listed on behalf of the vendor, keeping the user context
+            headers = await self._authorized_headers(
+                {**context_headers, "tenant-id": self.config.client_id}
+            )
+
+            use_cache = self.config.tools_cache_ttl > 0
+            cache_key = self._tools_cache_key(headers)
+            if use_cache:
+                tools = self._tools_cache.get(cache_key)
+                set_attribute(span, "frontegg.cache_hit", tools is not None)
+                if tools is not None:
+                    return tools
+
+            timeouts = self.config.timeouts
+            with self._metrics.timer(LIST_TOOLS_DURATION):
+                with anyio.fail_after(timeouts.deadline), self._request_timeouts(timeouts):
+                    tools = await retry_async(
+                        self._run_in_session, self.config.retry, headers, lambda session: session.list_tools()
+                    )
+            if use_cache:
+                self._tools_cache.set(cache_key, tools)
+            self._tool_definitions.update((tool.name, tool) for tool in getattr(tools, "tools", []))
+            return tools
+
+    def _adapt_tools(
+        self,
+        tools_response: Any,
+        caller: Any,
+        adapt: Optional[Callable[[types.Tool, Any], Any]] = None,
+    ) -> List[Any]:
+        if adapt is None:
+            from .crewai_tools import adapt_mcp_tool_to_crewai_tool as adapt
+
+        if hasattr(tools_response, 'tools'):
+            return [adapt(tool, caller) for tool in tools_response.tools]
         else:
-            raise ValueError(f"Tool {mcp_tool.name} has no input schema")
+            self.logger.error(f"Unexpected response type from list_tools: {type(tools_response)}")
+            return []
+
+    async def _call_tool(
+        self,
+        context_headers: Mapping[str, str],
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        progress_token: Optional[str] = None,
+    ) -> Any:
+        timeouts = self._resolve_timeouts(name, timeout)
+        arguments_hash = stable_hash(arguments or {})
+        cache_ttl = self._result_cache_ttl(name)
+        cache_key = result_cache_key(context_headers, name, arguments_hash) if cache_ttl > 0 else None
+        with self._measure_tool_call(name) as tags, anyio.fail_after(timeouts.deadline):
+            if cache_key is not None:
+                cached = await self._get_cached_result(name, cache_key)
+                if cached is not None:
+                    return cached
+
+            headers = await self._authorized_headers(context_headers)
+
+            async def execute() -> Any:
+                # Bounded by its own deadline, since a coalesced call outlives the caller that started it
+                with anyio.fail_after(timeouts.deadline), self._request_timeouts(timeouts):
+                    result = await retry_async(
+                        self._run_in_session,
+                        self._tool_retry_config(name),
+                        headers,
+                        lambda session: self._send_tool_call(session, name, arguments, progress_token),
+                    )
+                if cache_key is not None and not getattr(result, "isError", False):
+                    await self._cache_result(name, cache_key, result, cache_ttl)
+                return result
+
+            # Progress is reported to a single caller, so calls asking for it are never shared
+            if progress_token is None and self._is_coalescing_eligible(name):
+                key = (make_context_key(headers), name, arguments_hash)
+                if self._coalescer.in_flight(key):
+                    self._metrics.increment(TOOL_CALL_COALESCED, tags={"tool": name})
+                result = await self._coalescer.run(key, execute)
+            else:
+                result = await execute()
+            if getattr(result, "isError", False):
+                tags["outcome"] = "tool_error"
+        return result
+
+    @staticmethod
+    async def _send_tool_call(
+        session: ClientSession,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+        progress_token: Optional[str] = None,
+    ) -> types.CallToolResult:
+        if progress_token is None:
+            return await session.call_tool(name, arguments or {})
+        request = types.ClientRequest(
+            types.CallToolRequest(
+                method="tools/call",
+                params=types.CallToolRequestParams(
+                    name=name,
+                    arguments=arguments or {},
+                    _meta=types.RequestParams.Meta(progressToken=progress_token),
+                ),
+            )
+        )
+        return await session.send_request(request, types.CallToolResult)
 
-        class CrewAIMCPTool(BaseTool):
-            name: str = mcp_tool.name
-            description: str = getattr(mcp_tool, 'description', '') or ''
-            args_schema: Type[BaseModel] = ToolInput
+    @asynccontextmanager
+    async def _call_tool_stream(
+        self,
+        context_headers: Mapping[str, str],
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        max_buffered_events: int = 16,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> AsyncIterator[AsyncIterator[ToolStreamEvent]]:
+        progress_token = uuid.uuid4().hex
+        send_stream, receive_stream = anyio.create_memory_object_stream[ToolStreamEvent](
+            max_buffered_events
+        )
+        failures: List[Exception] = []
+
+        async def produce() -> None:
+            async with send_stream:
+                try:
+                    result = await self._call_tool(context_headers, name, arguments, timeout, progress_token)
+                except Exception as error:
+                    failures.append(error)
+                    return
+                finally:
+                    self._progress_streams.pop(progress_token, None)
+                for item in result.content:
+                    await send_stream.send(ToolContent(item))
+                await send_stream.send(ToolResult(result))
+
+        async def events() -> AsyncIterator[ToolStreamEvent]:
+            async for event in receive_stream:
+                yield event
+            # Surface the error that ended the stream, if any
+            if failures:
+                raise failures[0]
+
+        self._progress_streams[progress_token] = send_stream
+        try:
+            with receive_stream:
+                async with run_alongside(produce):
+                    yield events()
+        finally:
+            self._progress_streams.pop(progress_token, None)
+
+    async def _call_tools_many(
+        self,
+        context_headers: Mapping[str, str],
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[ToolCallOutcome]:
+        async with self._call_tools_as_completed(context_headers, calls, concurrency, timeout) as completed:
+            outcomes = [outcome async for outcome in completed]
+        return sorted(outcomes, key=lambda outcome: outcome.index)
+
+    @asynccontextmanager
+    async def _call_tools_as_completed(
+        self,
+        context_headers: Mapping[str, str],
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[AsyncIterator[ToolCallOutcome]]:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        # Every outcome fits, so calls never wait on a slow consumer
+        send_stream, receive_stream = anyio.create_memory_object_stream[ToolCallOutcome](len(calls))
+        failures: List[Exception] = []
 
-            def _run(self, *args: Any, **kwargs: Any) -> Any:
+        async def call_one(
+            run: Callable[[Callable[[ClientSession], Awaitable[Any]]], Awaitable[Any]],
+            semaphore: asyncio.Semaphore,
+            index: int,
+            name: str,
+            arguments: Optional[Dict[str, Any]],
+        ) -> None:
+            outcome = ToolCallOutcome(index=index, name=name, arguments=arguments or {})
+            async with semaphore:
+                started = time.perf_counter()
+                timeouts = self._resolve_timeouts(name, timeout)
                 try:
-                    client = FronteggAiClient({})
-                    name = kwargs.pop('name', self.name)
-                    arguments = kwargs
-                    
-                    return client.call_tool_sync(name, arguments)
-                except ImportError as e:
-                    # If nest_asyncio is required but not available, try to install it
-                    if "install 'nest_asyncio'" in str(e):
-                        try:
-                            import subprocess
-                            subprocess.check_call(["pip", "install", "nest_asyncio"])
-                            # Try again after installing
-                            import nest_asyncio
-                            nest_asyncio.apply()
-                            client = FronteggAiClient({})
-                            return client.call_tool_sync(self.name, kwargs)
-                        except Exception as install_err:
-                            raise RuntimeError(f"Failed to install nest_asyncio: {install_err}. {str(e)}")
-                    else:
-                        raise
-
-            def _generate_description(self):
+                    with self._measure_tool_call(name) as tags, anyio.fail_after(timeouts.deadline), \
+                            self._request_timeouts(timeouts):
+                        outcome.result = await retry_async(
+                            run, self._tool_retry_config(name), lambda session: session.call_tool(name, arguments or {})
+                        )
+                        if getattr(outcome.result, "isError", False):
+                            tags["outcome"] = "tool_error"
+                except Exception as error:
+                    outcome.error = error
+                outcome.duration = time.perf_counter() - started
+            await send_stream.send(outcome)
+
+        async def produce() -> None:
+            # The session, and the task groups of a one-off session, live in this task only
+            async with send_stream:
+                if not calls:
+                    return
                 try:
-                    args_schema = {
-                        k: v
-                        for k, v in jsonref.replace_refs(
-                            self.args_schema.model_json_schema()
-                        ).items()
-                        if k != "$defs"
-                    }
-                    self.description = f"Tool Name: {self.name}\nTool Arguments: {args_schema}\nTool Description: {self.description}"
-                except Exception as e:
-                    self.description = f"Tool Name: {self.name}\nTool Description: {self.description}"
+                    headers = await self._authorized_headers(context_headers)
+                    async with self._session_runner(headers) as run:
+                        semaphore = asyncio.Semaphore(concurrency)
+                        async with anyio.create_task_group() as tg:
+                            for index, (name, arguments) in enumerate(calls):
+                                tg.start_soon(call_one, run, semaphore, index, name, arguments)
+                except Exception as error:
+                    failures.append(error)
+
+        async def outcomes() -> AsyncIterator[ToolCallOutcome]:
+            async for outcome in receive_stream:
+                yield outcome
+            # Surface the error that ended the calls early, if any
+            if failures:
+                raise failures[0]
+
+        with receive_stream:
+            async with run_alongside(produce):
+                yield outcomes()
+
+    async def _call_tool_binary(
+        self,
+        context_headers: Mapping[str, str],
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        threshold: Optional[int] = None,
+    ) -> BinaryToolResult:
+        result = await self._call_tool(context_headers, name, arguments, timeout)
+        if threshold is None:
+            threshold = self.config.binary_content_threshold
+        # Decoded per caller, since a coalesced result is shared with other callers, and
+        # in a worker thread, so decoding and spilling to disk never block the event loop
+        return await anyio.to_thread.run_sync(
+            decode_binary_content, result, threshold, self.config.binary_spill_threshold
+        )
 
-        return CrewAIMCPTool()
+    def _call_tool_binary_sync(
+        self,
+        context_headers: Mapping[str, str],
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        threshold: Optional[int] = None,
+    ) -> BinaryToolResult:
+        return self._tool_dispatcher.run(
+            name,
+            lambda: self._run_sync(
+                lambda: self._call_tool_binary(context_headers, name, arguments, timeout, threshold)
+            ),
+        )
+
+    def _call_tool_sync(
+        self,
+        context_headers: Mapping[str, str],
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> Any:
+        return self._tool_dispatcher.run(
+            name,
+            lambda: self._run_sync(lambda: self._call_tool(context_headers, name, arguments, timeout)),
+        )
 
+    def _run_sync(self, make_coroutine: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run a coroutine on the client's event loop thread and wait for its result.
+        """
+        return self._loop_thread.run(make_coroutine)
+
+    async def _run_in_session(
+        self,
+        headers: Dict[str, Any],
+        operation: Callable[[ClientSession], Awaitable[Any]],
+    ) -> Any:
+        """
+        Run an operation on an initialized MCP session for the given headers.
+
+        Uses the session pool when persistent sessions are enabled, otherwise
+        opens a one-off session that is closed once the operation completes.
+        """
+        async with self._session_runner(headers) as run:
+            return await run(operation)
+
+    @asynccontextmanager
+    async def _session_runner(
+        self, headers: Dict[str, Any]
+    ) -> AsyncIterator[Callable[[Callable[[ClientSession], Awaitable[Any]]], Awaitable[Any]]]:
+        """
+        Yield a function that runs operations on one MCP session for `headers`.
+
+        With persistent sessions the operations go through the session pool;
+        otherwise a one-off session is opened and closed when the block exits,
+        so operations inside one block still share it.
+        """
+        pool = self._get_session_pool()
+        if pool is not None:
+            yield lambda operation: self._guarded(lambda: pool.run(headers, operation))
+            return
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.raise_if_open()
+
+        async with streamablehttp_client(
+            f"{self.mcp_url}",
+            headers,
+            http_client=self._get_http_client(),
+            **self._transport_options(),
+        ) as (
+            read_stream,
+            write_stream,
+            _,
+        ):
+            async def message_handler(message: Any) -> None:
+                if isinstance(message, types.ServerNotification):
+                    await self._handle_server_notification(headers, message)
+
+            async with ClientSession(
+                read_stream,
+                write_stream,
+                message_handler=message_handler,
+            ) as session:
+                with start_span(self._tracer, "mcp.session.initialize"), self._metrics.timer(SESSION_INIT_DURATION):
+                    await session.initialize()
+
+                async def run(operation: Callable[[ClientSession], Awaitable[Any]]) -> Any:
+                    return await self._guarded(lambda: operation(session))
+
+                yield run
+
+    async def _guarded(self, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run an operation against the MCP endpoint through the circuit breaker
+        and the adaptive concurrency limiter.
+        """
+        breaker = self._circuit_breaker
+        limiter = self._concurrency_limiter
+        if limiter is not None:
+            await limiter.acquire()
+        if breaker is not None:
+            # Checked once a slot is taken, so queued calls are shed as well
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                if limiter is not None:
+                    limiter.release(None, False)
+                raise
+
+        started = time.perf_counter()
+        deadline = anyio.current_effective_deadline()
+        latency: Optional[float] = None
+        failed = False
+        try:
+            result = await operation()
+            latency = time.perf_counter() - started
+            return result
+        except Exception as error:
+            latency = time.perf_counter() - started
+            failed = is_endpoint_failure(error)
+            raise
+        except BaseException:
+            if anyio.current_time() >= deadline:
+                # Cancelled by an expired deadline: the endpoint was too slow
+                latency = time.perf_counter() - started
+                failed = True
+            raise
+        finally:
+            if limiter is not None:
+                limiter.release(latency, failed)
+            if breaker is not None:
+                if latency is None:
+                    breaker.record_cancelled()
+                elif failed:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+
+    @contextmanager
+    def _measure_tool_call(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Trace a tool call, record its duration and count it if it fails.
+
+        Yields the tags recorded with the duration, so the outcome can be refined.
+        """
+        with start_span(self._tracer, "frontegg.call_tool", {"mcp.tool.name": name}) as span:
+            try:
+                with self._metrics.timer(TOOL_CALL_DURATION, {"tool": name}) as tags:
+                    yield tags
+            except Exception as error:
+                self._metrics.increment(TOOL_CALL_ERRORS, tags={"tool": name, "error": error_code(error)})
+                raise
+            finally:
+                set_attribute(span, "frontegg.outcome", tags.get("outcome"))
+
+    def _is_coalescing_eligible(self, name: str) -> bool:
+        """
+        Whether concurrent identical calls of a tool may share one request: the
+        tool is listed in `coalesce_tools`, or its last listed definition is
+        annotated read-only or idempotent.
+        """
+        if not self.config.coalesce_tool_calls:
+            return False
+        if name in self.config.coalesce_tools:
+            return True
+        tool = self._tool_definitions.get(name)
+        return tool_hint(tool, "readOnlyHint") or tool_hint(tool, "idempotentHint")
+
+    def _tool_retry_config(self, name: str) -> ClientRetryConfiguration:
+        """
+        Retry configuration of a tool call. Unless `retry_if` is configured, a
+        call is only repeated when the server cannot have acted on it, or when
+        the tool's last listed definition is annotated idempotent or read-only.
+        """
+        if self.config.retry.retry_if is not None:
+            return self.config.retry
+        tool = self._tool_definitions.get(name)
+        idempotent = tool_hint(tool, "idempotentHint") or tool_hint(tool, "readOnlyHint")
+        return replace(
+            self.config.retry, retry_if=lambda error: is_retryable_tool_call_error(error, idempotent)
+        )
+
+    def _result_cache_ttl(self, name: str) -> float:
+        """
+        Seconds the results of a tool are cached for: the TTL given in
+        `result_cache_tools`, else `result_cache_ttl` if its last listed
+        definition is annotated read-only; 0 means not cached.
+        """
+        if name in self.config.result_cache_tools:
+            return self.config.result_cache_tools[name]
+        if tool_hint(self._tool_definitions.get(name), "readOnlyHint"):
+            return self.config.result_cache_ttl
+        return 0
+
+    async def _get_cached_result(self, name: str, key: str) -> Optional[types.CallToolResult]:
+        """
+        Look up a cached tool result; a failing backend or undecodable entry counts as a miss.
+        """
+        result = None
+        try:
+            data = await self._result_cache.get(key)
+            if data is not None:
+                result = types.CallToolResult.model_validate_json(data)
+        except Exception as error:
+            self.logger.warning(f"Reading cached result of {name} failed: {error}")
+        self._metrics.increment(
+            TOOL_RESULT_CACHE_MISSES if result is None else TOOL_RESULT_CACHE_HITS, tags={"tool": name}
+        )
+        return result
+
+    async def _cache_result(self, name: str, key: str, result: types.CallToolResult, ttl: float) -> None:
+        try:
+            data = result.model_dump_json(by_alias=True, exclude_none=True).encode("utf-8")
+            await self._result_cache.set(key, data, ttl)
+        except Exception as error:
+            self.logger.warning(f"Caching result of {name} failed: {error}")
+
+    def _resolve_timeouts(
+        self,
+        name: Optional[str],
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> TimeoutConfig:
+        """
+        Timeouts of a call: the per-call override, else those configured for the tool,
+        else the client defaults. A number only overrides the deadline.
+        """
+        if isinstance(timeout, TimeoutConfig):
+            return timeout
+        timeouts = self.config.tool_timeouts.get(name, self.config.timeouts) if name else self.config.timeouts
+        if timeout is not None:
+            timeouts = replace(timeouts, deadline=timeout)
+        return timeouts
+
+    @contextmanager
+    def _request_timeouts(self, timeouts: TimeoutConfig) -> Iterator[None]:
+        """
+        Apply HTTP timeouts to the MCP requests sent from the current context.
+        """
+        token = request_timeout.set(timeouts.as_httpx_timeout())
+        try:
+            yield
+        finally:
+            request_timeout.reset(token)
+
+    def _transport_options(self) -> Dict[str, Any]:
+        """
+        Keyword arguments passed to every `streamablehttp_client` the client opens.
+        """
+        return {
+            "timeout": self.config.timeouts.as_httpx_timeout(),
+            "sse_read_timeout": self.config.timeouts.sse_read,
+            "batch_window": self.config.batch_window,
+            "max_batch_size": self.config.max_batch_size,
+            "max_reconnect_attempts": self.config.sse_reconnect_attempts,
+            "reconnect_delay": self.config.sse_reconnect_delay,
+            "metrics": self._metrics,
+            "tracer": self._tracer,
+        }
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Return the HTTP client of the running event loop, creating it on first use.
+
+        Connections are bound to the event loop that opened them, so the client
+        owns one connection pool per loop it is used from.
+        """
+        if not self._owns_http_client:
+            return self._http_client
+
+        loop = asyncio.get_running_loop()
+        with self._loop_resources_lock:
+            self._forget_closed_loops()
+            http_client = self._http_clients.get(loop)
+            if http_client is None or http_client.is_closed:
+                http_client = self._http_clients[loop] = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=self.config.max_connections,
+                        max_keepalive_connections=self.config.max_keepalive_connections,
+                        keepalive_expiry=self.config.keepalive_expiry,
+                    ),
+                    http2=self.config.http2,
+                    timeout=self.config.timeouts.as_httpx_timeout(),
+                    follow_redirects=True,
+                )
+            return http_client
+
+    def _get_session_pool(self) -> Optional[SessionPool]:
+        """
+        Return the session pool of the running event loop, creating it on first
+        use, or None when persistent sessions are disabled.
+        """
+        if not self.config.persistent_sessions:
+            return None
+
+        loop = asyncio.get_running_loop()
+        with self._loop_resources_lock:
+            self._forget_closed_loops()
+            pool = self._session_pools.get(loop)
+            if pool is None:
+                pool = self._session_pools[loop] = SessionPool(
+                    self.mcp_url,
+                    logger=self.logger,
+                    max_size=self.config.max_pooled_sessions,
+                    idle_timeout=self.config.session_idle_timeout,
+                    health_check_interval=self.config.session_health_check_interval,
+                    max_age=self.config.session_max_age,
+                    max_requests=self.config.session_max_requests,
+                    http_client_factory=self._get_http_client,
+                    notification_handler=self._handle_server_notification,
+                    transport_options=self._transport_options(),
+                    metrics=self._metrics,
+                    tracer=self._tracer,
+                )
+            return pool
+
+    def _forget_closed_loops(self) -> None:
+        # Resources of a closed loop can no longer be used or closed
+        for resources in (self._http_clients, self._session_pools):
+            for loop in [loop for loop in resources if loop.is_closed()]:
+                del resources[loop]
+
+    @staticmethod
+    def _tools_cache_key(headers: Dict[str, Any]) -> tuple:
+        return (
+            headers.get("agent-id"),
+            headers.get("tenant-id"),
+            headers.get("user-id"),
+            headers.get("frontegg-user-access-token"),
+        )
+
+    async def _handle_server_notification(
+        self, headers: Dict[str, Any], notification: types.ServerNotification
+    ) -> None:
+        if isinstance(notification.root, types.ToolListChangedNotification):
+            self.logger.info("Server tool list changed, invalidating cached tools")
+            # The list is the agent's, so entries cached through any session of it are stale
+            agent_id = headers.get("agent-id")
+            self._tools_cache.invalidate_where(lambda key: key[0] == agent_id)
+        elif isinstance(notification.root, types.ProgressNotification):
+            params = notification.root.params
+            stream = self._progress_streams.get(str(params.progressToken))
+            if stream is None:
+                return
+            try:
+                # Never block the session's receive loop on a slow consumer
+                stream.send_nowait(ToolProgress(
+                    progress=params.progress,
+                    total=params.total,
+                    message=getattr(params, 'message', None),
+                ))
+            except anyio.WouldBlock:
+                self.logger.debug(f"Dropping progress notification for {params.progressToken}")
+            except (anyio.ClosedResourceError, anyio.BrokenResourceError):
+                pass
 
     def _update_headers(self, tenant_id: str, user_id: Optional[str] = None) -> None:
         self.headers["tenant-id"] = tenant_id
         if user_id:
             self.headers["user-id"] = user_id
 
+    async def _authorized_headers(self, context_headers: Mapping[str, str]) -> Dict[str, Any]:
+        """
+        Build the headers of a request from context headers and the current vendor JWT.
+
+        The Authorization header is resolved per request, so a token renewed in
+        the background is picked up without mutating any shared headers.
+        """
+        await self._refresh_transport_if_needed()
+        return {**context_headers, "Authorization": f"Bearer {self.vendorJwt['token']}"}
+
     async def _refresh_transport_if_needed(self) -> None:
-        if self.vendorJwt and self.vendorJwt['expiration'] > datetime.now():
-            return
-        await self._refresh_transport()
+        if not self._token_manager.is_valid():
+            await self._refresh_transport()
 
     async def _refresh_transport(self) -> None:
         try:
             await self._refresh_vendor_jwt()
             if not self.vendorJwt:
                 raise Exception("Failed to refresh vendor JWT")
-            self.headers["Authorization"] = f"Bearer {self.vendorJwt['token']}"
         except Exception as error:
             self.logger.error("Failed to refresh transport", exc_info=error)
             raise
@@ -255,43 +1202,57 @@ class FronteggAiClient:
     async def _refresh_vendor_jwt(self) -> Dict[str, Any]:
         """
         Refresh the vendor JWT token.
+
+        Concurrent callers share a single request to the auth endpoint.
         """
-        jwt = await self._create_vendor_jwt()
-        self.vendorJwt = jwt
+        return await self._token_manager.refresh()
 
     async def _create_vendor_jwt(self) -> Dict[str, Any]:
         """
         Create a vendor JWT token for authentication.
+
+        Transient failures of the auth endpoint are retried according to
+        `config.retry`.
         
         Returns:
             Dictionary containing the token and expiration date
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/auth/vendor/",
-                    headers={
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "clientId": self.config.client_id,
-                        "secret": self.config.client_secret,
-                    },
-                )
-                
-                if response.status_code != 200:
-                    error_body = response.text
-                    raise Exception(f"Failed to create vendor JWT: {response.status_code} {response.reason_phrase} - {error_body}")
-                
-                result = response.json()
-                expiration = datetime.now() + timedelta(seconds=result["expiresIn"])
-                self.logger.info(f"Vendor JWT created: {result['token']} - Expires: {expiration}")
-                
-                return {
-                    "token": result["token"],
-                    "expiration": expiration,
-                }
-                
+            return await retry_async(self._request_vendor_jwt, self.config.retry)
         except Exception as error:
             self.logger.error("Failed to create vendor JWT", exc_info=error)
-            raise 
\ No newline at end of file
+            raise
+
+    async def _request_vendor_jwt(self) -> Dict[str, Any]:
+        client = self._get_http_client()
+        with start_span(self._tracer, "frontegg.vendor_jwt.create", client=True) as span:
+            headers = {
+                "Content-Type": "application/json",
+            }
+            inject_trace_context(self._tracer, headers)
+            response = await client.post(
+                f"{self.base_url}/auth/vendor/",
+                headers=headers,
+                json={
+                    "clientId": self.config.client_id,
+                    "secret": self.config.client_secret,
+                },
+            )
+            set_attribute(span, "http.response.status_code", response.status_code)
+        
+        if response.status_code != 200:
+            error_body = response.text
+            raise httpx.HTTPStatusError(
+                f"Failed to create vendor JWT: {response.status_code} {response.reason_phrase} - {error_body}",
+                request=response.request,
+                response=response,
+            )
+        
+        result = response.json()
+        expiration = datetime.now() + timedelta(seconds=result["expiresIn"])
+        self.logger.info(f"Vendor JWT created: {result['token']} - Expires: {expiration}")
+        
+        return {
+            "token": result["token"],
+            "expiration": expiration,
+        }
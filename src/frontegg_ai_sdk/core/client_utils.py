@@ -5,13 +5,169 @@ This module provides utility functions to support the AI Agents client.
 """
 
 import asyncio
+import random
 import time
-from typing import Any, Callable, Optional, TypeVar
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+import anyio
+import httpx
+from mcp.shared.exceptions import McpError
 
 from .config import ClientRetryConfiguration
 
 T = TypeVar('T')
 
+# HTTP statuses worth retrying besides any 5xx
+RETRYABLE_STATUS_CODES = frozenset({408, 429})
+
+# Transport errors raised before the request was sent, so the server never saw it
+PRE_SEND_TRANSPORT_ERRORS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+
+# Transport errors raised once the request may have reached the server: it
+# timed out, or the connection broke while it was sent or answered
+IN_FLIGHT_TRANSPORT_ERRORS = (
+    httpx.ReadTimeout,
+    httpx.ReadError,
+    httpx.WriteTimeout,
+    httpx.RemoteProtocolError,
+)
+
+# Transport errors worth retrying for requests that are safe to repeat
+RETRYABLE_TRANSPORT_ERRORS = PRE_SEND_TRANSPORT_ERRORS + IN_FLIGHT_TRANSPORT_ERRORS
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Default retry predicate: 408, 429, 5xx responses, connection errors,
+    read and write timeouts and broken responses.
+
+    Errors reported by the MCP transport carry the HTTP status or transport
+    error in their error data, and are classified the same way.
+
+    Args:
+        error: Error raised by an attempt
+
+    Returns:
+        True if the attempt may succeed when repeated
+    """
+    return _matches_error(error, _is_retryable_status, RETRYABLE_TRANSPORT_ERRORS)
+
+
+def is_retryable_tool_call_error(error: BaseException, idempotent: bool = False) -> bool:
+    """
+    Default retry predicate of tool calls.
+
+    A tool call may have side effects, so it is only retried when the server
+    cannot have acted on it: the request was never sent, or was rejected with
+    429. Tools annotated idempotent or read-only are retried like any request.
+
+    Args:
+        error: Error raised by an attempt
+        idempotent: Whether the tool is safe to call more than once
+
+    Returns:
+        True if the attempt may be repeated
+    """
+    if idempotent:
+        return is_retryable_error(error)
+    return _matches_error(error, lambda status: status == 429, PRE_SEND_TRANSPORT_ERRORS)
+
+
+def is_transport_error(error: BaseException, transport_errors: Tuple[Type[BaseException], ...]) -> bool:
+    """
+    Check whether an error is one of the given transport errors, raised directly
+    or reported by the MCP transport in the error data of a request.
+
+    Args:
+        error: Error raised by a call
+        transport_errors: httpx exception classes to match
+
+    Returns:
+        True if the error is one of `transport_errors`
+    """
+    return _matches_error(error, lambda status: False, transport_errors)
+
+
+def _matches_error(
+    error: BaseException,
+    is_status: Callable[[Any], bool],
+    transport_errors: Tuple[Type[BaseException], ...],
+) -> bool:
+    if isinstance(error, httpx.HTTPStatusError):
+        return is_status(error.response.status_code)
+    if isinstance(error, transport_errors):
+        return True
+    if isinstance(error, McpError):
+        data = error.error.data
+        if not isinstance(data, dict):
+            return False
+        if "status" in data:
+            return is_status(data["status"])
+        # Named after the httpx exception, so subclasses of the given errors match too
+        transport_error = getattr(httpx, str(data.get("transport_error")), None)
+        return isinstance(transport_error, type) and issubclass(transport_error, transport_errors)
+    return False
+
+
+def tool_hint(tool: Any, hint: str) -> bool:
+    """
+    Read a boolean hint, such as `readOnlyHint`, from a tool's MCP annotations.
+
+    Annotations are not modelled by every MCP release, so they may be a model
+    or a plain dict kept as an extra field.
+
+    Args:
+        tool: Tool as returned by list_tools
+        hint: Name of the annotation
+
+    Returns:
+        True if the tool declares the hint
+    """
+    annotations = getattr(tool, "annotations", None)
+    if annotations is None:
+        return False
+    if isinstance(annotations, dict):
+        return annotations.get(hint) is True
+    return getattr(annotations, hint, None) is True
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """
+    Extract the delay a server asked for with a `Retry-After` header.
+
+    Args:
+        error: Error raised by an attempt
+
+    Returns:
+        Seconds to wait, or None if the server did not say
+    """
+    value = None
+    if isinstance(error, httpx.HTTPStatusError):
+        value = error.response.headers.get("retry-after")
+    elif isinstance(error, McpError) and isinstance(error.error.data, dict):
+        value = error.error.data.get("retry_after")
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
 
 async def retry_async(
     fn: Callable[..., Any],
@@ -34,40 +190,17 @@ async def retry_async(
     Raises:
         The last exception encountered
     """
-    last_exception = None
-    max_tries = retry_config.tries
-    delay_ms = retry_config.delay_in_ms
-    retry_if = retry_config.retry_if
-    delay_fn = retry_config.delay_fn
-
-    for attempt in range(max_tries):
+    started = time.monotonic()
+    attempt = 0
+    while True:
         try:
             return await fn(*args, **kwargs)
         except Exception as e:
-            last_exception = e
-            
-            # Check if we should retry this exception
-            if retry_if and not retry_if(e):
-                raise
-            
-            # Don't retry if this was the last attempt
-            if attempt >= max_tries - 1:
+            current_delay = _next_delay(retry_config, attempt, e, started)
+            if current_delay is None:
                 raise
-            
-            # Calculate delay for this attempt
-            if delay_fn:
-                current_delay = delay_fn(attempt, delay_ms) / 1000  # Convert ms to seconds
-            else:
-                # Default exponential backoff
-                current_delay = (delay_ms * (2 ** attempt)) / 1000
-            
-            # Wait before retrying
             await asyncio.sleep(current_delay)
-    
-    # This should never be reached, but just in case
-    if last_exception:
-        raise last_exception
-    return None
+            attempt += 1
 
 
 def retry_sync(
@@ -91,37 +224,84 @@ def retry_sync(
     Raises:
         The last exception encountered
     """
-    last_exception = None
-    max_tries = retry_config.tries
-    delay_ms = retry_config.delay_in_ms
-    retry_if = retry_config.retry_if
-    delay_fn = retry_config.delay_fn
-
-    for attempt in range(max_tries):
+    started = time.monotonic()
+    attempt = 0
+    while True:
         try:
             return fn(*args, **kwargs)
         except Exception as e:
-            last_exception = e
-            
-            # Check if we should retry this exception
-            if retry_if and not retry_if(e):
+            current_delay = _next_delay(retry_config, attempt, e, started)
+            if current_delay is None:
                 raise
-            
-            # Don't retry if this was the last attempt
-            if attempt >= max_tries - 1:
-                raise
-            
-            # Calculate delay for this attempt
-            if delay_fn:
-                current_delay = delay_fn(attempt, delay_ms) / 1000  # Convert ms to seconds
-            else:
-                # Default exponential backoff
-                current_delay = (delay_ms * (2 ** attempt)) / 1000
-            
-            # Wait before retrying
             time.sleep(current_delay)
-    
-    # This should never be reached, but just in case
-    if last_exception:
-        raise last_exception
-    return None  # type: ignore 
\ No newline at end of file
+            attempt += 1
+
+
+@asynccontextmanager
+async def run_alongside(producer: Callable[[], Awaitable[None]]) -> AsyncIterator[None]:
+    """
+    Run a producer in an anyio task group while the block runs, and cancel it
+    once the block exits.
+
+    The producer reports its errors to the block instead of raising them, so
+    errors raised by the block propagate as they are rather than grouped.
+
+    Args:
+        producer: Coroutine function feeding the block, e.g. through a memory stream
+    """
+    error: Optional[Exception] = None
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(producer)
+        try:
+            yield
+        except Exception as exc:
+            error = exc
+        tg.cancel_scope.cancel()
+    if error is not None:
+        raise error
+
+
+def _is_retryable_status(status: Any) -> bool:
+    return isinstance(status, int) and (status in RETRYABLE_STATUS_CODES or 500 <= status < 600)
+
+
+def _next_delay(
+    retry_config: ClientRetryConfiguration,
+    attempt: int,
+    error: Exception,
+    started: float,
+) -> Optional[float]:
+    """
+    Return the seconds to wait before retrying after a failed attempt, or
+    None if the error has to be raised.
+    """
+    # Don't retry if this was the last attempt
+    if attempt >= retry_config.tries - 1:
+        return None
+
+    # Check if we should retry this exception
+    retry_if = retry_config.retry_if or is_retryable_error
+    if not retry_if(error):
+        return None
+
+    # Calculate delay for this attempt
+    delay_ms = retry_config.delay_in_ms
+    if retry_config.delay_fn:
+        current_delay = retry_config.delay_fn(attempt, delay_ms) / 1000  # Convert ms to seconds
+    else:
+        # Default exponential backoff
+        current_delay = min(delay_ms * (2 ** attempt), retry_config.max_delay_in_ms) / 1000
+        if retry_config.jitter:
+            current_delay *= 1 - retry_config.jitter * random.random()
+
+    if retry_config.respect_retry_after:
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            current_delay = max(current_delay, retry_after)
+
+    # Give up rather than sleep past the overall budget
+    if retry_config.deadline is not None:
+        remaining = retry_config.deadline - (time.monotonic() - started)
+        if current_delay >= remaining:
+            return None
+    return current_delay
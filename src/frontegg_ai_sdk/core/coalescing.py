@@ -0,0 +1,81 @@
+"""
+Request Coalescing Module
+
+This module lets concurrent identical tool calls share a single in-flight
+request instead of each hitting the MCP endpoint.
+"""
+
+import asyncio
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class CoalescingStats:
+    """
+    Counters describing coalesced calls.
+    """
+    executed: int = 0
+    coalesced: int = 0
+
+
+class RequestCoalescer:
+    """
+    Single-flight execution keyed by request identity.
+
+    The first caller for a key starts the operation; callers arriving with the
+    same key while it is in flight await its result instead of starting their
+    own. The operation runs in its own task, so a cancelled or timed out caller
+    does not abort it for the others. Calls are only shared within one event loop.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._stats = CoalescingStats()
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """
+        Snapshot of the counters.
+        """
+        return replace(self._stats)
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def in_flight(self, key: Hashable) -> bool:
+        """
+        Whether a call to `run` with this key, from the running loop, would join an operation in flight.
+        """
+        task = self._inflight.get(key)
+        return task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop()
+
+    async def run(self, key: Hashable, operation: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `operation`, or join the identical operation already in flight.
+
+        Args:
+            key: Identity of the request; equal keys share one execution
+            operation: Coroutine function performing the request
+
+        Returns:
+            The result of the shared execution
+        """
+        if self.in_flight(key):
+            self._stats.coalesced += 1
+            return await asyncio.shield(self._inflight[key])
+
+        task = asyncio.get_running_loop().create_task(operation())
+        self._inflight[key] = task
+        self._stats.executed += 1
+        task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Retrieved here in case every caller gave up waiting
+            task.exception()
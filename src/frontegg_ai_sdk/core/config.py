@@ -1,10 +1,119 @@
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Dict, List, Optional, Callable
+
+import httpx
+
 from .enums import Environment
 
+@dataclass
+class ClientRetryConfiguration:
+    # Total number of attempts, including the first one
+    tries: int = 3
+    # Base delay of the exponential backoff
+    delay_in_ms: float = 200
+    # Decides whether an error is retried; defaults to 408, 429, 5xx, connection errors, timeouts and
+    # broken responses, and for tool calls not annotated idempotent or read-only, to 429 and errors
+    # raised before sending
+    retry_if: Optional[Callable[[Exception], bool]] = None
+    # Computes the delay in ms from the attempt number and base delay, replacing the backoff
+    delay_fn: Optional[Callable[[int, float], float]] = None
+    # Fraction of each delay that is randomized to spread out concurrent retries
+    jitter: float = 0.2
+    max_delay_in_ms: float = 10000
+    # Wait at least as long as the server's Retry-After header asks for
+    respect_retry_after: bool = True
+    # Overall budget in seconds for all attempts and delays; None means no budget
+    deadline: Optional[float] = None
+
+@dataclass
+class TimeoutConfig:
+    # Seconds to connect, wait for response data, send the request and wait for a pooled connection
+    connect: Optional[float] = 10
+    read: Optional[float] = 30
+    write: Optional[float] = 30
+    pool: Optional[float] = 10
+    # Seconds to wait for the next event on the server-initiated SSE stream
+    sse_read: Optional[float] = 300
+    # Overall budget in seconds for a call, including session setup and retries; None means no deadline
+    deadline: Optional[float] = None
+
+    def as_httpx_timeout(self) -> httpx.Timeout:
+        """
+        HTTP timeouts of a single request, none of them longer than the deadline.
+        """
+        def capped(value: Optional[float]) -> Optional[float]:
+            if self.deadline is None:
+                return value
+            return self.deadline if value is None else min(value, self.deadline)
+
+        return httpx.Timeout(
+            connect=capped(self.connect),
+            read=capped(self.read),
+            write=capped(self.write),
+            pool=capped(self.pool),
+        )
+
 @dataclass
 class FronteggAiClientConfig:
     environment: Environment
     agent_id: str
     client_id: str
-    client_secret: str 
+    client_secret: str
+    # Keep initialized MCP sessions open and reuse them across calls
+    persistent_sessions: bool = True
+    max_pooled_sessions: int = 16
+    session_idle_timeout: float = 300
+    session_health_check_interval: float = 60
+    # Sessions are replaced, once their in-flight calls finish, after this many seconds or
+    # requests, since a session keeps per-request state until it is closed; 0 disables either limit
+    session_max_age: float = 3600
+    session_max_requests: int = 10000
+    # Connection pool shared by the MCP transport and vendor JWT requests
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30
+    http2: bool = False
+    # Renew the vendor JWT in the background once this fraction of its lifetime has passed
+    jwt_background_refresh: bool = False
+    jwt_refresh_fraction: float = 0.8
+    # Cache list_tools results per agent, tenant and user; a TTL of 0 disables the cache
+    tools_cache_ttl: float = 60
+    tools_cache_max_entries: int = 256
+    # Coalesce messages queued within batch_window seconds into one JSON-RPC batch POST
+    batch_window: float = 0
+    max_batch_size: int = 1
+    # Resume dropped SSE streams with Last-Event-ID, giving up after this many reconnections without progress
+    sse_reconnect_attempts: int = 3
+    sse_reconnect_delay: float = 1.0
+    # Synchronous tool calls (e.g. CrewAI tool runs) allowed in flight at once; 0 means no limit
+    tool_max_concurrency: int = 32
+    tool_max_concurrency_per_tool: int = 8
+    # Share one in-flight request between identical concurrent call_tool calls of tools annotated
+    # readOnlyHint or idempotentHint, or listed in coalesce_tools
+    coalesce_tool_calls: bool = False
+    coalesce_tools: List[str] = field(default_factory=list)
+    # Cache call_tool results of tools annotated readOnlyHint for result_cache_ttl seconds (0 disables), and of
+    # the tools in result_cache_tools for the TTL given there; the in-process cache holds result_cache_max_bytes
+    result_cache_ttl: float = 0
+    result_cache_tools: Dict[str, float] = field(default_factory=dict)
+    result_cache_max_bytes: int = 64 * 1024 * 1024
+    # call_tool_binary decodes base64 image and blob content longer than binary_content_threshold into
+    # BinaryContent buffers, kept in a temporary file once the decoded bytes pass binary_spill_threshold
+    binary_content_threshold: int = 64 * 1024
+    binary_spill_threshold: int = 16 * 1024 * 1024
+    # Fail fast after consecutive MCP endpoint failures, probing again after a cooldown
+    circuit_breaker: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_recovery_timeout: float = 30
+    # Adapt the number of concurrent MCP requests to observed latency and errors (AIMD)
+    adaptive_concurrency: bool = False
+    adaptive_concurrency_initial_limit: int = 32
+    adaptive_concurrency_max_limit: int = 256
+    adaptive_concurrency_queue_timeout: float = 1.0
+    # Record OpenTelemetry spans and send trace context to the server, if opentelemetry-api is installed
+    tracing: bool = True
+    # HTTP timeouts and call deadline, overridable per tool name and per call
+    timeouts: TimeoutConfig = field(default_factory=TimeoutConfig)
+    tool_timeouts: Dict[str, TimeoutConfig] = field(default_factory=dict)
+    # Retries of call_tool, list_tools and vendor JWT creation on transient failures
+    retry: ClientRetryConfiguration = field(default_factory=ClientRetryConfiguration)
@@ -0,0 +1,188 @@
+"""
+Client Context Module
+
+This module provides lightweight per-request views of a client, bound to a
+single tenant and user.
+"""
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, AsyncContextManager, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import mcp.types as types
+
+from .config import TimeoutConfig
+from .tool_results import BinaryToolResult, ToolCallOutcome, ToolStreamEvent
+
+if TYPE_CHECKING:
+    from crewai.tools import BaseTool
+    from .client import FronteggAiClient
+
+
+class FronteggAiClientContext:
+    """
+    A tenant and user context derived from a client with `for_context`.
+
+    A context shares the vendor token, connection pool, pooled sessions and
+    caches of the client it was derived from, but its headers are immutable,
+    so contexts for different tenants and users can be used concurrently.
+    """
+
+    def __init__(self, client: "FronteggAiClient", headers: Mapping[str, str]):
+        """
+        Initialize a context. Use `FronteggAiClient.for_context` instead of
+        calling this directly.
+
+        Args:
+            client: Client the context shares its resources with
+            headers: Context headers sent with every request
+        """
+        self._client = client
+        self._headers = MappingProxyType(dict(headers))
+
+    @property
+    def client(self) -> "FronteggAiClient":
+        return self._client
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        return self._headers
+
+    @property
+    def tenant_id(self) -> Optional[str]:
+        return self._headers.get("tenant-id")
+
+    @property
+    def user_id(self) -> Optional[str]:
+        return self._headers.get("user-id")
+
+    def __repr__(self) -> str:
+        return f"FronteggAiClientContext(tenant_id={self.tenant_id!r}, user_id={self.user_id!r})"
+
+    async def list_tools(self) -> List[types.Tool]:
+        """
+        List all available tools for this context.
+
+        Returns:
+            List of available tools
+        """
+        return await self._client._list_tools(self._headers)
+
+    def list_tools_sync(self) -> List[types.Tool]:
+        """
+        Synchronous version of list_tools.
+        """
+        return self._client._run_sync(self.list_tools)
+
+    async def list_tools_as_crewai_tools(self) -> List["BaseTool"]:
+        """
+        List all available tools as CrewAI tools that call back through this context.
+        """
+        return self._client._adapt_tools(await self.list_tools(), self)
+
+    async def list_tools_as_langchain_tools(self) -> List[Any]:
+        """
+        List all available tools as LangChain tools that call back through this context.
+        """
+        from .langchain_tools import adapt_mcp_tool_to_langchain_tool
+
+        return self._client._adapt_tools(await self.list_tools(), self, adapt_mcp_tool_to_langchain_tool)
+
+    async def call_tool(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> Any:
+        """
+        Call a tool by name within this context.
+
+        Args:
+            name: Name of the tool
+            arguments: Optional arguments for the tool
+            timeout: Optional deadline in seconds, or timeouts replacing the configured ones
+
+        Returns:
+            The tool result
+        """
+        return await self._client._call_tool(self._headers, name, arguments, timeout)
+
+    async def call_tool_binary(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        threshold: Optional[int] = None,
+    ) -> BinaryToolResult:
+        """
+        Call a tool within this context, decoding its large binary content into buffers.
+        See `FronteggAiClient.call_tool_binary`.
+        """
+        return await self._client._call_tool_binary(self._headers, name, arguments, timeout, threshold)
+
+    def call_tool_binary_sync(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+        threshold: Optional[int] = None,
+    ) -> BinaryToolResult:
+        """
+        Synchronous version of call_tool_binary.
+        """
+        return self._client._call_tool_binary_sync(self._headers, name, arguments, timeout, threshold)
+
+    def call_tool_stream(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        max_buffered_events: int = 16,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> AsyncContextManager[AsyncIterator[ToolStreamEvent]]:
+        """
+        Call a tool within this context and stream its events.
+        See `FronteggAiClient.call_tool_stream`.
+        """
+        return self._client._call_tool_stream(self._headers, name, arguments, max_buffered_events, timeout)
+
+    async def call_tools_many(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> List[ToolCallOutcome]:
+        """
+        Call several tools concurrently within this context.
+        See `FronteggAiClient.call_tools_many`.
+        """
+        return await self._client._call_tools_many(self._headers, calls, concurrency, timeout)
+
+    def call_tools_as_completed(
+        self,
+        calls: Sequence[Tuple[str, Optional[Dict[str, Any]]]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> AsyncContextManager[AsyncIterator[ToolCallOutcome]]:
+        """
+        Call several tools concurrently within this context, receiving outcomes as they complete.
+        See `FronteggAiClient.call_tools_as_completed`.
+        """
+        return self._client._call_tools_as_completed(self._headers, calls, concurrency, timeout)
+
+    def call_tool_sync(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]] = None,
+        timeout: Optional[Union[float, TimeoutConfig]] = None,
+    ) -> Any:
+        """
+        Synchronous version of call_tool.
+
+        Args:
+            name: Name of the tool
+            arguments: Optional arguments for the tool
+            timeout: Optional deadline in seconds, or timeouts replacing the configured ones
+
+        Returns:
+            The tool result
+        """
+        return self._client._call_tool_sync(self._headers, name, arguments, timeout)
@@ -0,0 +1,145 @@
+"""
+CrewAI Tools Module
+
+This module adapts MCP tools to CrewAI tools. Generated input models, tool
+classes and tool descriptions are memoized, so listing an unchanged toolset
+does not rebuild them.
+"""
+
+import threading
+from typing import Any, Tuple, Type
+
+import mcp.types as types
+from crewai.tools import BaseTool
+from pydantic import BaseModel, PrivateAttr
+
+from .cache import TTLCache, stable_hash
+from .tool_models import clear_model_cache, input_model, resolved_args_schema
+
+# Upper bound on memoized tool classes and descriptions
+MAX_CACHED_TOOL_CLASSES = 1024
+
+_tool_classes: TTLCache[Type[BaseTool]] = TTLCache(max_entries=MAX_CACHED_TOOL_CLASSES)
+_descriptions: TTLCache[str] = TTLCache(max_entries=MAX_CACHED_TOOL_CLASSES)
+_lock = threading.Lock()
+
+
+def clear_adaptation_cache() -> None:
+    """
+    Drop all memoized input models, tool classes and descriptions.
+    """
+    clear_model_cache()
+    with _lock:
+        _tool_classes.invalidate()
+        _descriptions.invalidate()
+
+
+def describe_tool(
+    name: str,
+    description: str,
+    schema_hash: str,
+    args_schema: Type[BaseModel],
+) -> str:
+    """
+    Build the CrewAI description of a tool, memoized per name, schema and description.
+
+    Args:
+        name: Tool name
+        description: Tool description reported by the server
+        schema_hash: Hash of the MCP input schema
+        args_schema: Pydantic input model
+
+    Returns:
+        Description listing the tool name, resolved arguments and description
+    """
+    key = (name, schema_hash, description)
+    with _lock:
+        cached = _descriptions.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        args = resolved_args_schema(schema_hash, args_schema)
+        cached = f"Tool Name: {name}\nTool Arguments: {args}\nTool Description: {description}"
+    except Exception:
+        cached = f"Tool Name: {name}\nTool Description: {description}"
+    with _lock:
+        _descriptions.set(key, cached)
+    return cached
+
+
+def adapt_mcp_tool_to_crewai_tool(mcp_tool: types.Tool, client: Any = None) -> BaseTool:
+    """
+    Adapt an MCP tool to a CrewAI tool.
+
+    Tool classes are shared between clients, so the client is bound to each
+    tool instance rather than to its class.
+
+    Args:
+        mcp_tool: Tool returned by list_tools
+        client: Client or client context the tool calls through (optional)
+
+    Returns:
+        CrewAI tool that calls the MCP tool through the client
+    """
+    if not (hasattr(mcp_tool, 'inputSchema') and mcp_tool.inputSchema):
+        raise ValueError(f"Tool {mcp_tool.name} has no input schema")
+
+    tool = _get_tool_class(mcp_tool)()
+    tool._client = client
+    return tool
+
+
+def _get_tool_class(mcp_tool: types.Tool) -> Type[BaseTool]:
+    schema_hash = stable_hash(mcp_tool.inputSchema)
+    description = getattr(mcp_tool, 'description', '') or ''
+    class_key: Tuple[str, str, str] = (mcp_tool.name, schema_hash, description)
+
+    with _lock:
+        tool_class = _tool_classes.get(class_key)
+        if tool_class is not None:
+            return tool_class
+
+        ToolInput = input_model(mcp_tool.inputSchema, schema_hash)
+        tool_class = _build_tool_class(mcp_tool.name, description, schema_hash, ToolInput)
+        _tool_classes.set(class_key, tool_class)
+        return tool_class
+
+
+def _build_tool_class(
+    tool_name: str,
+    tool_description: str,
+    schema_hash: str,
+    ToolInput: Type[BaseModel],
+) -> Type[BaseTool]:
+
+    class CrewAIMCPTool(BaseTool):
+        name: str = tool_name
+        description: str = tool_description
+        args_schema: Type[BaseModel] = ToolInput
+        _client: Any = PrivateAttr(default=None)
+
+        def _run(self, *args: Any, **kwargs: Any) -> Any:
+            client = self._client
+            if client is None:
+                raise RuntimeError(f"Tool {self.name} is not bound to a FronteggAiClient")
+
+            name = kwargs.pop('name', self.name)
+            return client.call_tool_sync(name, kwargs)
+
+        async def _arun(self, *args: Any, **kwargs: Any) -> Any:
+            # Awaited on the caller's loop, straight through the pooled async session
+            client = self._client
+            if client is None:
+                raise RuntimeError(f"Tool {self.name} is not bound to a FronteggAiClient")
+
+            name = kwargs.pop('name', self.name)
+            return await client.call_tool(name, kwargs)
+
+        def _generate_description(self):
+            # Resolved on the first instance and reused by every later one
+            self.description = describe_tool(
+                self.name, self.description, schema_hash, self.args_schema
+            )
+
+    return CrewAIMCPTool
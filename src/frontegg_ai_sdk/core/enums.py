@@ -5,4 +5,9 @@ class Environment(enum.Enum):
     US = 'us.frontegg.com'
     CA = 'ca.frontegg.com'
     AU = 'au.frontegg.com'
-    UK = 'uk.frontegg.com' 
\ No newline at end of file
+    UK = 'uk.frontegg.com' 
+
+class CircuitState(enum.Enum):
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
@@ -8,23 +8,53 @@ and session management.
 
 import logging
 import json
+import re
+import time
 from contextlib import asynccontextmanager
-from typing import Any
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
 
 import anyio
 import httpx
-from httpx_sse import EventSource, aconnect_sse
+from httpx_sse import EventSource
 
 from mcp.client.session import ClientSession
 
 from mcp.types import (
+    INTERNAL_ERROR,
     ErrorData,
     JSONRPCError,
     JSONRPCMessage,
     JSONRPCNotification,
     JSONRPCRequest,
+    JSONRPCResponse,
 )
 
+from .metrics import (
+    HTTP_BYTES_RECEIVED,
+    HTTP_BYTES_SENT,
+    HTTP_ERRORS,
+    HTTP_REQUEST_DURATION,
+    SSE_EVENTS,
+    MetricsSink,
+    error_code,
+    guard_metrics,
+)
+from .tracing import (
+    add_event,
+    current_context,
+    inject_trace_context,
+    root_context,
+    set_attribute,
+    start_span,
+)
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the `fast` extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Header names
@@ -35,19 +65,208 @@ LAST_EVENT_ID_HEADER = "last-event-id"
 CONTENT_TYPE_JSON = "application/json"
 CONTENT_TYPE_SSE = "text/event-stream"
 
+# HTTP timeout of requests sent from the current context, overriding the transport's
+request_timeout: ContextVar[httpx.Timeout | None] = ContextVar("request_timeout", default=None)
+
+# Bytes of a payload included in debug logs
+_LOG_PREVIEW_SIZE = 1024
+# Largest response buffer allocated up front from Content-Length; larger bodies grow it as they arrive
+_MAX_BODY_PREALLOCATION = 64 * 1024 * 1024
+
+_LEADING_WHITESPACE_BYTES = re.compile(rb"[ \t\r\n]*")
+_LEADING_WHITESPACE_STR = re.compile(r"[ \t\r\n]*")
+
+
+def _json_loads(data: bytes | bytearray | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _is_json_array(data: bytes | bytearray | str) -> bool:
+    """
+    Check whether a JSON payload is an array from its first non-whitespace character,
+    without copying or parsing the payload.
+    """
+    if isinstance(data, str):
+        start = _LEADING_WHITESPACE_STR.match(data).end()
+        return data[start:start + 1] == "["
+    start = _LEADING_WHITESPACE_BYTES.match(data).end()
+    return data[start:start + 1] == b"["
+
+
+def _preview(data: bytes | bytearray | str) -> str:
+    """
+    Describe a payload for debug logs, truncating large ones instead of copying them whole.
+    """
+    head = data[:_LOG_PREVIEW_SIZE]
+    preview = repr(head if isinstance(head, str) else bytes(head))
+    if len(data) > _LOG_PREVIEW_SIZE:
+        preview += f"... ({len(data)} bytes)"
+    return preview
+
+
+async def _read_body(response: httpx.Response) -> bytearray:
+    """
+    Stream a response body into one buffer, preallocated from Content-Length.
+
+    Unlike `response.aread()`, the received chunks are not kept alongside a
+    joined copy, so a large body is held in memory once.
+    """
+    length = response.headers.get("content-length")
+    body = bytearray(min(int(length), _MAX_BODY_PREALLOCATION) if length and length.isdigit() else 0)
+    size = 0
+    async for chunk in response.aiter_bytes():
+        end = size + len(chunk)
+        if end <= len(body):
+            body[size:end] = chunk
+        else:
+            # Longer than preallocated, e.g. a compressed body
+            del body[size:]
+            body += chunk
+        size = end
+    del body[size:]
+    return body
+
+
+def _transport_error_data(exc: Exception) -> dict[str, Any] | None:
+    """
+    Describe a failed HTTP exchange in the error reported for a request,
+    so callers can tell transient failures from permanent ones.
+    """
+    if isinstance(exc, httpx.HTTPStatusError):
+        data: dict[str, Any] = {"status": exc.response.status_code}
+        retry_after = exc.response.headers.get("retry-after")
+        if retry_after:
+            data["retry_after"] = retry_after
+        return data
+    if isinstance(exc, httpx.TransportError):
+        return {"transport_error": type(exc).__name__}
+    return None
+
+
+@dataclass
+class _SSECursor:
+    """
+    Position in an SSE stream, used to resume it after a disconnect.
+    """
+    last_event_id: str | None = None
+    # Reconnection delay requested by the server with the SSE `retry` field
+    retry_delay: float | None = None
+
+
+def _with_read_timeout(timeout: float | httpx.Timeout, read: float | None) -> httpx.Timeout:
+    if isinstance(timeout, httpx.Timeout):
+        return httpx.Timeout(connect=timeout.connect, read=read, write=timeout.write, pool=timeout.pool)
+    return httpx.Timeout(timeout, read=read)
+
+
+@dataclass
+class _RequestScope:
+    """
+    Options of a request, captured in the task that sent it.
+    """
+    timeout: httpx.Timeout | None = None
+    trace_context: Any = None
+
+
+class _RequestTaggingSendStream:
+    """
+    Write stream handed to the session.
+
+    Requests are posted by the transport's writer task, so the `request_timeout`
+    and trace context of the task sending a request are recorded here, keyed by
+    request ID.
+    """
+
+    def __init__(self, stream: Any, scopes: dict[Any, _RequestScope], tracer: Any = None):
+        self._stream = stream
+        self._scopes = scopes
+        self._tracer = tracer
+
+    async def send(self, message: JSONRPCMessage) -> None:
+        if isinstance(message.root, JSONRPCRequest):
+            timeout = request_timeout.get()
+            trace_context = current_context(self._tracer)
+            if timeout is not None or trace_context is not None:
+                self._scopes[message.root.id] = _RequestScope(timeout, trace_context)
+        await self._stream.send(message)
+
+    async def __aenter__(self) -> "_RequestTaggingSendStream":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self._stream.aclose()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+@asynccontextmanager
+async def _client_scope(
+    http_client: httpx.AsyncClient | None,
+    headers: dict[str, Any],
+    timeout: float | httpx.Timeout,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Yield the shared HTTP client, or a private one closed on exit.
+    """
+    if http_client is not None:
+        yield http_client
+        return
+
+    async with httpx.AsyncClient(
+        headers=headers, timeout=timeout, follow_redirects=True
+    ) as client:
+        yield client
+
 
 @asynccontextmanager
 async def streamablehttp_client(
     url: str,
     headers: dict[str, Any] | None = None,
-    timeout: float = 30,
-    sse_read_timeout: float = 60 * 5,
+    timeout: float | httpx.Timeout = 30,
+    sse_read_timeout: float | None = 60 * 5,
+    http_client: httpx.AsyncClient | None = None,
+    batch_window: float = 0,
+    max_batch_size: int = 1,
+    max_reconnect_attempts: int = 3,
+    reconnect_delay: float = 1.0,
+    metrics: MetricsSink | None = None,
+    tracer: Any = None,
 ):
     """
     Client transport for StreamableHTTP.
 
     `sse_read_timeout` determines how long (in seconds) the client will wait for a new
-    event before disconnecting. All other HTTP operations are controlled by `timeout`.
+    event before disconnecting. All other HTTP operations are controlled by `timeout`,
+    which a request overrides when it is sent with `request_timeout` set.
+
+    When `http_client` is given, requests go through its connection pool and the
+    client is left open on exit; otherwise a private client is created and closed.
+
+    With `max_batch_size` > 1 and a positive `batch_window` (in seconds), messages
+    queued within the window are coalesced into a single JSON-RPC batch POST.
+    Array responses are always fanned out message by message.
+
+    The ID of the last event received on each SSE stream is tracked. When a stream
+    drops, or closes before the responses it carries, it is resumed with a GET
+    request sending `Last-Event-ID`, so the server can replay the missed events
+    instead of the request failing. Up to `max_reconnect_attempts` reconnections
+    without new events are made, waiting `reconnect_delay` seconds (doubling after
+    each attempt) or the delay the server asked for with the SSE `retry` field.
+
+    Request durations, bytes sent and received, SSE events and failed requests
+    are reported to `metrics`, if given. With a `tracer` (see `tracing.get_tracer`),
+    each HTTP request gets a span, parented to the span that sent its JSON-RPC
+    request, SSE events are recorded on it and its trace context is sent to the
+    server in the `traceparent` header.
 
     Yields:
         Tuple of (read_stream, write_stream, terminate_callback)
@@ -59,6 +278,102 @@ async def streamablehttp_client(
     write_stream, write_stream_reader = anyio.create_memory_object_stream[
         JSONRPCMessage
     ](0)
+    metrics = guard_metrics(metrics)
+    # Timeout overrides and trace contexts of requests not posted yet, keyed by request ID
+    request_scopes: dict[Any, _RequestScope] = {}
+
+    def pop_request_scope(messages: list[JSONRPCMessage]) -> _RequestScope:
+        scopes = [
+            request_scopes.pop(message.root.id)
+            for message in messages
+            if isinstance(message.root, JSONRPCRequest) and message.root.id in request_scopes
+        ]
+        return _RequestScope(
+            timeout=next((scope.timeout for scope in scopes if scope.timeout is not None), None),
+            trace_context=next(
+                (scope.trace_context for scope in scopes if scope.trace_context is not None), None
+            ),
+        )
+
+    async def forward_message(message: JSONRPCMessage, pending: set[Any] | None) -> None:
+        """
+        Send a message to the read stream, marking the request it answers as resolved.
+        """
+        if pending is not None and isinstance(message.root, (JSONRPCResponse, JSONRPCError)):
+            pending.discard(message.root.id)
+        await read_stream_writer.send(message)
+
+    async def forward_batch(items: list[Any], source: str, pending: set[Any] | None) -> None:
+        """
+        Send every message of a JSON-RPC batch response to the read stream.
+        """
+        if not items:
+            logger.error(f"Empty {source} batch")
+            await read_stream_writer.send(ValueError(f"Empty {source} batch"))
+            return
+
+        for item in items:
+            if isinstance(item, dict):
+                await forward_message(JSONRPCMessage.model_validate(item), pending)
+            else:
+                logger.error(f"Invalid {source} batch item: {item}")
+                await read_stream_writer.send(
+                    ValueError(f"Invalid {source} batch item: {item}")
+                )
+
+    async def forward_payload(
+        data: bytes | bytearray | str, source: str, pending: set[Any] | None = None
+    ) -> None:
+        """
+        Decode a JSON-RPC payload and send its message(s) to the read stream.
+
+        The payload is parsed once: single messages are validated straight from
+        the raw data, batches are decoded (with orjson when available) and fanned out.
+        Requests answered by the payload are removed from `pending`.
+        """
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Received {source} payload: {_preview(data)}")
+
+        if _is_json_array(data):
+            await forward_batch(_json_loads(data), source, pending)
+        else:
+            await forward_message(JSONRPCMessage.model_validate_json(data), pending)
+
+    async def forward_events(
+        event_source: EventSource,
+        source: str,
+        cursor: _SSECursor,
+        pending: set[Any] | None = None,
+        until_resolved: bool = False,
+    ) -> None:
+        """
+        Forward the messages of an SSE stream, tracking its position in `cursor`.
+
+        With `until_resolved`, stop once every pending request has been answered.
+        """
+        async for sse in event_source.aiter_sse():
+            metrics.increment(SSE_EVENTS, tags={"source": source})
+            add_event(tracer, "sse.event", {"sse.id": sse.id or None, "sse.event": sse.event})
+            if sse.id:
+                cursor.last_event_id = sse.id
+            if sse.retry is not None:
+                cursor.retry_delay = sse.retry / 1000
+            if sse.event != "message":
+                logger.warning(f"Unknown SSE event from {source}: {sse.event}")
+            elif sse.data:
+                # Events without data only mark a position to resume from
+                try:
+                    await forward_payload(sse.data, source, pending)
+                except Exception as exc:
+                    logger.exception(f"Error parsing {source} message")
+                    await read_stream_writer.send(exc)
+            if until_resolved and not pending:
+                return
+
+    def reconnect_wait(cursor: _SSECursor, attempt: int) -> float:
+        if cursor.retry_delay is not None:
+            return cursor.retry_delay
+        return reconnect_delay * 2**attempt
 
     async with anyio.create_task_group() as tg:
         try:
@@ -72,188 +387,364 @@ async def streamablehttp_client(
 
             # Track session ID if provided by server
             session_id: str | None = None
+            batching = max_batch_size > 1 and batch_window > 0
+
+            async with _client_scope(http_client, request_headers, timeout) as client:
+
+                @asynccontextmanager
+                async def http_stream(
+                    method: str,
+                    headers: dict[str, Any],
+                    rpc_method: str | None = None,
+                    trace_context: Any = None,
+                    **kwargs: Any,
+                ) -> AsyncIterator[httpx.Response]:
+                    """
+                    Stream a request to the endpoint, recording its duration and traffic.
 
-            async with httpx.AsyncClient(
-                headers=request_headers, timeout=timeout, follow_redirects=True
-            ) as client:
+                    The request's span is started in `trace_context`; without one it
+                    starts a new trace rather than joining whichever span opened the session.
+                    """
+                    content = kwargs.get("content")
+                    if content:
+                        metrics.increment(HTTP_BYTES_SENT, len(content), {"method": method})
+                    tags: dict[str, Any] = {"method": method}
+                    started = time.perf_counter()
+                    response: httpx.Response | None = None
+                    with start_span(
+                        tracer,
+                        f"MCP {method}",
+                        {"http.request.method": method, "url.full": url, "rpc.method": rpc_method},
+                        client=True,
+                        parent=trace_context if trace_context is not None else root_context(tracer),
+                    ) as span:
+                        inject_trace_context(tracer, headers)
+                        try:
+                            async with client.stream(method, url, headers=headers, **kwargs) as response:
+                                set_attribute(span, "http.response.status_code", response.status_code)
+                                yield response
+                        finally:
+                            if response is not None:
+                                tags["status"] = response.status_code
+                                metrics.increment(
+                                    HTTP_BYTES_RECEIVED, response.num_bytes_downloaded, {"method": method}
+                                )
+                            metrics.observe(HTTP_REQUEST_DURATION, time.perf_counter() - started, tags)
 
-                async def post_writer():
-                    nonlocal session_id
-                    try:
-                        async with write_stream_reader:
-                            async for message in write_stream_reader:
-                                # Add session ID to headers if we have one
-                                post_headers = request_headers.copy()
-                                if session_id:
-                                    post_headers[MCP_SESSION_ID_HEADER] = session_id
+                def sse_headers(headers: dict[str, Any]) -> dict[str, Any]:
+                    return {**headers, "Accept": CONTENT_TYPE_SSE, "Cache-Control": "no-store"}
 
-                                logger.debug(f"Sending client message: {message}")
+                async def resume_stream(
+                    cursor: _SSECursor,
+                    pending: set[Any],
+                    scope: _RequestScope,
+                    error: Exception | None,
+                ) -> None:
+                    """
+                    Resume a POST's SSE stream after its last event until every
+                    pending request is answered, raising once the reconnect budget
+                    is spent.
+                    """
+                    attempts = 0
+                    while pending:
+                        if attempts >= max_reconnect_attempts or not session_id:
+                            raise error or httpx.ReadError(
+                                "SSE stream closed before all responses were received"
+                            )
+                        await anyio.sleep(reconnect_wait(cursor, attempts))
+                        attempts += 1
+                        resumed_from = cursor.last_event_id
+                        logger.info(
+                            f"Resuming SSE stream after event {resumed_from} "
+                            f"(attempt {attempts}/{max_reconnect_attempts})"
+                        )
 
-                                # Handle initial initialization request
-                                is_initialization = (
-                                    isinstance(message.root, JSONRPCRequest)
-                                    and message.root.method == "initialize"
+                        resume_headers = request_headers.copy()
+                        resume_headers[MCP_SESSION_ID_HEADER] = session_id
+                        resume_headers[LAST_EVENT_ID_HEADER] = resumed_from
+                        try:
+                            async with http_stream(
+                                "GET",
+                                sse_headers(resume_headers),
+                                rpc_method="resume",
+                                trace_context=scope.trace_context,
+                                timeout=scope.timeout or timeout,
+                            ) as response:
+                                response.raise_for_status()
+                                await forward_events(
+                                    EventSource(response), "resumed SSE", cursor, pending, until_resolved=True
                                 )
-                                if (
-                                    isinstance(message.root, JSONRPCNotification)
-                                    and message.root.method
-                                    == "notifications/initialized"
-                                ):
-                                    tg.start_soon(get_stream)
-
-                                async with client.stream(
+                        except httpx.HTTPStatusError as exc:
+                            if exc.response.status_code < 500:
+                                # The server cannot resume this stream
+                                raise
+                            error = exc
+                        except httpx.TransportError as exc:
+                            error = exc
+
+                        if cursor.last_event_id != resumed_from:
+                            # Progress was made, so the budget starts over
+                            attempts = 0
+
+                async def send_message(
+                    messages: list[JSONRPCMessage],
+                    pending: set[Any],
+                    delivered: anyio.Event | None = None,
+                ) -> None:
+                    nonlocal session_id
+                    # Add session ID to headers if we have one
+                    post_headers = request_headers.copy()
+                    if session_id:
+                        post_headers[MCP_SESSION_ID_HEADER] = session_id
+
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Sending client messages: {messages}")
+
+                    # Handle initial initialization request
+                    is_initialization = (
+                        len(messages) == 1
+                        and isinstance(messages[0].root, JSONRPCRequest)
+                        and messages[0].root.method == "initialize"
+                    )
+                    if any(
+                        isinstance(message.root, JSONRPCNotification)
+                        and message.root.method
+                        == "notifications/initialized"
+                        for message in messages
+                    ):
+                        tg.start_soon(get_stream)
+
+                    payload = [
+                        message.model_dump(
+                            by_alias=True, mode="json", exclude_none=True
+                        )
+                        for message in messages
+                    ]
+                    body = _json_dumps(payload[0] if len(payload) == 1 else payload)
+                    scope = pop_request_scope(messages)
+                    timeout_for_post = scope.timeout or timeout
+                    rpc_method = ",".join(
+                        message.root.method
+                        for message in messages
+                        if isinstance(message.root, (JSONRPCRequest, JSONRPCNotification))
+                    ) or None
+
+                    async def trace(event: str, info: dict[str, Any]) -> None:
+                        if delivered is not None and event.endswith("send_request_body.complete"):
+                            delivered.set()
+
+                    async with http_stream(
+                        "POST",
+                        post_headers,
+                        rpc_method=rpc_method,
+                        trace_context=scope.trace_context,
+                        content=body,
+                        timeout=timeout_for_post,
+                        extensions={"trace": trace},
+                    ) as response:
+                        if delivered is not None:
+                            # For transports that report no trace events
+                            delivered.set()
+                        if response.status_code == 202:
+                            logger.debug("Received 202 Accepted")
+                            return
+                        # Check for 404 (session expired/invalid)
+                        if response.status_code == 404:
+                            if is_initialization and session_id:
+                                logger.info(
+                                    "Session expired, retrying without ID"
+                                )
+                                session_id = None
+                                post_headers.pop(
+                                    MCP_SESSION_ID_HEADER, None
+                                )
+                                # Retry with client.stream
+                                async with http_stream(
                                     "POST",
-                                    url,
-                                    json=message.model_dump(
-                                        by_alias=True, mode="json", exclude_none=True
-                                    ),
-                                    headers=post_headers,
-                                ) as response:
-                                    if response.status_code == 202:
-                                        logger.debug("Received 202 Accepted")
-                                        continue
-                                    # Check for 404 (session expired/invalid)
-                                    if response.status_code == 404:
-                                        if is_initialization and session_id:
-                                            logger.info(
-                                                "Session expired, retrying without ID"
-                                            )
-                                            session_id = None
-                                            post_headers.pop(
-                                                MCP_SESSION_ID_HEADER, None
-                                            )
-                                            # Retry with client.stream
-                                            async with client.stream(
-                                                "POST",
-                                                url,
-                                                json=message.model_dump(
-                                                    by_alias=True,
-                                                    mode="json",
-                                                    exclude_none=True,
-                                                ),
-                                                headers=post_headers,
-                                            ) as new_response:
-                                                response = new_response
-                                        elif isinstance(message.root, JSONRPCRequest):
-                                            jsonrpc_error = JSONRPCError(
-                                                jsonrpc="2.0",
-                                                id=message.root.id,
-                                                error=ErrorData(
-                                                    code=32600,
-                                                    message="Session terminated",
-                                                ),
-                                            )
-                                            await read_stream_writer.send(
-                                                JSONRPCMessage(jsonrpc_error)
-                                            )
-                                            continue
-                                    response.raise_for_status()
-
-                                    # Extract session ID from response headers
-                                    if is_initialization:
-                                        new_session_id = response.headers.get(
-                                            MCP_SESSION_ID_HEADER
-                                        )
-                                        if new_session_id:
-                                            session_id = new_session_id
-                                            logger.info(
-                                                f"Received session ID: {session_id}"
-                                            )
-
-                                    # Handle different response types
-                                    content_type = response.headers.get(
-                                        "content-type", ""
-                                    ).lower()
-
-                                    if content_type.startswith(CONTENT_TYPE_JSON):
-                                        try:
-                                            content = await response.aread()
-                                            json_content = content.decode('utf-8')
-                                            logger.debug(f"Received JSON response: {json_content}")
-                                            
-                                            # Check if the response is an array instead of an object
-                                            parsed_json = json.loads(json_content)
-                                            
-                                            if isinstance(parsed_json, list):
-                                                # Handle array response - convert the first item to a proper JSONRPCMessage
-                                                if parsed_json and isinstance(parsed_json[0], dict):
-                                                    logger.info(f"Converting array response to object: {parsed_json[0]}")
-                                                    json_message = JSONRPCMessage.model_validate(parsed_json[0])
-                                                    await read_stream_writer.send(json_message)
-                                                else:
-                                                    logger.error(f"Invalid array response format: {parsed_json}")
-                                                    await read_stream_writer.send(
-                                                        ValueError(f"Invalid array response format: {parsed_json}")
-                                                    )
-                                            else:
-                                                # Standard object response
-                                                json_message = JSONRPCMessage.model_validate_json(content)
-                                                await read_stream_writer.send(json_message)
-                                        except Exception as exc:
-                                            logger.error(
-                                                f"Error parsing JSON response: {exc}"
-                                            )
-                                            await read_stream_writer.send(exc)
-
-                                    elif content_type.startswith(CONTENT_TYPE_SSE):
-                                        # Parse SSE events from the response
-                                        try:
-                                            event_source = EventSource(response)
-                                            async for sse in event_source.aiter_sse():
-                                                if sse.event == "message":
-                                                    try:
-                                                        sse_data = sse.data
-                                                        logger.debug(f"Received SSE message: {sse_data}")
-                                                        
-                                                        # Check if the response is an array
-                                                        parsed_json = json.loads(sse_data)
-                                                        
-                                                        if isinstance(parsed_json, list):
-                                                            # Handle array response - convert the first item to a proper JSONRPCMessage
-                                                            if parsed_json and isinstance(parsed_json[0], dict):
-                                                                logger.info(f"Converting SSE array to object: {parsed_json[0]}")
-                                                                json_message = JSONRPCMessage.model_validate(parsed_json[0])
-                                                                await read_stream_writer.send(json_message)
-                                                            else:
-                                                                logger.error(f"Invalid SSE array format: {parsed_json}")
-                                                                await read_stream_writer.send(
-                                                                    ValueError(f"Invalid SSE array format: {parsed_json}")
-                                                                )
-                                                        else:
-                                                            # Standard object response
-                                                            json_message = JSONRPCMessage.model_validate_json(sse_data)
-                                                            await read_stream_writer.send(json_message)
-                                                    except Exception as exc:
-                                                        logger.exception(
-                                                            "Error parsing message"
-                                                        )
-                                                        await read_stream_writer.send(
-                                                            exc
-                                                        )
-                                                else:
-                                                    logger.warning(
-                                                        f"Unknown event: {sse.event}"
-                                                    )
-
-                                        except Exception as e:
-                                            logger.exception(
-                                                "Error reading SSE stream:"
-                                            )
-                                            await read_stream_writer.send(e)
-
-                                    else:
-                                        # For 202 Accepted with no body
-                                        if response.status_code == 202:
-                                            logger.debug("Received 202 Accepted")
-                                            continue
-
-                                        error_msg = (
-                                            f"Unexpected content type: {content_type}"
+                                    post_headers,
+                                    rpc_method=rpc_method,
+                                    trace_context=scope.trace_context,
+                                    content=body,
+                                    timeout=timeout_for_post,
+                                ) as new_response:
+                                    response = new_response
+                            else:
+                                metrics.increment(HTTP_ERRORS, tags={"code": "404"})
+                                for message in messages:
+                                    if isinstance(message.root, JSONRPCRequest):
+                                        jsonrpc_error = JSONRPCError(
+                                            jsonrpc="2.0",
+                                            id=message.root.id,
+                                            error=ErrorData(
+                                                code=32600,
+                                                message="Session terminated",
+                                            ),
                                         )
-                                        logger.error(error_msg)
                                         await read_stream_writer.send(
-                                            ValueError(error_msg)
+                                            JSONRPCMessage(jsonrpc_error)
+                                        )
+                                return
+                        response.raise_for_status()
+
+                        # Extract session ID from response headers
+                        if is_initialization:
+                            new_session_id = response.headers.get(
+                                MCP_SESSION_ID_HEADER
+                            )
+                            if new_session_id:
+                                session_id = new_session_id
+                                logger.info(
+                                    f"Received session ID: {session_id}"
+                                )
+
+                        # Handle different response types
+                        content_type = response.headers.get(
+                            "content-type", ""
+                        ).lower()
+
+                        if content_type.startswith(CONTENT_TYPE_JSON):
+                            try:
+                                content = await _read_body(response)
+                                await forward_payload(content, "response", pending)
+                            except Exception as exc:
+                                logger.error(
+                                    f"Error parsing JSON response: {exc}"
+                                )
+                                await read_stream_writer.send(exc)
+
+                        elif content_type.startswith(CONTENT_TYPE_SSE):
+                            # Parse SSE events from the response
+                            cursor = _SSECursor()
+                            dropped: Exception | None = None
+                            try:
+                                await forward_events(
+                                    EventSource(response), "SSE", cursor, pending
+                                )
+                            except Exception as exc:
+                                logger.warning(f"SSE stream dropped: {exc}")
+                                dropped = exc
+
+                            if pending and cursor.last_event_id is not None:
+                                await response.aclose()
+                                await resume_stream(cursor, pending, scope, dropped)
+                            elif pending:
+                                # Nothing to resume from, whether the stream dropped or
+                                # ended cleanly: fail the pending requests
+                                raise dropped or httpx.ReadError(
+                                    "SSE stream closed before all responses were received"
+                                )
+                            elif dropped is not None:
+                                await read_stream_writer.send(dropped)
+
+                        else:
+                            # For 202 Accepted with no body
+                            if response.status_code == 202:
+                                logger.debug("Received 202 Accepted")
+                                return
+
+                            error_msg = (
+                                f"Unexpected content type: {content_type}"
+                            )
+                            logger.error(error_msg)
+                            await read_stream_writer.send(
+                                ValueError(error_msg)
+                            )
+
+                async def handle_messages(
+                    messages: list[JSONRPCMessage], delivered: anyio.Event | None = None
+                ) -> None:
+                    # Requests of this POST that have not been answered yet
+                    pending = {
+                        message.root.id
+                        for message in messages
+                        if isinstance(message.root, JSONRPCRequest)
+                    }
+                    try:
+                        await send_message(messages, pending, delivered)
+                    except Exception as exc:
+                        logger.error(f"Error sending client message: {exc}")
+                        metrics.increment(HTTP_ERRORS, tags={"code": error_code(exc)})
+                        for message in messages:
+                            if (
+                                isinstance(message.root, JSONRPCRequest)
+                                and message.root.id in pending
+                            ):
+                                # Fail the pending request instead of leaving
+                                # the caller waiting on a response that never comes
+                                await read_stream_writer.send(
+                                    JSONRPCMessage(
+                                        JSONRPCError(
+                                            jsonrpc="2.0",
+                                            id=message.root.id,
+                                            error=ErrorData(
+                                                code=INTERNAL_ERROR,
+                                                message=str(exc),
+                                                data=_transport_error_data(exc),
+                                            ),
                                         )
+                                    )
+                                )
+                    finally:
+                        if delivered is not None:
+                            delivered.set()
+
+                # Set once the requests posted concurrently have been sent
+                undelivered: list[anyio.Event] = []
+
+                async def post(messages: list[JSONRPCMessage]) -> None:
+                    """
+                    Post messages without letting them overtake those posted before.
+
+                    Requests are posted concurrently. Other messages, such as
+                    notifications/cancelled, wait until every request posted before
+                    them has been sent, and are posted inline when alone.
+                    """
+                    has_requests = any(isinstance(message.root, JSONRPCRequest) for message in messages)
+                    if not all(isinstance(message.root, JSONRPCRequest) for message in messages):
+                        for event in undelivered:
+                            await event.wait()
+                        undelivered.clear()
+                        if not has_requests:
+                            await handle_messages(messages)
+                            return
+                    undelivered[:] = [event for event in undelivered if not event.is_set()]
+                    delivered = anyio.Event()
+                    undelivered.append(delivered)
+                    tg.start_soon(handle_messages, messages, delivered)
+
+                async def collect_batch(first: JSONRPCMessage) -> tuple[list[JSONRPCMessage], bool]:
+                    """
+                    Gather messages queued within the batch window.
+
+                    Returns the batch and whether the write stream was closed.
+                    """
+                    batch = [first]
+                    with anyio.move_on_after(batch_window):
+                        while len(batch) < max_batch_size:
+                            try:
+                                batch.append(await write_stream_reader.receive())
+                            except anyio.EndOfStream:
+                                return batch, True
+                    return batch, False
+
+                async def post_writer():
+                    try:
+                        async with write_stream_reader:
+                            async for message in write_stream_reader:
+                                if (
+                                    isinstance(message.root, JSONRPCRequest)
+                                    and message.root.method == "initialize"
+                                ):
+                                    # Never batched: the session ID is only known
+                                    # once initialize completes
+                                    await handle_messages([message])
+                                elif batching:
+                                    batch, closed = await collect_batch(message)
+                                    await post(batch)
+                                    if closed:
+                                        break
+                                else:
+                                    await post([message])
 
                     except Exception as exc:
                         logger.error(f"Error in post_writer: {exc}")
@@ -263,65 +754,48 @@ async def streamablehttp_client(
 
                 async def get_stream():
                     """
-                    Optional GET stream for server-initiated messages
+                    Optional GET stream for server-initiated messages, reconnected
+                    with Last-Event-ID when it drops
                     """
                     nonlocal session_id
-                    try:
+                    cursor = _SSECursor()
+                    attempts = 0
+                    while True:
                         # Only attempt GET if we have a session ID
                         if not session_id:
                             return
 
                         get_headers = request_headers.copy()
                         get_headers[MCP_SESSION_ID_HEADER] = session_id
+                        if cursor.last_event_id is not None:
+                            get_headers[LAST_EVENT_ID_HEADER] = cursor.last_event_id
+                        resumed_from = cursor.last_event_id
+
+                        try:
+                            async with http_stream(
+                                "GET",
+                                sse_headers(get_headers),
+                                timeout=_with_read_timeout(timeout, sse_read_timeout),
+                            ) as response:
+                                response.raise_for_status()
+                                logger.debug("GET SSE connection established")
+                                await forward_events(EventSource(response), "GET", cursor)
+                            # Closed by the server
+                            return
+                        except httpx.TransportError as exc:
+                            if cursor.last_event_id != resumed_from:
+                                attempts = 0
+                            if attempts >= max_reconnect_attempts:
+                                logger.debug(f"GET stream error (non-fatal): {exc}")
+                                return
+                            logger.debug(f"GET stream dropped, reconnecting: {exc}")
+                        except Exception as exc:
+                            # GET stream is optional, so don't propagate errors
+                            logger.debug(f"GET stream error (non-fatal): {exc}")
+                            return
 
-                        async with aconnect_sse(
-                            client,
-                            "GET",
-                            url,
-                            headers=get_headers,
-                            timeout=httpx.Timeout(timeout, read=sse_read_timeout),
-                        ) as event_source:
-                            event_source.response.raise_for_status()
-                            logger.debug("GET SSE connection established")
-
-                            async for sse in event_source.aiter_sse():
-                                if sse.event == "message":
-                                    try:
-                                        sse_data = sse.data
-                                        logger.debug(f"Received GET message: {sse_data}")
-                                        
-                                        # Check if the response is an array
-                                        parsed_json = json.loads(sse_data)
-                                        
-                                        if isinstance(parsed_json, list):
-                                            # Handle array response - convert the first item to a proper JSONRPCMessage
-                                            if parsed_json and isinstance(parsed_json[0], dict):
-                                                logger.info(f"Converting GET array to object: {parsed_json[0]}")
-                                                message = JSONRPCMessage.model_validate(parsed_json[0])
-                                                logger.debug(f"GET message processed: {message}")
-                                                await read_stream_writer.send(message)
-                                            else:
-                                                logger.error(f"Invalid GET array format: {parsed_json}")
-                                                await read_stream_writer.send(
-                                                    ValueError(f"Invalid GET array format: {parsed_json}")
-                                                )
-                                        else:
-                                            # Standard object response
-                                            message = JSONRPCMessage.model_validate_json(sse_data)
-                                            logger.debug(f"GET message processed: {message}")
-                                            await read_stream_writer.send(message)
-                                    except Exception as exc:
-                                        logger.error(
-                                            f"Error parsing GET message: {exc}"
-                                        )
-                                        await read_stream_writer.send(exc)
-                                else:
-                                    logger.warning(
-                                        f"Unknown SSE event from GET: {sse.event}"
-                                    )
-                    except Exception as exc:
-                        # GET stream is optional, so don't propagate errors
-                        logger.debug(f"GET stream error (non-fatal): {exc}")
+                        await anyio.sleep(reconnect_wait(cursor, attempts))
+                        attempts += 1
 
                 tg.start_soon(post_writer)
 
@@ -340,6 +814,7 @@ async def streamablehttp_client(
                         response = await client.delete(
                             url,
                             headers=delete_headers,
+                            timeout=timeout,
                         )
 
                         if response.status_code == 405:
@@ -353,7 +828,11 @@ async def streamablehttp_client(
                         logger.warning(f"Session termination failed: {exc}")
 
                 try:
-                    yield read_stream, write_stream, terminate_session
+                    yield (
+                        read_stream,
+                        _RequestTaggingSendStream(write_stream, request_scopes, tracer),
+                        terminate_session,
+                    )
                 finally:
                     tg.cancel_scope.cancel()
         finally:
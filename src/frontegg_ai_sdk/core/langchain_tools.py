@@ -0,0 +1,65 @@
+"""
+LangChain Tools Module
+
+This module adapts MCP tools to LangChain structured tools that call the MCP
+tool through the client, asynchronously through its pooled session or
+synchronously through its event loop thread.
+"""
+
+from typing import Any, List, Tuple
+
+import mcp.types as types
+
+from .cache import stable_hash
+from .tool_models import input_model
+
+try:
+    from langchain_core.tools import StructuredTool
+except ImportError:  # Optional, installed with the `langchain` extra
+    StructuredTool = None
+
+
+def adapt_mcp_tool_to_langchain_tool(mcp_tool: types.Tool, client: Any) -> "StructuredTool":
+    """
+    Adapt an MCP tool to a LangChain structured tool.
+
+    The tool returns the text content of the result to the model and the full
+    `CallToolResult` as the tool message artifact.
+
+    Args:
+        mcp_tool: Tool returned by list_tools
+        client: Client or client context the tool calls through
+
+    Returns:
+        LangChain tool supporting both `invoke` and `ainvoke`
+    """
+    if StructuredTool is None:
+        raise ImportError(
+            "LangChain tools require langchain-core; install it with `pip install frontegg-ai-sdk[langchain]`"
+        )
+    if not (hasattr(mcp_tool, 'inputSchema') and mcp_tool.inputSchema):
+        raise ValueError(f"Tool {mcp_tool.name} has no input schema")
+
+    name = mcp_tool.name
+    ToolInput = input_model(mcp_tool.inputSchema, stable_hash(mcp_tool.inputSchema))
+
+    def call(**arguments: Any) -> Tuple[str, types.CallToolResult]:
+        return _to_content_and_artifact(client.call_tool_sync(name, arguments))
+
+    async def acall(**arguments: Any) -> Tuple[str, types.CallToolResult]:
+        return _to_content_and_artifact(await client.call_tool(name, arguments))
+
+    return StructuredTool.from_function(
+        func=call,
+        coroutine=acall,
+        name=name,
+        description=getattr(mcp_tool, 'description', '') or '',
+        args_schema=ToolInput,
+        response_format="content_and_artifact",
+    )
+
+
+def _to_content_and_artifact(result: types.CallToolResult) -> Tuple[str, types.CallToolResult]:
+    texts: List[str] = [item.text for item in result.content if isinstance(item, types.TextContent)]
+    return "\n".join(texts), result
+
@@ -0,0 +1,140 @@
+"""
+Loop Thread Module
+
+This module runs an asyncio event loop in a background thread, so synchronous
+callers can share the sessions and connections the loop keeps open.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Awaitable, Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Seconds to wait for the loop thread to exit when it is stopped
+STOP_TIMEOUT = 5.0
+
+
+class EventLoopThread:
+    """
+    An event loop running in a daemon thread, started on first use.
+
+    Coroutines are submitted with `run_coroutine_threadsafe`, so any number of
+    threads can call into the loop concurrently while all of them reuse the
+    loop-bound resources it owns.
+    """
+
+    def __init__(self, name: str = "frontegg-ai-sdk"):
+        """
+        Initialize the loop thread without starting it.
+
+        Args:
+            name: Name of the thread
+        """
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def loop(self) -> Optional[asyncio.AbstractEventLoop]:
+        return self._loop
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, make_coroutine: Callable[[], Awaitable[T]]) -> "concurrent.futures.Future[T]":
+        """
+        Schedule a coroutine on the loop, starting the thread if needed.
+
+        Args:
+            make_coroutine: Returns the coroutine to run; called on the loop thread
+
+        Returns:
+            A concurrent future resolving to the coroutine's result
+        """
+        loop = self._ensure_started()
+
+        async def runner() -> T:
+            return await make_coroutine()
+
+        return asyncio.run_coroutine_threadsafe(runner(), loop)
+
+    def run(self, make_coroutine: Callable[[], Awaitable[T]], timeout: Optional[float] = None) -> T:
+        """
+        Run a coroutine on the loop and block until it completes.
+
+        Args:
+            make_coroutine: Returns the coroutine to run
+            timeout: Optional number of seconds to wait for the result
+
+        Returns:
+            The coroutine's result
+        """
+        if self.in_loop_thread():
+            raise RuntimeError(
+                "Synchronous client methods cannot be called from the client's own event loop; "
+                "await the async method instead"
+            )
+
+        future = self.submit(make_coroutine)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stop(self) -> None:
+        """
+        Stop the loop and wait for the thread to exit.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = None
+            self._thread = None
+        if loop is None or thread is None:
+            return
+
+        loop.call_soon_threadsafe(loop.stop)
+        if threading.current_thread() is not thread:
+            thread.join(STOP_TIMEOUT)
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is not None and self._thread is not None and self._thread.is_alive():
+                return self._loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop, ready),
+                name=self.name,
+                daemon=True,
+            )
+            thread.start()
+            ready.wait()
+            self._loop = loop
+            self._thread = thread
+            return loop
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, ready: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
@@ -0,0 +1,527 @@
+"""
+Metrics Module
+
+This module provides the pluggable metrics interface the client reports
+latencies, throughput and errors through, together with no-op, in-memory,
+Prometheus and OpenTelemetry sinks.
+"""
+
+import importlib
+import logging
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, Mapping, Optional, Set, Tuple
+from weakref import WeakKeyDictionary
+
+import httpx
+from mcp.shared.exceptions import McpError
+
+# Metric names. Durations are in seconds, sizes in bytes.
+TOOL_CALL_DURATION = "tool_call.duration"
+TOOL_CALL_ERRORS = "tool_call.errors"
+TOOL_CALL_COALESCED = "tool_call.coalesced"
+TOOL_RESULT_CACHE_HITS = "tool_result_cache.hits"
+TOOL_RESULT_CACHE_MISSES = "tool_result_cache.misses"
+LIST_TOOLS_DURATION = "list_tools.duration"
+SESSION_INIT_DURATION = "session.initialize.duration"
+JWT_REFRESH_DURATION = "jwt.refresh.duration"
+JWT_REFRESH_ERRORS = "jwt.refresh.errors"
+HTTP_REQUEST_DURATION = "http.request.duration"
+HTTP_BYTES_SENT = "http.bytes_sent"
+HTTP_BYTES_RECEIVED = "http.bytes_received"
+HTTP_ERRORS = "http.errors"
+SSE_EVENTS = "sse.events"
+SESSION_POOL_SESSIONS = "session_pool.sessions"
+SESSION_POOL_IN_USE = "session_pool.in_use"
+
+# Tags each metric is recorded with. Timed metrics also get an `outcome` tag.
+METRIC_TAGS: Dict[str, Tuple[str, ...]] = {
+    TOOL_CALL_DURATION: ("outcome", "tool"),
+    TOOL_CALL_ERRORS: ("error", "tool"),
+    TOOL_CALL_COALESCED: ("tool",),
+    TOOL_RESULT_CACHE_HITS: ("tool",),
+    TOOL_RESULT_CACHE_MISSES: ("tool",),
+    LIST_TOOLS_DURATION: ("outcome",),
+    SESSION_INIT_DURATION: ("outcome",),
+    JWT_REFRESH_DURATION: (),
+    JWT_REFRESH_ERRORS: ("error",),
+    HTTP_REQUEST_DURATION: ("method", "status"),
+    HTTP_BYTES_SENT: ("method",),
+    HTTP_BYTES_RECEIVED: ("method",),
+    HTTP_ERRORS: ("code",),
+    SSE_EVENTS: ("source",),
+    SESSION_POOL_SESSIONS: (),
+    SESSION_POOL_IN_USE: (),
+}
+
+Tags = Optional[Mapping[str, Any]]
+SeriesKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def _import_optional(module: str, extra: str, sink: str) -> Any:
+    """
+    Import the optional dependency of a sink when the sink is created, so
+    importing the SDK never pays for exporters that are not used.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise ImportError(
+            f"{module} is required for {sink}; install it with `pip install frontegg-ai-sdk[{extra}]`"
+        ) from error
+
+
+def error_code(error: BaseException) -> str:
+    """
+    Describe an error by a short, low-cardinality code for use as a tag.
+
+    Args:
+        error: Error raised by a request
+
+    Returns:
+        The JSON-RPC error code, HTTP status or error class name
+    """
+    if isinstance(error, McpError):
+        data = error.error.data
+        if isinstance(data, dict) and "status" in data:
+            return str(data["status"])
+        return str(error.error.code)
+    if isinstance(error, httpx.HTTPStatusError):
+        return str(error.response.status_code)
+    return type(error).__name__
+
+
+class MetricsSink:
+    """
+    Receiver of the SDK's metrics.
+
+    Every method is a no-op; subclasses override the ones they record.
+    Methods are called from the event loop and must not block.
+    """
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        """
+        Add `value` to a counter.
+        """
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        """
+        Record a sample of a distribution, such as a latency.
+        """
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        """
+        Set the current value of a gauge.
+        """
+
+    @contextmanager
+    def timer(self, name: str, tags: Tags = None) -> Iterator[Dict[str, Any]]:
+        """
+        Observe the duration of a block.
+
+        Yields a dict of tags recorded with the duration. Its `outcome` tag is
+        `ok`, or `error` if the block raised, unless set inside the block.
+        """
+        block_tags: Dict[str, Any] = dict(tags or {})
+        started = time.perf_counter()
+        try:
+            yield block_tags
+        except BaseException:
+            block_tags.setdefault("outcome", "error")
+            raise
+        finally:
+            block_tags.setdefault("outcome", "ok")
+            self.observe(name, time.perf_counter() - started, block_tags)
+
+
+class NoopMetricsSink(MetricsSink):
+    """
+    Sink discarding every metric. Used when no sink is configured.
+    """
+
+
+class GuardedMetricsSink(MetricsSink):
+    """
+    Wrapper logging the errors of a sink instead of raising them, so a broken
+    sink cannot fail the request it records. Each failing metric is logged once.
+    """
+
+    def __init__(self, sink: MetricsSink, logger: Optional[logging.Logger] = None):
+        """
+        Initialize the wrapper.
+
+        Args:
+            sink: Sink the metrics are recorded with
+            logger: Logger the sink's errors are reported to (optional)
+        """
+        self.sink = sink
+        self.logger = logger or logging.getLogger(__name__)
+        self._failed: Set[str] = set()
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        try:
+            self.sink.increment(name, value, tags)
+        except Exception as error:
+            self._report(name, error)
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        try:
+            self.sink.observe(name, value, tags)
+        except Exception as error:
+            self._report(name, error)
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        try:
+            self.sink.gauge(name, value, tags)
+        except Exception as error:
+            self._report(name, error)
+
+    def _report(self, name: str, error: Exception) -> None:
+        if name not in self._failed:
+            self._failed.add(name)
+            self.logger.warning(f"Metrics sink failed to record {name}: {error!r}")
+
+
+def guard_metrics(sink: Optional[MetricsSink], logger: Optional[logging.Logger] = None) -> MetricsSink:
+    """
+    Wrap a sink so its errors are logged instead of raised.
+
+    Args:
+        sink: Sink to wrap (optional)
+        logger: Logger the sink's errors are reported to (optional)
+
+    Returns:
+        The wrapped sink, or the no-op sink if none is given
+    """
+    if sink is None or isinstance(sink, (NoopMetricsSink, GuardedMetricsSink)):
+        return sink or NOOP_METRICS
+    return GuardedMetricsSink(sink, logger)
+
+
+@dataclass
+class HistogramSummary:
+    """
+    Summary of the samples of one distribution.
+    """
+    count: int = 0
+    total: float = 0.0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    samples: Deque[float] = field(default_factory=deque, repr=False)
+
+    @property
+    def average(self) -> Optional[float]:
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Return the given percentile (0-100) of the retained samples.
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = max(math.ceil(percent / 100 * len(ordered)) - 1, 0)
+        return ordered[min(index, len(ordered) - 1)]
+
+
+class InMemoryMetricsSink(MetricsSink):
+    """
+    Sink keeping metrics in memory, for tests, benchmarks and debugging.
+
+    Counters, gauges and histograms are kept per metric name and set of tags.
+    Histograms retain their most recent `max_samples` samples for percentiles.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        """
+        Initialize the sink.
+
+        Args:
+            max_samples: Number of samples kept per histogram for percentiles
+        """
+        self.max_samples = max_samples
+        self._counters: Dict[SeriesKey, float] = {}
+        self._gauges: Dict[SeriesKey, float] = {}
+        self._histograms: Dict[SeriesKey, HistogramSummary] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, tags: Tags) -> SeriesKey:
+        return name, tuple(sorted((str(k), str(v)) for k, v in (tags or {}).items()))
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        key = self._key(name, tags)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        key = self._key(name, tags)
+        with self._lock:
+            summary = self._histograms.get(key)
+            if summary is None:
+                summary = self._histograms[key] = HistogramSummary(samples=deque(maxlen=self.max_samples))
+            summary.count += 1
+            summary.total += value
+            summary.min = value if summary.min is None else min(summary.min, value)
+            summary.max = value if summary.max is None else max(summary.max, value)
+            # Bounded, so the oldest sample is dropped
+            summary.samples.append(value)
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        with self._lock:
+            self._gauges[self._key(name, tags)] = value
+
+    def counter(self, name: str, **tags: Any) -> float:
+        """
+        Return a counter's total across every series whose tags include `tags`.
+        """
+        with self._lock:
+            return sum(value for key, value in self._counters.items() if self._matches(key, name, tags))
+
+    def gauge_value(self, name: str, **tags: Any) -> Optional[float]:
+        """
+        Return the last value of the first gauge series whose tags include `tags`.
+        """
+        with self._lock:
+            for key, value in self._gauges.items():
+                if self._matches(key, name, tags):
+                    return value
+        return None
+
+    def histogram(self, name: str, **tags: Any) -> HistogramSummary:
+        """
+        Return a summary of the samples of every series whose tags include `tags`.
+        """
+        merged = HistogramSummary()
+        with self._lock:
+            for key, summary in self._histograms.items():
+                if not self._matches(key, name, tags) or summary.count == 0:
+                    continue
+                merged.count += summary.count
+                merged.total += summary.total
+                merged.min = summary.min if merged.min is None else min(merged.min, summary.min)
+                merged.max = summary.max if merged.max is None else max(merged.max, summary.max)
+                merged.samples.extend(summary.samples)
+        return merged
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return every series as plain data, e.g. for JSON output.
+        """
+        def series(key: SeriesKey) -> Dict[str, Any]:
+            return {"name": key[0], "tags": dict(key[1])}
+
+        with self._lock:
+            return {
+                "counters": [{**series(key), "value": value} for key, value in self._counters.items()],
+                "gauges": [{**series(key), "value": value} for key, value in self._gauges.items()],
+                "histograms": [
+                    {
+                        **series(key),
+                        "count": summary.count,
+                        "sum": summary.total,
+                        "min": summary.min,
+                        "max": summary.max,
+                        "p50": summary.percentile(50),
+                        "p95": summary.percentile(95),
+                        "p99": summary.percentile(99),
+                    }
+                    for key, summary in self._histograms.items()
+                ],
+            }
+
+    def reset(self) -> None:
+        """
+        Discard every recorded metric.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+    @staticmethod
+    def _matches(key: SeriesKey, name: str, tags: Mapping[str, Any]) -> bool:
+        if key[0] != name:
+            return False
+        series_tags = dict(key[1])
+        return all(series_tags.get(k) == str(v) for k, v in tags.items())
+
+
+def _metric_name(namespace: str, name: str) -> str:
+    return f"{namespace}_{name}".replace(".", "_") if namespace else name.replace(".", "_")
+
+
+# Collectors registered by the Prometheus sinks, per registry, so sinks sharing
+# a registry reuse them: (kind, labels, collector) by full metric name
+_PROMETHEUS_COLLECTORS: "WeakKeyDictionary[Any, Dict[str, Tuple[str, Tuple[str, ...], Any]]]" = WeakKeyDictionary()
+_PROMETHEUS_LOCK = threading.Lock()
+
+
+class PrometheusMetricsSink(MetricsSink):
+    """
+    Sink exporting metrics with `prometheus_client`.
+
+    Metric names are prefixed with `namespace` and dots become underscores, so
+    `tool_call.duration` is exported as `frontegg_ai_sdk_tool_call_duration`.
+    The SDK's metrics are labelled with the tags listed in `METRIC_TAGS`; other
+    metrics with the tags they are first recorded with. Tags outside a metric's
+    labels are dropped.
+
+    Metrics already registered under the same name, e.g. by the sink of another
+    client sharing the registry, are reused rather than registered again.
+    """
+
+    def __init__(
+        self,
+        registry: Any = None,
+        namespace: str = "frontegg_ai_sdk",
+        buckets: Optional[Tuple[float, ...]] = None,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            registry: Collector registry to register the metrics in (defaults to the global registry)
+            namespace: Prefix of every metric name
+            buckets: Histogram buckets in seconds (defaults to prometheus_client's)
+        """
+        self._prometheus = _import_optional("prometheus_client", "prometheus", "PrometheusMetricsSink")
+        self.registry = registry if registry is not None else self._prometheus.REGISTRY
+        self.namespace = namespace
+        self.buckets = buckets
+        self._metrics: Dict[Tuple[str, str], Tuple[Any, Tuple[str, ...]]] = {}
+        self._lock = threading.Lock()
+
+    def _series(self, kind: str, name: str, tags: Tags) -> Any:
+        tags = tags or {}
+        with self._lock:
+            entry = self._metrics.get((kind, name))
+            if entry is None:
+                labels = METRIC_TAGS.get(name)
+                if labels is None:
+                    labels = tuple(sorted(str(k) for k in tags))
+                entry = self._metrics[(kind, name)] = (self._collector(kind, name, labels), labels)
+        metric, labels = entry
+        if not labels:
+            return metric
+        return metric.labels(**{label: str(tags.get(label, "")) for label in labels})
+
+    def _collector(self, kind: str, name: str, labels: Tuple[str, ...]) -> Any:
+        full_name = _metric_name(self.namespace, name)
+        with _PROMETHEUS_LOCK:
+            collectors = _PROMETHEUS_COLLECTORS.setdefault(self.registry, {})
+            # Registered by another sink on this registry
+            existing = collectors.get(full_name)
+            if existing is not None:
+                existing_kind, existing_labels, collector = existing
+                if existing_kind != kind or existing_labels != labels:
+                    raise ValueError(f"Metric {full_name} is already registered with another type or labels")
+                return collector
+
+            options: Dict[str, Any] = {"registry": self.registry}
+            if kind == "histogram":
+                metric_type = self._prometheus.Histogram
+                if self.buckets is not None:
+                    options["buckets"] = self.buckets
+            elif kind == "counter":
+                metric_type = self._prometheus.Counter
+            else:
+                metric_type = self._prometheus.Gauge
+            try:
+                collector = metric_type(full_name, f"Frontegg AI SDK {name}", labels, **options)
+            except ValueError as error:
+                # prometheus_client rejects a name already taken on the registry
+                raise ValueError(
+                    f"Metric {full_name} is already registered by code outside the SDK; "
+                    f"use another namespace or registry"
+                ) from error
+            collectors[full_name] = (kind, labels, collector)
+            return collector
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        self._series("counter", name, tags).inc(value)
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        self._series("histogram", name, tags).observe(value)
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        self._series("gauge", name, tags).set(value)
+
+
+class OpenTelemetryMetricsSink(MetricsSink):
+    """
+    Sink recording metrics with the OpenTelemetry metrics API.
+
+    Counters, histograms and gauges are created on the given meter, or on the
+    `frontegg_ai_sdk` meter of the global meter provider.
+    """
+
+    def __init__(self, meter: Any = None, namespace: str = "frontegg_ai_sdk"):
+        """
+        Initialize the sink.
+
+        Args:
+            meter: Meter to create the instruments on (optional)
+            namespace: Prefix of every instrument name
+        """
+        otel_metrics = _import_optional("opentelemetry.metrics", "opentelemetry", "OpenTelemetryMetricsSink")
+        self.meter = meter if meter is not None else otel_metrics.get_meter("frontegg_ai_sdk")
+        self.namespace = namespace
+        self._instruments: Dict[Tuple[str, str], Any] = {}
+        self._lock = threading.Lock()
+
+    def _instrument(self, kind: str, name: str) -> Any:
+        with self._lock:
+            instrument = self._instruments.get((kind, name))
+            if instrument is None:
+                full_name = f"{self.namespace}.{name}" if self.namespace else name
+                if kind == "counter":
+                    instrument = self.meter.create_counter(full_name)
+                elif kind == "histogram":
+                    unit = "s" if name.endswith("duration") else ""
+                    instrument = self.meter.create_histogram(full_name, unit=unit)
+                elif hasattr(self.meter, "create_gauge"):
+                    instrument = self.meter.create_gauge(full_name)
+                else:
+                    # Synchronous gauges are only available in newer API versions
+                    instrument = _UpDownGauge(self.meter.create_up_down_counter(full_name))
+                self._instruments[(kind, name)] = instrument
+        return instrument
+
+    @staticmethod
+    def _attributes(tags: Tags) -> Dict[str, str]:
+        return {str(k): str(v) for k, v in (tags or {}).items()}
+
+    def increment(self, name: str, value: float = 1, tags: Tags = None) -> None:
+        self._instrument("counter", name).add(value, self._attributes(tags))
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        self._instrument("histogram", name).record(value, self._attributes(tags))
+
+    def gauge(self, name: str, value: float, tags: Tags = None) -> None:
+        self._instrument("gauge", name).set(value, self._attributes(tags))
+
+
+class _UpDownGauge:
+    """
+    Gauge emulated with an up-down counter, tracking the last value per attribute set.
+    """
+
+    def __init__(self, counter: Any):
+        self._counter = counter
+        self._values: Dict[Tuple[Tuple[str, str], ...], float] = {}
+
+    def set(self, value: float, attributes: Dict[str, str]) -> None:
+        key = tuple(sorted(attributes.items()))
+        previous = self._values.get(key, 0)
+        self._values[key] = value
+        self._counter.add(value - previous, attributes)
+
+
+NOOP_METRICS = NoopMetricsSink()
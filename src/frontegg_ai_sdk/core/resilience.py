@@ -0,0 +1,327 @@
+"""
+Resilience Module
+
+This module protects the client and the MCP endpoint during incidents: a
+circuit breaker sheds calls once the endpoint keeps failing, and an adaptive
+concurrency limiter shrinks the number of requests in flight as latency and
+errors grow.
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional, Set, Tuple
+
+import httpx
+from mcp.shared.exceptions import McpError
+
+from .client_utils import is_retryable_error, is_transport_error
+from .enums import CircuitState
+
+# Transport errors of a slow or failing endpoint, counted even where retrying
+# them is unsafe: the request timed out or the connection broke mid-response
+ENDPOINT_TRANSPORT_ERRORS = (httpx.TimeoutException, httpx.ReadError)
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling the MCP endpoint while the circuit is open.
+    """
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"Circuit breaker is open; MCP endpoint calls resume in {retry_in:.1f}s")
+        self.retry_in = retry_in
+
+
+class ConcurrencyLimitExceededError(Exception):
+    """
+    Raised when a call waited longer than allowed for a concurrency slot.
+    """
+
+
+def is_endpoint_failure(error: BaseException) -> bool:
+    """
+    Check whether an error means the endpoint itself is unhealthy.
+
+    Tool errors and client errors do not count; overload responses, server
+    errors, connection errors, broken responses and timeouts do, whether
+    raised directly or reported by the MCP transport.
+
+    Args:
+        error: Error raised by a call
+
+    Returns:
+        True if the error should count against the endpoint
+    """
+    if isinstance(error, McpError) and error.error.code == httpx.codes.REQUEST_TIMEOUT:
+        # The session gave up waiting for the response
+        return True
+    return (
+        is_retryable_error(error)
+        or is_transport_error(error, ENDPOINT_TRANSPORT_ERRORS)
+        or isinstance(error, (asyncio.TimeoutError, TimeoutError))
+    )
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with closed, open and half-open states.
+
+    After `failure_threshold` consecutive endpoint failures the circuit opens
+    and every call fails fast with `CircuitOpenError`. Once `recovery_timeout`
+    seconds have passed it lets up to `half_open_max_calls` probe calls through;
+    a successful probe closes the circuit and a failed one opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30,
+        half_open_max_calls: int = 1,
+    ):
+        """
+        Initialize a closed circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before probing
+            half_open_max_calls: Probe calls allowed at once while half-open
+        """
+        if failure_threshold <= 0 or half_open_max_calls <= 0:
+            raise ValueError("failure_threshold and half_open_max_calls must be positive")
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.consecutive_failures = 0
+        self.opened_count = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._retry_in() <= 0:
+                return CircuitState.HALF_OPEN
+            return self._state
+
+    def raise_if_open(self) -> None:
+        """
+        Fail fast while the circuit is open, without taking a probe slot.
+        """
+        with self._lock:
+            if self._state is CircuitState.OPEN and self._retry_in() > 0:
+                raise CircuitOpenError(self._retry_in())
+
+    def before_call(self) -> None:
+        """
+        Admit a call, or raise `CircuitOpenError` if it has to be shed.
+
+        Every admitted call must be followed by `record_success`,
+        `record_failure` or `record_cancelled`.
+        """
+        with self._lock:
+            if self._state is CircuitState.OPEN:
+                retry_in = self._retry_in()
+                if retry_in > 0:
+                    raise CircuitOpenError(retry_in)
+                self._state = CircuitState.HALF_OPEN
+                self._probes = 0
+            if self._state is CircuitState.HALF_OPEN:
+                if self._probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(0.0)
+                self._probes += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.consecutive_failures = 0
+            if self._state is CircuitState.HALF_OPEN:
+                self._state = CircuitState.CLOSED
+                self._probes = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ) and self._state is not CircuitState.OPEN:
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+                self.opened_count += 1
+
+    def record_cancelled(self) -> None:
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def _retry_in(self) -> float:
+        return self._opened_at + self.recovery_timeout - time.monotonic()
+
+
+@dataclass
+class ConcurrencyLimiterStats:
+    """
+    Current limit and counters of an adaptive concurrency limiter.
+    """
+    limit: float
+    in_flight: int
+    queued: int
+    rejected: int
+    latency_baseline: Optional[float]
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD limit on the number of calls in flight.
+
+    The limit grows additively, by about one slot per limit's worth of calls,
+    while calls succeed within `latency_tolerance` times the baseline latency
+    and the limit is actually in use. It shrinks multiplicatively by
+    `backoff_ratio` when a call fails on the endpoint or exceeds that latency.
+    Calls over the limit wait up to `queue_timeout` seconds for a slot and are
+    then rejected.
+
+    Slots are released from whichever thread or event loop finishes a call,
+    so one limiter can be shared by all of a client's loops.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 32,
+        min_limit: int = 1,
+        max_limit: int = 256,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+        queue_timeout: float = 1.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Concurrent calls allowed at first
+            min_limit: Lowest limit the limiter shrinks to
+            max_limit: Highest limit the limiter grows to
+            backoff_ratio: Factor applied to the limit on failures and slow calls
+            latency_tolerance: Multiple of the baseline latency considered slow
+            queue_timeout: Seconds a call waits for a slot before it is rejected
+        """
+        if not 0 < min_limit <= initial_limit <= max_limit:
+            raise ValueError("limits must satisfy 0 < min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("backoff_ratio must be between 0 and 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.queue_timeout = queue_timeout
+        self.rejected = 0
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        # Waiters a slot was handed to, until they pick it up
+        self._granted: Set[asyncio.Future] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def stats(self) -> ConcurrencyLimiterStats:
+        with self._lock:
+            return ConcurrencyLimiterStats(
+                limit=self._limit,
+                in_flight=self._in_flight,
+                queued=len(self._waiters),
+                rejected=self.rejected,
+                latency_baseline=self._baseline,
+            )
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, waiting up to `queue_timeout` seconds for one to free up.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._in_flight < int(self._limit) and not self._waiters:
+                self._in_flight += 1
+                return
+            waiter = loop.create_future()
+            entry = (loop, waiter)
+            self._waiters.append(entry)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except BaseException as error:
+            with self._lock:
+                if waiter in self._granted:
+                    # The slot was handed over just as the wait ended
+                    self._granted.discard(waiter)
+                    self._release_slot()
+                else:
+                    self._waiters.remove(entry)
+                waiter.cancel()
+                if isinstance(error, asyncio.TimeoutError):
+                    self.rejected += 1
+            if isinstance(error, asyncio.TimeoutError):
+                raise ConcurrencyLimitExceededError(
+                    f"No MCP request slot freed up within {self.queue_timeout}s "
+                    f"(limit {int(self._limit)})"
+                ) from None
+            raise
+        with self._lock:
+            self._granted.discard(waiter)
+
+    def release(self, latency: Optional[float], failed: bool) -> None:
+        """
+        Free a slot and adapt the limit to the outcome of the call.
+
+        Args:
+            latency: Seconds the call took, or None if it was cancelled
+            failed: Whether the call failed on the endpoint
+        """
+        with self._lock:
+            if latency is not None:
+                self._adapt(latency, failed)
+            self._release_slot()
+
+    def _adapt(self, latency: float, failed: bool) -> None:
+        slow = self._baseline is not None and latency > self._baseline * self.latency_tolerance
+        if failed or slow:
+            self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        elif self._in_flight >= self._limit / 2:
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+        if not failed:
+            # Slowly moving baseline, pulled down quickly by faster calls
+            if self._baseline is None or latency < self._baseline:
+                self._baseline = latency
+            else:
+                self._baseline += (latency - self._baseline) * 0.01
+
+    def _release_slot(self) -> None:
+        self._in_flight -= 1
+        while self._waiters and self._in_flight < int(self._limit):
+            loop, waiter = self._waiters.popleft()
+            if waiter.done() or loop.is_closed():
+                continue
+            self._in_flight += 1
+            self._granted.add(waiter)
+            loop.call_soon_threadsafe(_hand_over, waiter)
+
+
+def _hand_over(waiter: asyncio.Future) -> None:
+    # A waiter that gave up after the slot was handed over releases it in acquire()
+    if not waiter.done():
+        waiter.set_result(None)
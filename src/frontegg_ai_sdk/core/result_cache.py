@@ -0,0 +1,381 @@
+"""
+Result Cache Module
+
+This module provides the backends of the tool result cache: an in-process
+cache, an on-disk cache, and a cache stored in Redis or any server speaking
+its protocol, together with an in-memory stand-in for a Redis client. Entries
+are serialized tool results, so memory bounds are enforced on their encoded size.
+"""
+
+import fnmatch
+from abc import ABC, abstractmethod
+import hashlib
+import inspect
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+import anyio
+
+# Expiry timestamp stored at the start of every on-disk entry
+_DISK_HEADER = struct.Struct("<d")
+_DISK_SUFFIX = ".entry"
+
+
+class ResultCache(ABC):
+    """
+    Storage of cached tool results.
+
+    Keys are strings built by the client from the agent, tenant, user, tool and
+    argument hash; values are encoded results. Backends decide how entries are
+    bounded and evicted. Errors raised by a backend are logged by the client and
+    treated as cache misses.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the entry stored under `key`, or None if it is missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Store an entry for `ttl` seconds.
+        """
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Drop the entry stored under `key`, if any.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+
+
+class MemoryResultCache(ResultCache):
+    """
+    In-process cache evicting the least recently used entries once their total
+    size exceeds `max_bytes`. Safe to share between event loops and threads.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Total size of the stored entries before the least recently used are evicted
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the stored entries in bytes.
+        """
+        return self._size
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._remove(key)
+            if len(value) > self.max_bytes:
+                return
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[1])
+
+
+class DiskResultCache(ResultCache):
+    """
+    Cache storing one file per entry in a directory, so entries take no memory
+    until read. A hit reads the entry with a single read sized from the file.
+
+    Entries survive restarts and can be shared by processes on one host, each
+    enforcing `max_bytes` on the entries it knows of. Expiry uses wall-clock time.
+    File I/O runs in a worker thread rather than on the event loop.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 256 * 1024 * 1024):
+        """
+        Initialize the cache, indexing the entries already in `directory`.
+
+        Args:
+            directory: Directory the entries are stored in (a new temporary directory by default)
+            max_bytes: Total size of the stored entries before the least recently used are evicted
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+
+        self.directory = directory or tempfile.mkdtemp(prefix="frontegg-ai-results-")
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        # Entry file names and sizes, least recently used first
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        existing = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(_DISK_SUFFIX):
+                stat = entry.stat()
+                existing.append((stat.st_atime, entry.name, stat.st_size))
+        with self._lock:
+            for _, name, size in sorted(existing):
+                self._index[name] = size
+                self._size += size
+            self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the stored entry files in bytes.
+        """
+        return self._size
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await anyio.to_thread.run_sync(self._get, key)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await anyio.to_thread.run_sync(self._set, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await anyio.to_thread.run_sync(self._delete, key)
+
+    async def clear(self) -> None:
+        await anyio.to_thread.run_sync(self._clear)
+
+    def _get(self, key: str) -> Optional[bytes]:
+        name = self._file_name(key)
+        path = os.path.join(self.directory, name)
+        value = None
+        read: Optional[os.stat_result] = None
+        try:
+            with open(path, "rb", buffering=0) as file:
+                read = os.fstat(file.fileno())
+                (expires_at,) = _DISK_HEADER.unpack(file.read(_DISK_HEADER.size))
+                if expires_at > time.time():
+                    value = file.read(read.st_size - _DISK_HEADER.size)
+        except (FileNotFoundError, struct.error):
+            # Missing, empty or truncated entry
+            pass
+
+        with self._lock:
+            if value is not None:
+                if name in self._index:
+                    self._index.move_to_end(name)
+                return value
+            # Entries are replaced under the lock, so a file still identical to the
+            # one read is the stale entry, and not one a concurrent set just wrote
+            try:
+                current: Optional[os.stat_result] = os.stat(path)
+            except FileNotFoundError:
+                current = None
+            if current is None or (read is not None and _same_file(current, read)):
+                self._unlink(name)
+        return None
+
+    def _set(self, key: str, value: bytes, ttl: float) -> None:
+        name = self._file_name(key)
+        size = _DISK_HEADER.size + len(value)
+        if size > self.max_bytes:
+            self._delete(key)
+            return
+
+        # Written aside and renamed, so readers never see a partial entry
+        descriptor, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(_DISK_HEADER.pack(time.time() + ttl))
+            file.write(value)
+
+        with self._lock:
+            os.replace(temporary, os.path.join(self.directory, name))
+            self._size -= self._index.pop(name, 0)
+            self._index[name] = size
+            self._size += size
+            self._evict()
+
+    def _delete(self, key: str) -> None:
+        with self._lock:
+            self._unlink(self._file_name(key))
+
+    def _clear(self) -> None:
+        with self._lock:
+            for name in list(self._index):
+                self._unlink(name)
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + _DISK_SUFFIX
+
+    def _evict(self) -> None:
+        while self._size > self.max_bytes and self._index:
+            self._unlink(next(iter(self._index)))
+
+    def _unlink(self, name: str) -> None:
+        self._size -= self._index.pop(name, 0)
+        try:
+            os.unlink(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+
+
+def _same_file(first: os.stat_result, second: os.stat_result) -> bool:
+    return (first.st_ino, first.st_size, first.st_mtime_ns) == (second.st_ino, second.st_size, second.st_mtime_ns)
+
+
+class RedisResultCache(ResultCache):
+    """
+    Cache stored in Redis, or any server speaking its protocol.
+
+    Takes a client such as `redis.asyncio.Redis`; synchronous clients work too
+    but block the event loop for each command. Entries expire on the server,
+    and the memory bound and eviction are the server's: configure `maxmemory`
+    with an LRU `maxmemory-policy`.
+    """
+
+    def __init__(self, client: Any, prefix: str = "frontegg-ai:result:"):
+        """
+        Initialize the cache.
+
+        Args:
+            client: Redis client, exposing `get`, `set`, `delete` and `scan_iter`
+            prefix: Prefix of every key, so `clear()` only drops this cache's entries
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await _resolve(self.client.get(self.prefix + key))
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await _resolve(self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1)))
+
+    async def delete(self, key: str) -> None:
+        await _resolve(self.client.delete(self.prefix + key))
+
+    async def clear(self) -> None:
+        keys = self.client.scan_iter(match=self.prefix + "*")
+        if hasattr(keys, "__aiter__"):
+            found = [key async for key in keys]
+        else:
+            found = list(keys)
+        if found:
+            await _resolve(self.client.delete(*found))
+
+
+class InMemoryRedis:
+    """
+    In-process stand-in for a Redis client, implementing the commands
+    `RedisResultCache` uses, for tests and local development.
+    """
+
+    def __init__(self):
+        # Values and their monotonic expiry times, None meaning no expiry
+        self._values: Dict[str, Tuple[Optional[float], bytes]] = {}
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._live(key)
+            return None if entry is None else entry[1]
+
+    async def set(self, key: str, value: bytes, px: Optional[int] = None) -> bool:
+        expires_at = None if px is None else time.monotonic() + px / 1000
+        with self._lock:
+            self._values[key] = (expires_at, bytes(value))
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(self._values.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(self, match: str = "*") -> AsyncIterator[str]:
+        with self._lock:
+            keys = [key for key in list(self._values) if self._live(key) is not None]
+        for key in keys:
+            if fnmatch.fnmatchcase(key, match):
+                yield key
+
+    def _live(self, key: str) -> Optional[Tuple[Optional[float], bytes]]:
+        entry = self._values.get(key)
+        if entry is not None and entry[0] is not None and entry[0] <= time.monotonic():
+            del self._values[key]
+            return None
+        return entry
+
+
+async def _resolve(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def result_cache_key(headers: Dict[str, Any], name: str, arguments_hash: str) -> str:
+    """
+    Build the cache key of a tool call from the agent, tenant and user it is made for.
+
+    A user identified only by an access token is keyed by a hash of the token.
+
+    Args:
+        headers: Context headers of the call
+        name: Name of the tool
+        arguments_hash: `stable_hash` of the call arguments
+
+    Returns:
+        The key, readable up to the user and argument hashes
+    """
+    user = headers.get("user-id")
+    if not user and headers.get("frontegg-user-access-token"):
+        token = str(headers["frontegg-user-access-token"]).encode("utf-8")
+        user = "token-" + hashlib.sha256(token).hexdigest()
+    return ":".join([
+        str(headers.get("agent-id") or ""),
+        str(headers.get("tenant-id") or ""),
+        str(user or ""),
+        name,
+        arguments_hash,
+    ])
@@ -0,0 +1,497 @@
+"""
+Session Pool Module
+
+This module keeps initialized MCP client sessions alive between calls, so that
+repeated tool calls reuse the same transport and skip the initialize handshake.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple, TypeVar
+
+import httpx
+import mcp.types as types
+from mcp import ClientSession
+from mcp.shared.exceptions import McpError
+
+from .httpTransport import streamablehttp_client
+from .logger import default_logger
+from .metrics import NOOP_METRICS, SESSION_INIT_DURATION, SESSION_POOL_IN_USE, SESSION_POOL_SESSIONS, MetricsSink
+from .tracing import start_span
+
+T = TypeVar('T')
+
+SessionKey = Tuple[Tuple[str, str], ...]
+
+NotificationHandler = Callable[[Dict[str, Any], types.ServerNotification], Awaitable[None]]
+
+# Error message the transport reports when the server answers 404 for a session
+SESSION_TERMINATED_MESSAGE = "Session terminated"
+
+
+def make_session_key(headers: Dict[str, Any]) -> SessionKey:
+    """
+    Build a hashable pool key from a set of request headers.
+
+    Args:
+        headers: Headers the session is opened with
+
+    Returns:
+        Sorted tuple of header name/value pairs
+    """
+    return tuple(sorted((str(k), str(v)) for k, v in headers.items()))
+
+
+def make_context_key(headers: Dict[str, Any]) -> SessionKey:
+    """
+    Build a key identifying the tenant and user context of a set of headers.
+
+    Sessions of the same context differ only by their Authorization header,
+    which changes whenever the vendor JWT is renewed.
+
+    Args:
+        headers: Headers the session is opened with
+
+    Returns:
+        Sorted tuple of header name/value pairs, without Authorization
+    """
+    return make_session_key({k: v for k, v in headers.items() if str(k).lower() != "authorization"})
+
+
+def is_session_terminated_error(error: BaseException) -> bool:
+    """
+    Check whether an error means the server no longer knows the session.
+
+    Args:
+        error: Error raised by a session operation
+
+    Returns:
+        True if the session has to be rebuilt before retrying
+    """
+    return isinstance(error, McpError) and error.error.message == SESSION_TERMINATED_MESSAGE
+
+
+class PooledSession:
+    """
+    An initialized MCP session owned by a background task.
+
+    The transport and the session are async context managers backed by task
+    groups, so they have to be entered and exited by the same task. A dedicated
+    owner task keeps them open until the pooled session is closed, while any
+    number of callers send requests through the session concurrently.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: Dict[str, Any],
+        logger: logging.Logger,
+        http_client: Optional[httpx.AsyncClient] = None,
+        notification_handler: Optional[NotificationHandler] = None,
+        transport_options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[MetricsSink] = None,
+        tracer: Any = None,
+    ):
+        self.url = url
+        self.headers = dict(headers)
+        self.context_key = make_context_key(self.headers)
+        self.logger = logger
+        self.http_client = http_client
+        self.notification_handler = notification_handler
+        self.transport_options = transport_options or {}
+        self.metrics = metrics or NOOP_METRICS
+        self.tracer = tracer
+        self.session: Optional[ClientSession] = None
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+        self.last_checked = self.created_at
+        self.in_use = 0
+        self.requests = 0
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._closing: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def is_alive(self) -> bool:
+        return (
+            self.session is not None
+            and self._task is not None
+            and not self._task.done()
+            and not self._closing.is_set()
+        )
+
+    async def start(self) -> None:
+        """
+        Open the transport and run the initialize handshake.
+
+        Raises:
+            The error that prevented the session from being initialized
+        """
+        self._ready = asyncio.Event()
+        self._closing = asyncio.Event()
+        self._task = asyncio.get_running_loop().create_task(self._run())
+        try:
+            await self._ready.wait()
+        except BaseException:
+            self._task.cancel()
+            raise
+        if self._error is not None:
+            raise self._error
+
+    async def _run(self) -> None:
+        try:
+            async with streamablehttp_client(
+                self.url,
+                self.headers,
+                http_client=self.http_client,
+                **self.transport_options,
+            ) as (
+                read_stream,
+                write_stream,
+                terminate_session,
+            ):
+                async with ClientSession(
+                    read_stream,
+                    write_stream,
+                    message_handler=self._handle_message,
+                ) as session:
+                    with start_span(self.tracer, "mcp.session.initialize"), self.metrics.timer(SESSION_INIT_DURATION):
+                        await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._closing.wait()
+                await terminate_session()
+        except Exception as error:
+            if not self._ready.is_set():
+                self._error = error
+            else:
+                self.logger.warning(f"Pooled MCP session closed with error: {error}")
+        finally:
+            self.session = None
+            self._ready.set()
+
+    async def _handle_message(self, message: Any) -> None:
+        if isinstance(message, types.ServerNotification) and self.notification_handler:
+            try:
+                await self.notification_handler(self.headers, message)
+            except Exception as error:
+                self.logger.warning(f"Error handling server notification: {error}")
+
+    async def run(self, operation: Callable[[ClientSession], Awaitable[T]]) -> T:
+        """
+        Run an operation against the session.
+
+        The operation is abandoned if the owner task exits first, so a dropped
+        transport never leaves the caller waiting for a response.
+
+        Args:
+            operation: Coroutine function receiving the initialized session
+
+        Returns:
+            The result of the operation
+        """
+        if not self.is_alive:
+            raise RuntimeError("Pooled MCP session is closed")
+        operation_task = asyncio.ensure_future(operation(self.session))
+        try:
+            await asyncio.wait(
+                {operation_task, self._task}, return_when=asyncio.FIRST_COMPLETED
+            )
+        except BaseException:
+            operation_task.cancel()
+            raise
+        if not operation_task.done():
+            operation_task.cancel()
+            raise RuntimeError("Pooled MCP session closed while a request was in flight")
+        return operation_task.result()
+
+    async def ping(self, timeout: float) -> bool:
+        """
+        Check that the server still answers on this session.
+
+        Args:
+            timeout: Seconds to wait for the ping response
+
+        Returns:
+            True if the session is healthy
+        """
+        try:
+            await asyncio.wait_for(self.run(lambda session: session.send_ping()), timeout)
+            self.last_checked = time.monotonic()
+            return True
+        except Exception as error:
+            self.logger.info(f"Pooled MCP session failed health check: {error}")
+            return False
+
+    async def aclose(self) -> None:
+        """
+        Close the session and terminate it on the server.
+        """
+        if self._task is None or self._task.done():
+            return
+        self._closing.set()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout=5)
+        except asyncio.TimeoutError:
+            self._task.cancel()
+        except Exception:
+            pass
+
+
+class SessionPool:
+    """
+    Pool of initialized MCP sessions keyed by request headers.
+
+    Sessions are reused across calls, health-checked after being idle, evicted
+    in least-recently-used order and rebuilt when the server terminates them.
+    A session older than `max_age` or past `max_requests` is retired: new calls
+    go to a fresh session and the old one closes once its calls finish, which
+    releases the per-request state an MCP session accumulates.
+    Each tenant and user context keeps a single warm session: opening one with
+    a renewed token closes the idle sessions the context opened before.
+
+    Sessions belong to the event loop that opened them, so a pool is bound to
+    the first loop it is used on; the client keeps one pool per loop.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        logger: Optional[logging.Logger] = None,
+        max_size: int = 16,
+        idle_timeout: float = 300,
+        health_check_interval: float = 60,
+        health_check_timeout: float = 5,
+        max_age: float = 0,
+        max_requests: int = 0,
+        http_client_factory: Optional[Callable[[], httpx.AsyncClient]] = None,
+        notification_handler: Optional[NotificationHandler] = None,
+        transport_options: Optional[Dict[str, Any]] = None,
+        metrics: Optional[MetricsSink] = None,
+        tracer: Any = None,
+    ):
+        """
+        Initialize a session pool.
+
+        Args:
+            url: MCP endpoint the sessions connect to
+            logger: Logger instance (optional)
+            max_size: Maximum number of sessions kept open
+            idle_timeout: Seconds after which an unused session is closed
+            health_check_interval: Seconds of inactivity after which a session is pinged before reuse
+            health_check_timeout: Seconds to wait for the health check ping
+            max_age: Seconds after which a session is replaced, or 0 to keep it
+            max_requests: Requests after which a session is replaced, or 0 to keep it
+            http_client_factory: Returns the shared HTTP client new sessions connect through
+            notification_handler: Called with the session headers for every server notification
+            transport_options: Extra keyword arguments for `streamablehttp_client`
+            metrics: Sink session handshakes and pool utilization are reported to (optional)
+            tracer: Tracer recording session handshakes (optional)
+        """
+        self.url = url
+        self.logger = logger or default_logger
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.max_age = max_age
+        self.max_requests = max_requests
+        self.http_client_factory = http_client_factory
+        self.notification_handler = notification_handler
+        self.transport_options = transport_options or {}
+        self.metrics = metrics or NOOP_METRICS
+        self.tracer = tracer
+        self._sessions: "OrderedDict[SessionKey, PooledSession]" = OrderedDict()
+        self._pending: Dict[SessionKey, asyncio.Task] = {}
+        # Sessions replaced while calls were still running on them
+        self._retired: Set[PooledSession] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    async def run(
+        self,
+        headers: Dict[str, Any],
+        operation: Callable[[ClientSession], Awaitable[T]],
+    ) -> T:
+        """
+        Run an operation on the pooled session for the given headers.
+
+        If the server reports the session as terminated, the session is rebuilt
+        and the operation is retried once.
+
+        Args:
+            headers: Headers identifying the session
+            operation: Coroutine function receiving the initialized session
+
+        Returns:
+            The result of the operation
+        """
+        self._check_loop()
+        key = make_session_key(headers)
+        retried = False
+        while True:
+            pooled = await self._acquire(key, headers)
+            pooled.in_use += 1
+            pooled.requests += 1
+            self._report_utilization()
+            try:
+                return await pooled.run(operation)
+            except Exception as error:
+                terminated = is_session_terminated_error(error)
+                if terminated or not pooled.is_alive:
+                    await self._discard(key, pooled)
+                if terminated and not retried:
+                    self.logger.info("MCP session terminated by server, reconnecting")
+                    retried = True
+                    continue
+                raise
+            finally:
+                pooled.in_use -= 1
+                pooled.last_used = time.monotonic()
+                if pooled in self._retired or self._is_expired(pooled):
+                    await self._retire(key, pooled)
+                self._report_utilization()
+
+    async def invalidate(self, headers: Dict[str, Any]) -> None:
+        """
+        Close the pooled session for the given headers, if any.
+
+        Args:
+            headers: Headers identifying the session
+        """
+        self._check_loop()
+        key = make_session_key(headers)
+        pooled = self._sessions.get(key)
+        if pooled is not None:
+            await self._discard(key, pooled)
+
+    async def aclose(self) -> None:
+        """
+        Close every pooled session.
+        """
+        self._check_loop()
+        closing = list(self._sessions.values()) + list(self._retired)
+        self._sessions.clear()
+        self._retired.clear()
+        self._pending.clear()
+        await asyncio.gather(
+            *(pooled.aclose() for pooled in closing),
+            return_exceptions=True,
+        )
+
+    async def _acquire(self, key: SessionKey, headers: Dict[str, Any]) -> PooledSession:
+        await self._evict_idle()
+
+        pooled = self._sessions.get(key)
+        if pooled is not None:
+            if not pooled.is_alive:
+                await self._discard(key, pooled)
+            elif self._is_expired(pooled):
+                await self._retire(key, pooled)
+            elif (
+                pooled.in_use == 0
+                and time.monotonic() - pooled.last_used > self.health_check_interval
+                and not await pooled.ping(self.health_check_timeout)
+            ):
+                await self._discard(key, pooled)
+            else:
+                self._sessions.move_to_end(key)
+                return pooled
+
+        # Callers racing for the same key share a single handshake
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._open(key, headers))
+            self._pending[key] = pending
+        return await asyncio.shield(pending)
+
+    async def _open(self, key: SessionKey, headers: Dict[str, Any]) -> PooledSession:
+        try:
+            http_client = self.http_client_factory() if self.http_client_factory else None
+            pooled = PooledSession(
+                self.url,
+                headers,
+                self.logger,
+                http_client,
+                self.notification_handler,
+                self.transport_options,
+                self.metrics,
+                self.tracer,
+            )
+            await pooled.start()
+            self._sessions[key] = pooled
+            await self._evict_superseded(pooled.context_key, keep=key)
+            await self._evict_overflow(keep=key)
+            return pooled
+        finally:
+            self._pending.pop(key, None)
+
+    def _check_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("SessionPool used from an event loop other than the one it was first used on")
+
+    def _is_expired(self, pooled: PooledSession) -> bool:
+        return bool(
+            (self.max_age and time.monotonic() - pooled.created_at > self.max_age)
+            or (self.max_requests and pooled.requests >= self.max_requests)
+        )
+
+    def _report_utilization(self) -> None:
+        self.metrics.gauge(SESSION_POOL_SESSIONS, len(self._sessions))
+        in_use = sum(pooled.in_use for pooled in self._sessions.values())
+        in_use += sum(pooled.in_use for pooled in self._retired)
+        self.metrics.gauge(SESSION_POOL_IN_USE, in_use)
+
+    async def _retire(self, key: SessionKey, pooled: PooledSession) -> None:
+        # Taken out of rotation now, closed once its in-flight calls finish
+        if self._sessions.get(key) is pooled:
+            del self._sessions[key]
+        if pooled.in_use > 0:
+            self._retired.add(pooled)
+        else:
+            await self._discard(key, pooled)
+
+    async def _discard(self, key: SessionKey, pooled: PooledSession) -> None:
+        if self._sessions.get(key) is pooled:
+            del self._sessions[key]
+        self._retired.discard(pooled)
+        await pooled.aclose()
+
+    async def _evict_idle(self) -> None:
+        now = time.monotonic()
+        expired = [
+            (key, pooled)
+            for key, pooled in self._sessions.items()
+            if pooled.in_use == 0 and now - pooled.last_used > self.idle_timeout
+        ]
+        for key, pooled in expired:
+            await self._discard(key, pooled)
+
+    async def _evict_superseded(self, context_key: SessionKey, keep: SessionKey) -> None:
+        superseded = [
+            (key, pooled)
+            for key, pooled in self._sessions.items()
+            if key != keep and pooled.in_use == 0 and pooled.context_key == context_key
+        ]
+        for key, pooled in superseded:
+            await self._discard(key, pooled)
+
+    async def _evict_overflow(self, keep: SessionKey) -> None:
+        while len(self._sessions) > self.max_size:
+            idle = [
+                (key, pooled)
+                for key, pooled in self._sessions.items()
+                if pooled.in_use == 0 and key != keep
+            ]
+            if not idle:
+                break
+            key, pooled = idle[0]
+            await self._discard(key, pooled)
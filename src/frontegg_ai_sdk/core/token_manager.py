@@ -0,0 +1,186 @@
+"""
+Token Manager Module
+
+This module manages the vendor JWT used to authenticate against the MCP
+endpoint: concurrent refreshes share a single request, and the token can be
+renewed in the background before it expires.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .logger import default_logger
+from .metrics import JWT_REFRESH_DURATION, JWT_REFRESH_ERRORS, NOOP_METRICS, MetricsSink, error_code
+
+# Delay before retrying a failed background renewal
+RENEWAL_RETRY_DELAY = 5.0
+
+
+@dataclass
+class TokenRefreshStats:
+    """
+    Counters describing vendor JWT refreshes.
+    """
+    refresh_count: int = 0
+    failure_count: int = 0
+    total_latency: float = 0.0
+    last_latency: Optional[float] = None
+    last_error: Optional[str] = None
+
+    @property
+    def average_latency(self) -> Optional[float]:
+        if self.refresh_count == 0:
+            return None
+        return self.total_latency / self.refresh_count
+
+
+class VendorTokenManager:
+    """
+    Single-flight cache for the vendor JWT.
+
+    Only one refresh request is in flight at a time; every other caller awaits
+    its result. With background refresh enabled, the token is renewed once a
+    configurable fraction of its lifetime has passed, so callers never block on
+    token creation while the auth endpoint is healthy.
+    """
+
+    def __init__(
+        self,
+        create_token: Callable[[], Awaitable[Dict[str, Any]]],
+        logger: Optional[logging.Logger] = None,
+        background_refresh: bool = False,
+        refresh_fraction: float = 0.8,
+        metrics: Optional[MetricsSink] = None,
+    ):
+        """
+        Initialize the token manager.
+
+        Args:
+            create_token: Coroutine function returning a dict with `token` and `expiration`
+            logger: Logger instance (optional)
+            background_refresh: Whether to renew the token before it expires
+            refresh_fraction: Fraction of the token lifetime after which it is renewed
+            metrics: Sink refresh durations and failures are reported to (optional)
+        """
+        if not 0 < refresh_fraction < 1:
+            raise ValueError("refresh_fraction must be between 0 and 1")
+
+        self.create_token = create_token
+        self.logger = logger or default_logger
+        self.background_refresh = background_refresh
+        self.refresh_fraction = refresh_fraction
+        self.metrics = metrics or NOOP_METRICS
+        self.token: Optional[Dict[str, Any]] = None
+        self.stats = TokenRefreshStats()
+        self._inflight: Optional[asyncio.Task] = None
+        self._renewal: Optional[asyncio.Task] = None
+        self._renew_at = 0.0
+
+    def is_valid(self) -> bool:
+        return self.token is not None and self.token['expiration'] > datetime.now()
+
+    async def get_token(self) -> Dict[str, Any]:
+        """
+        Return a valid token, refreshing it if needed.
+
+        Returns:
+            Dictionary containing the token and expiration date
+        """
+        if self.is_valid():
+            return self.token
+        return await self.refresh()
+
+    async def refresh(self) -> Dict[str, Any]:
+        """
+        Refresh the token, joining the refresh already in flight if there is one.
+
+        Returns:
+            Dictionary containing the token and expiration date
+        """
+        loop = asyncio.get_running_loop()
+        task = self._inflight
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._refresh())
+            self._inflight = task
+        # Shield so a cancelled caller does not abort the refresh for the others
+        return await asyncio.shield(task)
+
+    async def aclose(self) -> None:
+        """
+        Stop the background renewal task.
+        """
+        renewal = self._renewal
+        self._renewal = None
+        if renewal is not None and not renewal.done():
+            _cancel_task(renewal)
+            if renewal.get_loop() is asyncio.get_running_loop():
+                try:
+                    await renewal
+                except asyncio.CancelledError:
+                    pass
+
+    async def _refresh(self) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            token = await self.create_token()
+        except Exception as error:
+            self.stats.failure_count += 1
+            self.stats.last_error = str(error)
+            self.metrics.increment(JWT_REFRESH_ERRORS, tags={"error": error_code(error)})
+            raise
+
+        latency = time.perf_counter() - started
+        self.metrics.observe(JWT_REFRESH_DURATION, latency)
+        self.stats.refresh_count += 1
+        self.stats.total_latency += latency
+        self.stats.last_latency = latency
+        self.token = token
+
+        if self.background_refresh:
+            lifetime = (token['expiration'] - datetime.now()).total_seconds()
+            self._renew_at = time.monotonic() + max(lifetime, 0) * self.refresh_fraction
+            self._ensure_renewal()
+        return token
+
+    def _ensure_renewal(self) -> None:
+        loop = asyncio.get_running_loop()
+        renewal = self._renewal
+        if renewal is None or renewal.done() or renewal.get_loop() is not loop:
+            if renewal is not None and not renewal.done():
+                # Renewed from this loop from now on
+                _cancel_task(renewal)
+            self._renewal = loop.create_task(self._renewal_loop())
+
+    async def _renewal_loop(self) -> None:
+        while True:
+            delay = self._renew_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                # The token may have been refreshed by a caller in the meantime
+                continue
+            try:
+                await self.refresh()
+            except Exception as error:
+                self.logger.warning(f"Background vendor JWT renewal failed: {error}")
+                if not self.is_valid():
+                    return
+                await asyncio.sleep(RENEWAL_RETRY_DELAY)
+
+
+def _cancel_task(task: asyncio.Task) -> None:
+    """
+    Cancel a task from any thread, on the event loop it belongs to.
+    """
+    loop = task.get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is running:
+        task.cancel()
+    elif not loop.is_closed():
+        loop.call_soon_threadsafe(task.cancel)
@@ -0,0 +1,140 @@
+"""
+Tool Dispatcher Module
+
+This module bounds how many synchronous tool calls, such as CrewAI tool runs
+from worker threads, are dispatched to the client at once.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+
+@dataclass
+class ToolDispatchStats:
+    """
+    Counters describing dispatched tool calls and the time they spent queued.
+    """
+    calls: int = 0
+    queued: int = 0
+    in_flight: int = 0
+    total_queue_wait: float = 0.0
+    max_queue_wait: float = 0.0
+    last_queue_wait: Optional[float] = None
+
+    @property
+    def average_queue_wait(self) -> Optional[float]:
+        if self.calls == 0:
+            return None
+        return self.total_queue_wait / self.calls
+
+
+class ToolDispatcher:
+    """
+    Thread-safe admission control for synchronous tool calls.
+
+    A call first waits for a slot of its own tool, then for one of the global
+    slots, so a single busy tool cannot occupy every slot. Callers block in
+    their own thread while queued; the event loop serving the calls is never
+    blocked.
+    """
+
+    def __init__(self, max_concurrency: int = 32, max_concurrency_per_tool: int = 8):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            max_concurrency: Maximum number of tool calls running at once, or 0 for no limit
+            max_concurrency_per_tool: Maximum number of calls of one tool running at once, or 0 for no limit
+        """
+        if max_concurrency < 0 or max_concurrency_per_tool < 0:
+            raise ValueError("concurrency limits must not be negative")
+
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_tool = max_concurrency_per_tool
+        self._global_slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._tool_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._stats = ToolDispatchStats()
+        self._tool_stats: Dict[str, ToolDispatchStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> ToolDispatchStats:
+        """
+        Snapshot of the counters across all tools.
+        """
+        with self._lock:
+            return replace(self._stats)
+
+    def tool_stats(self) -> Dict[str, ToolDispatchStats]:
+        """
+        Snapshot of the counters of each tool dispatched so far.
+        """
+        with self._lock:
+            return {name: replace(stats) for name, stats in self._tool_stats.items()}
+
+    def run(self, tool_name: str, fn: Callable[[], T]) -> T:
+        """
+        Run `fn` once a slot for `tool_name` is available.
+
+        Args:
+            tool_name: Name of the tool being called
+            fn: Blocking function performing the call
+
+        Returns:
+            The result of `fn`
+        """
+        with self._slot(tool_name):
+            return fn()
+
+    @contextmanager
+    def _slot(self, tool_name: str) -> Iterator[None]:
+        with self._lock:
+            tool_stats = self._tool_stats.get(tool_name)
+            if tool_stats is None:
+                tool_stats = self._tool_stats[tool_name] = ToolDispatchStats()
+            tool_slots = self._tool_slots.get(tool_name)
+            if tool_slots is None and self.max_concurrency_per_tool:
+                tool_slots = self._tool_slots[tool_name] = threading.BoundedSemaphore(
+                    self.max_concurrency_per_tool
+                )
+            for stats in (self._stats, tool_stats):
+                stats.queued += 1
+
+        started = time.perf_counter()
+        acquired = []
+        try:
+            for slots in (tool_slots, self._global_slots):
+                if slots is not None:
+                    slots.acquire()
+                    acquired.append(slots)
+        except BaseException:
+            for slots in reversed(acquired):
+                slots.release()
+            with self._lock:
+                for stats in (self._stats, tool_stats):
+                    stats.queued -= 1
+            raise
+
+        wait = time.perf_counter() - started
+        with self._lock:
+            for stats in (self._stats, tool_stats):
+                stats.queued -= 1
+                stats.in_flight += 1
+                stats.calls += 1
+                stats.total_queue_wait += wait
+                stats.max_queue_wait = max(stats.max_queue_wait, wait)
+                stats.last_queue_wait = wait
+
+        try:
+            yield
+        finally:
+            for slots in reversed(acquired):
+                slots.release()
+            with self._lock:
+                for stats in (self._stats, tool_stats):
+                    stats.in_flight -= 1
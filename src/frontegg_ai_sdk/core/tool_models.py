@@ -0,0 +1,81 @@
+"""
+Tool Models Module
+
+This module builds Pydantic input models from MCP tool input schemas. Models
+and their resolved JSON schemas are memoized by schema hash and shared by all
+tool adapters.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Type
+
+import jsonref
+from mcpadapt.utils.modeling import create_model_from_json_schema
+from pydantic import BaseModel
+
+from .cache import TTLCache, stable_hash
+
+# Upper bound on memoized input models and resolved schemas
+MAX_CACHED_INPUT_MODELS = 1024
+
+_input_models: TTLCache[Type[BaseModel]] = TTLCache(max_entries=MAX_CACHED_INPUT_MODELS)
+_resolved_schemas: TTLCache[Dict[str, Any]] = TTLCache(max_entries=MAX_CACHED_INPUT_MODELS)
+_lock = threading.Lock()
+
+
+def clear_model_cache() -> None:
+    """
+    Drop all memoized input models and resolved schemas.
+    """
+    with _lock:
+        _input_models.invalidate()
+        _resolved_schemas.invalidate()
+
+
+def input_model(input_schema: Dict[str, Any], schema_hash: Optional[str] = None) -> Type[BaseModel]:
+    """
+    Return the Pydantic model for an MCP input schema, building it on first use.
+
+    Args:
+        input_schema: JSON schema of the tool arguments
+        schema_hash: Precomputed `stable_hash` of the schema (optional)
+
+    Returns:
+        Pydantic model validating the tool arguments
+    """
+    schema_hash = schema_hash or stable_hash(input_schema)
+    with _lock:
+        model = _input_models.get(schema_hash)
+        if model is None:
+            model = create_model_from_json_schema(input_schema)
+            _input_models.set(schema_hash, model)
+        return model
+
+
+def resolved_args_schema(schema_hash: str, args_schema: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Return the JSON schema of an input model with all `$ref`s resolved.
+
+    The resolved schema is computed once per input schema hash and shared by
+    every tool with the same arguments.
+
+    Args:
+        schema_hash: Hash of the MCP input schema the model was built from
+        args_schema: Pydantic input model
+
+    Returns:
+        The resolved schema without its `$defs`
+    """
+    with _lock:
+        resolved = _resolved_schemas.get(schema_hash)
+    if resolved is None:
+        resolved = {
+            k: v
+            for k, v in jsonref.replace_refs(
+                args_schema.model_json_schema()
+            ).items()
+            if k != "$defs"
+        }
+        with _lock:
+            _resolved_schemas.set(schema_hash, resolved)
+    return resolved
@@ -0,0 +1,285 @@
+"""
+Tool Results Module
+
+This module defines the result types returned by the batched and streaming
+tool call APIs, and the buffers large binary content is decoded into.
+"""
+
+import base64
+import binascii
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+
+import mcp.types as types
+
+from .buffers import DEFAULT_SPILL_THRESHOLD, SpillBuffer
+
+# Base64 characters decoded at a time; a multiple of 4, so chunks decode independently
+_BASE64_CHUNK = 4 * 256 * 1024
+
+
+@dataclass
+class ToolCallOutcome:
+    """
+    Outcome of a single call made through `call_tools_many`.
+
+    Exactly one of `result` and `error` is set. A tool that ran but reported a
+    failure returns a result with `isError` set, which also counts as not ok.
+    """
+    index: int
+    name: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    result: Optional[types.CallToolResult] = None
+    error: Optional[BaseException] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and not getattr(self.result, 'isError', False)
+
+
+@dataclass
+class ToolProgress:
+    """
+    Progress notification received while a streamed tool call runs.
+    """
+    progress: float
+    total: Optional[float] = None
+    message: Optional[str] = None
+
+
+@dataclass
+class ToolContent:
+    """
+    A single content item of a streamed tool call result.
+    """
+    item: Union[types.TextContent, types.ImageContent, types.EmbeddedResource]
+
+
+@dataclass
+class ToolResult:
+    """
+    Final event of a streamed tool call, carrying the complete result.
+    """
+    result: types.CallToolResult
+
+
+ToolStreamEvent = Union[ToolProgress, ToolContent, ToolResult]
+
+
+class BinaryContent:
+    """
+    Decoded bytes of an image or embedded blob of a tool result, returned by
+    `call_tool_binary` alongside the result.
+
+    The bytes are decoded when the result arrives, a chunk at a time, into a
+    single buffer, which moves to a temporary file once larger than the spill
+    threshold. Read them through
+    `memoryview()` without copying, or with `read()` and `copy_to()`. `close()`
+    releases the buffer; otherwise it is released once the object is collected.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        type: str,
+        buffer: SpillBuffer,
+        mimeType: Optional[str] = None,
+        uri: Optional[str] = None,
+    ):
+        """
+        Initialize the content.
+
+        Args:
+            index: Position of the content item in the result
+            type: Type of the content item, "image" or "resource"
+            buffer: Buffer holding the decoded bytes
+            mimeType: MIME type of the content
+            uri: URI of the embedded resource, if any
+        """
+        self.index = index
+        self.type = type
+        self.mimeType = mimeType
+        self.uri = uri
+        self._buffer = buffer
+
+    @classmethod
+    def from_base64(
+        cls,
+        data: str,
+        index: int,
+        type: str,
+        mimeType: Optional[str] = None,
+        uri: Optional[str] = None,
+        spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+    ) -> "BinaryContent":
+        """
+        Decode base64 text a chunk at a time into a new buffer.
+
+        Runs synchronously, writing to a temporary file once the bytes pass
+        `spill_threshold`, so call it off the event loop for large content.
+
+        Args:
+            data: Base64 text
+            index: Position of the content item in the result
+            type: Type of the content item
+            mimeType: MIME type of the content
+            uri: URI of the embedded resource, if any
+            spill_threshold: Decoded size above which the bytes are kept in a temporary file
+
+        Returns:
+            The decoded content
+        """
+        size = len(data) // 4 * 3 - len(data[-2:]) + len(data[-2:].rstrip("="))
+        buffer = SpillBuffer(spill_threshold, size)
+        try:
+            try:
+                for start in range(0, len(data), _BASE64_CHUNK):
+                    buffer.write(base64.b64decode(data[start:start + _BASE64_CHUNK], validate=True))
+            except binascii.Error:
+                # Not plain base64, e.g. wrapped in lines: decode again, skipping whitespace
+                buffer.close()
+                buffer = SpillBuffer(spill_threshold, size)
+                for chunk in _unwrapped_chunks(data):
+                    buffer.write(binascii.a2b_base64(chunk))
+        except BaseException:
+            buffer.close()
+            raise
+        return cls(index, type, buffer, mimeType, uri)
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __enter__(self) -> "BinaryContent":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"BinaryContent(index={self.index}, type={self.type!r}, mimeType={self.mimeType!r}, "
+            f"uri={self.uri!r}, size={len(self)})"
+        )
+
+    @property
+    def spilled(self) -> bool:
+        """
+        Whether the bytes are kept in a temporary file.
+        """
+        return self._buffer.spilled
+
+    def memoryview(self) -> memoryview:
+        """
+        Return a read-only view of the bytes, valid until the content is closed.
+        """
+        return self._buffer.view()
+
+    def read(self) -> bytes:
+        """
+        Return a copy of the bytes.
+        """
+        return bytes(self.memoryview())
+
+    def copy_to(self, file: BinaryIO, chunk_size: int = 1024 * 1024) -> None:
+        """
+        Write the bytes to a binary file object, a chunk at a time.
+        """
+        view = self.memoryview()
+        for start in range(0, len(view), chunk_size):
+            file.write(view[start:start + chunk_size])
+
+    def close(self) -> None:
+        """
+        Release the memory or temporary file holding the bytes.
+        """
+        self._buffer.close()
+
+
+@dataclass
+class BinaryToolResult:
+    """
+    Result of `call_tool_binary`: the tool result with its large base64 content
+    emptied, and the decoded bytes of that content.
+
+    Each call gets its own result copy and buffers, so closing them never
+    affects another caller, even one whose call was coalesced with this one.
+    """
+    result: types.CallToolResult
+    binaries: List[BinaryContent] = field(default_factory=list)
+
+    def __enter__(self) -> "BinaryToolResult":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the buffers of every decoded item.
+        """
+        for binary in self.binaries:
+            binary.close()
+
+
+def decode_binary_content(
+    result: types.CallToolResult,
+    threshold: int,
+    spill_threshold: int = DEFAULT_SPILL_THRESHOLD,
+) -> BinaryToolResult:
+    """
+    Decode the image and embedded blob items of a result whose base64 text is
+    longer than `threshold`.
+
+    The result is not modified. The returned copy keeps every content item,
+    with the base64 text of the decoded ones emptied, so it stays a valid
+    `CallToolResult` and the text can be freed once the original is dropped.
+    Decoding blocks, so async callers run this in a worker thread.
+
+    Args:
+        result: Tool result
+        threshold: Length of base64 text above which an item is decoded
+        spill_threshold: Decoded size above which the bytes are kept in a temporary file
+
+    Returns:
+        The result copy and the decoded items
+    """
+    content: List[Any] = []
+    binaries: List[BinaryContent] = []
+    try:
+        for index, item in enumerate(result.content):
+            if isinstance(item, types.ImageContent) and len(item.data) > threshold:
+                binaries.append(BinaryContent.from_base64(
+                    item.data, index, item.type, item.mimeType, spill_threshold=spill_threshold,
+                ))
+                item = item.model_copy(update={"data": ""})
+            elif (
+                isinstance(item, types.EmbeddedResource)
+                and isinstance(item.resource, types.BlobResourceContents)
+                and len(item.resource.blob) > threshold
+            ):
+                binaries.append(BinaryContent.from_base64(
+                    item.resource.blob, index, item.type, item.resource.mimeType, str(item.resource.uri),
+                    spill_threshold=spill_threshold,
+                ))
+                item = item.model_copy(update={"resource": item.resource.model_copy(update={"blob": ""})})
+            content.append(item)
+    except BaseException:
+        for binary in binaries:
+            binary.close()
+        raise
+    return BinaryToolResult(result.model_copy(update={"content": content}), binaries)
+
+
+def _unwrapped_chunks(data: str) -> Iterator[str]:
+    """
+    Yield base64 text without its whitespace, in chunks that decode independently.
+    """
+    pending = ""
+    for start in range(0, len(data), _BASE64_CHUNK):
+        pending += "".join(data[start:start + _BASE64_CHUNK].split())
+        usable = len(pending) - len(pending) % 4
+        yield pending[:usable]
+        pending = pending[usable:]
+    if pending:
+        yield pending
@@ -0,0 +1,126 @@
+"""
+Tracing Module
+
+This module wraps the OpenTelemetry tracing API used by the client and the
+transport to record spans and propagate trace context to the server. Without
+`opentelemetry-api` installed, every helper is a no-op. OpenTelemetry is
+imported when the first tracer is requested, not when the SDK is imported.
+"""
+
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+TRACER_NAME = "frontegg_ai_sdk"
+
+# OpenTelemetry API modules, loaded by `get_tracer`
+otel_context: Any = None
+otel_propagate: Any = None
+otel_trace: Any = None
+
+
+def _load_opentelemetry() -> bool:
+    global otel_context, otel_propagate, otel_trace
+    if otel_trace is None:
+        try:
+            from opentelemetry import context, propagate, trace
+        except ImportError:  # Optional, installed with the `opentelemetry` extra
+            return False
+        otel_context, otel_propagate, otel_trace = context, propagate, trace
+    return True
+
+
+def get_tracer(enabled: bool = True) -> Optional[Any]:
+    """
+    Return the SDK's tracer from the global tracer provider.
+
+    Args:
+        enabled: Whether tracing is enabled
+
+    Returns:
+        The tracer, or None if tracing is disabled or OpenTelemetry is not installed
+    """
+    if not enabled or not _load_opentelemetry():
+        return None
+    return otel_trace.get_tracer(TRACER_NAME)
+
+
+def current_context(tracer: Optional[Any]) -> Optional[Any]:
+    """
+    Capture the current trace context, to parent spans started in another task.
+    """
+    if tracer is None:
+        return None
+    return otel_context.get_current()
+
+
+def root_context(tracer: Optional[Any]) -> Optional[Any]:
+    """
+    Return an empty trace context, for spans that must not inherit the current one.
+    """
+    if tracer is None:
+        return None
+    return otel_context.Context()
+
+
+@contextmanager
+def start_span(
+    tracer: Optional[Any],
+    name: str,
+    attributes: Optional[Mapping[str, Any]] = None,
+    client: bool = False,
+    parent: Optional[Any] = None,
+) -> Iterator[Optional[Any]]:
+    """
+    Start a span and make it current for the duration of the block.
+
+    Exceptions raised in the block are recorded on the span and mark it as failed.
+
+    Args:
+        tracer: Tracer from `get_tracer`; nothing is recorded when None
+        name: Name of the span
+        attributes: Attributes set on the span; None values are skipped
+        client: Whether the span is an outgoing request (span kind CLIENT)
+        parent: Trace context to start the span in, instead of the current one
+
+    Yields:
+        The span, or None when tracing is disabled
+    """
+    if tracer is None:
+        yield None
+        return
+
+    kind = otel_trace.SpanKind.CLIENT if client else otel_trace.SpanKind.INTERNAL
+    with tracer.start_as_current_span(
+        name,
+        context=parent,
+        kind=kind,
+        attributes={key: value for key, value in (attributes or {}).items() if value is not None},
+    ) as span:
+        yield span
+
+
+def set_attribute(span: Optional[Any], key: str, value: Any) -> None:
+    if span is not None and value is not None:
+        span.set_attribute(key, value)
+
+
+def add_event(tracer: Optional[Any], name: str, attributes: Optional[Mapping[str, Any]] = None) -> None:
+    """
+    Add an event to the current span.
+    """
+    if tracer is None:
+        return
+    span = otel_trace.get_current_span()
+    if span.is_recording():
+        span.add_event(
+            name, {key: value for key, value in (attributes or {}).items() if value is not None}
+        )
+
+
+def inject_trace_context(tracer: Optional[Any], headers: Dict[str, Any]) -> None:
+    """
+    Add the `traceparent` (and any other configured propagation) headers of the
+    current span to outgoing request headers.
+    """
+    if tracer is not None:
+        otel_propagate.inject(headers)
@@ -0,0 +1,51 @@
+import logging
+import os
+import sys
+from typing import Any, Optional
+
+import pytest
+
+# Add the src and benchmarks directories to the Python path
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from frontegg_ai_sdk import Environment, FronteggAiClient, FronteggAiClientConfig, setup_logger
+from frontegg_ai_sdk.core.config import ClientRetryConfiguration
+from stub_server import StubMcpServer
+
+QUIET_LOGGER = setup_logger(name="frontegg_ai_sdk_tests", level=logging.CRITICAL)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def server():
+    return StubMcpServer(tool_count=3)
+
+
+@pytest.fixture
+def make_client(server):
+    """
+    Return a factory of clients whose requests, vendor JWT included, are served by the stub.
+    """
+    def factory(stub: Optional[StubMcpServer] = None, **config: Any) -> FronteggAiClient:
+        config.setdefault("tools_cache_ttl", 0)
+        config.setdefault("tracing", False)
+        config.setdefault("retry", ClientRetryConfiguration(delay_in_ms=1, jitter=0))
+        return FronteggAiClient(
+            FronteggAiClientConfig(
+                environment=Environment.US,
+                agent_id="test-agent",
+                client_id="test-client",
+                client_secret="test-secret",
+                **config,
+            ),
+            logger=QUIET_LOGGER,
+            http_client=(stub or server).http_client(),
+        )
+
+    return factory
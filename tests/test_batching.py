@@ -0,0 +1,76 @@
+import json
+import time
+
+import anyio
+import pytest
+from mcp.types import JSONRPCMessage, JSONRPCNotification, JSONRPCRequest
+
+from frontegg_ai_sdk.core.httpTransport import streamablehttp_client
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_calls_are_batched_and_outcomes_keep_their_order(server, make_client):
+    calls = [("tool_0", {"query": str(index)}) for index in range(12)]
+    async with make_client(batch_window=0.01, max_batch_size=16) as client:
+        outcomes = await client.call_tools_many(calls, concurrency=12)
+
+    assert [outcome.index for outcome in outcomes] == list(range(12))
+    for index, outcome in enumerate(outcomes):
+        assert outcome.ok
+        assert json.loads(outcome.result.content[0].text) == {"query": str(index)}
+    batches = [methods for methods in server.stats.posted_methods if "tools/call" in methods]
+    assert len(batches) < 12
+    assert sum(methods.count("tools/call") for methods in batches) == 12
+
+
+async def test_as_completed_yields_every_call(server, make_client):
+    calls = [("tool_0", {"query": str(index)}) for index in range(5)]
+    async with make_client(batch_window=0.005, max_batch_size=4) as client:
+        async with client.call_tools_as_completed(calls) as outcomes:
+            indexes = [outcome.index async for outcome in outcomes]
+
+    assert sorted(indexes) == list(range(5))
+
+
+async def test_failed_call_does_not_fail_the_others(server, make_client):
+    server.fail("tools/call", status=400)
+    async with make_client() as client:
+        outcomes = await client.call_tools_many([("tool_0", {"query": "a"}), ("tool_1", {"query": "b"})], concurrency=1)
+
+    assert [outcome.ok for outcome in outcomes] == [False, True]
+
+
+@pytest.mark.parametrize("batching", [True, False])
+async def test_notification_does_not_overtake_its_request(server, batching):
+    options = {"batch_window": 0.005, "max_batch_size": 8} if batching else {}
+    server.tool_latency["tool_0"] = 0.05
+    async with streamablehttp_client(
+        "https://mcp.example.com/mcp/v1", http_client=server.http_client(), **options
+    ) as (read_stream, write_stream, _):
+        await write_stream.send(JSONRPCMessage(JSONRPCRequest(
+            jsonrpc="2.0", id=0, method="initialize", params={},
+        )))
+        await read_stream.receive()
+        await write_stream.send(JSONRPCMessage(JSONRPCRequest(
+            jsonrpc="2.0", id=1, method="tools/call", params={"name": "tool_0"},
+        )))
+        await anyio.sleep(0.02)
+        await write_stream.send(JSONRPCMessage(JSONRPCNotification(
+            jsonrpc="2.0", method="notifications/cancelled", params={"requestId": 1},
+        )))
+        await read_stream.receive()
+
+    assert server.stats.posted_methods == [["initialize"], ["tools/call"], ["notifications/cancelled"]]
+
+
+async def test_leaving_as_completed_early_cancels_the_other_calls(make_client):
+    server = StubMcpServer(tool_count=2, tool_latency={"tool_1": 1})
+    async with make_client(stub=server) as client:
+        started = time.monotonic()
+        async with client.call_tools_as_completed([("tool_0", {}), ("tool_1", {})]) as outcomes:
+            async for outcome in outcomes:
+                assert outcome.name == "tool_0"
+                break
+        assert time.monotonic() - started < 0.5
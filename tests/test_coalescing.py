@@ -0,0 +1,61 @@
+import anyio
+import pytest
+
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def server():
+    return StubMcpServer(tool_count=2, tool_latency={"tool_0": 0.05, "tool_1": 0.05})
+
+
+async def gather(*calls):
+    results = [None] * len(calls)
+
+    async def run(index, call):
+        results[index] = await call()
+
+    async with anyio.create_task_group() as tg:
+        for index, call in enumerate(calls):
+            tg.start_soon(run, index, call)
+    return results
+
+
+async def test_identical_concurrent_calls_share_one_request(server, make_client):
+    async with make_client(coalesce_tool_calls=True, coalesce_tools=["tool_0"]) as client:
+        results = await gather(*[lambda: client.call_tool("tool_0", {"query": "a"})] * 4)
+
+    assert server.stats.tool_calls == 1
+    assert client.coalescing_stats.coalesced == 3
+    assert all(result.content[0].text == results[0].content[0].text for result in results)
+
+
+async def test_calls_are_keyed_by_context_and_arguments(server, make_client):
+    async with make_client(coalesce_tool_calls=True, coalesce_tools=["tool_0"]) as client:
+        await gather(
+            lambda: client.for_context("tenant-1").call_tool("tool_0", {"query": "a"}),
+            lambda: client.for_context("tenant-2").call_tool("tool_0", {"query": "a"}),
+            lambda: client.for_context("tenant-1", user_id="user-1").call_tool("tool_0", {"query": "a"}),
+            lambda: client.for_context("tenant-1").call_tool("tool_0", {"query": "b"}),
+        )
+
+    assert server.stats.tool_calls == 4
+    assert client.coalescing_stats.coalesced == 0
+
+
+async def test_only_eligible_tools_are_coalesced(server, make_client):
+    async with make_client(coalesce_tool_calls=True, coalesce_tools=["tool_0"]) as client:
+        await gather(*[lambda: client.call_tool("tool_1", {"query": "a"})] * 3)
+
+    assert server.stats.tool_calls == 3
+
+
+async def test_read_only_tools_are_coalesced_once_listed(make_client):
+    server = StubMcpServer(tool_count=1, tool_latency={"tool_0": 0.05}, tool_annotations={"tool_0": {"readOnlyHint": True}})
+    async with make_client(stub=server, coalesce_tool_calls=True) as client:
+        await client.list_tools()
+        await gather(*[lambda: client.call_tool("tool_0", {"query": "a"})] * 3)
+
+    assert server.stats.tool_calls == 1
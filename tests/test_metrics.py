@@ -0,0 +1,36 @@
+import pytest
+
+from frontegg_ai_sdk import InMemoryMetricsSink, PrometheusMetricsSink
+from frontegg_ai_sdk.core.metrics import TOOL_CALL_DURATION
+
+
+def test_histograms_keep_the_most_recent_samples():
+    sink = InMemoryMetricsSink(max_samples=3)
+    for value in range(5):
+        sink.observe("latency", value)
+
+    summary = sink.histogram("latency")
+    assert list(summary.samples) == [2, 3, 4]
+    assert summary.count == 5
+    assert summary.percentile(100) == 4
+
+
+def test_prometheus_sinks_sharing_a_registry_share_collectors():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    first, second = PrometheusMetricsSink(registry=registry), PrometheusMetricsSink(registry=registry)
+    first.observe(TOOL_CALL_DURATION, 0.5, {"tool": "a", "outcome": "ok"})
+    second.observe(TOOL_CALL_DURATION, 1.5, {"tool": "a", "outcome": "ok"})
+
+    labels = {"tool": "a", "outcome": "ok"}
+    assert registry.get_sample_value("frontegg_ai_sdk_tool_call_duration_count", labels) == 2
+    assert registry.get_sample_value("frontegg_ai_sdk_tool_call_duration_sum", labels) == 2.0
+
+
+def test_prometheus_sink_reports_names_taken_outside_the_sdk():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    prometheus_client.Counter("frontegg_ai_sdk_sse_events", "Taken", registry=registry)
+
+    with pytest.raises(ValueError, match="outside the SDK"):
+        PrometheusMetricsSink(registry=registry).increment("sse.events", tags={"source": "SSE"})
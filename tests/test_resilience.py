@@ -0,0 +1,166 @@
+import anyio
+import httpx
+import pytest
+from mcp.shared.exceptions import McpError
+
+from frontegg_ai_sdk import CircuitOpenError, CircuitState
+from frontegg_ai_sdk.core.config import ClientRetryConfiguration
+from frontegg_ai_sdk.core.resilience import (
+    AdaptiveConcurrencyLimiter,
+    CircuitBreaker,
+    ConcurrencyLimitExceededError,
+    is_endpoint_failure,
+)
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+NO_RETRY = ClientRetryConfiguration(tries=1)
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.CLOSED
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_success_resets_the_failure_count():
+    breaker = CircuitBreaker(failure_threshold=2)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state is CircuitState.CLOSED
+
+
+async def test_breaker_probes_after_the_recovery_timeout():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.05)
+    breaker.record_failure()
+    await anyio.sleep(0.06)
+    assert breaker.state is CircuitState.HALF_OPEN
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        # A single probe is let through at a time
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state is CircuitState.OPEN
+
+    await anyio.sleep(0.06)
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state is CircuitState.CLOSED
+
+
+async def test_client_sheds_calls_while_the_circuit_is_open(server, make_client):
+    server.fail("tools/call", count=2, status=503)
+    async with make_client(circuit_failure_threshold=2, circuit_recovery_timeout=60, retry=NO_RETRY) as client:
+        for _ in range(2):
+            with pytest.raises(McpError):
+                await client.call_tool("tool_0", {"query": "a"})
+        assert client.circuit_state is CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            await client.call_tool("tool_0", {"query": "a"})
+
+
+async def test_tool_and_client_errors_do_not_open_the_circuit(server, make_client):
+    server.fail("tools/call", count=3, status=400)
+    async with make_client(circuit_failure_threshold=2, retry=NO_RETRY) as client:
+        for _ in range(3):
+            with pytest.raises(McpError):
+                await client.call_tool("tool_0", {"query": "a"})
+        assert client.circuit_state is CircuitState.CLOSED
+
+
+async def test_read_timeouts_open_the_circuit(server, make_client):
+    server.fail("tools/call", count=2, error=httpx.ReadTimeout("Stub timed out"))
+    async with make_client(circuit_failure_threshold=2, retry=NO_RETRY) as client:
+        for _ in range(2):
+            with pytest.raises(McpError) as raised:
+                await client.call_tool("tool_0", {"query": "a"})
+            assert is_endpoint_failure(raised.value)
+        assert client.circuit_state is CircuitState.OPEN
+
+
+async def test_expired_deadlines_count_as_endpoint_failures(make_client):
+    server = StubMcpServer(tool_count=1, tool_latency={"tool_0": 1})
+    async with make_client(
+        stub=server, circuit_failure_threshold=1, adaptive_concurrency=True, adaptive_concurrency_initial_limit=16,
+    ) as client:
+        with pytest.raises(TimeoutError):
+            await client.call_tool("tool_0", {"query": "a"}, timeout=0.05)
+
+        assert client.circuit_state is CircuitState.OPEN
+        assert client.concurrency_limiter.limit < 16
+        assert client.concurrency_limiter.in_flight == 0
+
+
+async def test_expired_deadlines_of_concurrent_calls_count_as_endpoint_failures(make_client):
+    server = StubMcpServer(tool_count=1, tool_latency={"tool_0": 1})
+    async with make_client(stub=server, circuit_failure_threshold=2) as client:
+        outcomes = await client.call_tools_many([("tool_0", {"query": "a"})] * 2, timeout=0.05)
+
+        assert all(isinstance(outcome.error, TimeoutError) for outcome in outcomes)
+        assert client.circuit_state is CircuitState.OPEN
+
+
+def test_timeouts_and_broken_responses_are_endpoint_failures():
+    assert is_endpoint_failure(httpx.ReadTimeout("timed out"))
+    assert is_endpoint_failure(httpx.WriteTimeout("timed out"))
+    assert is_endpoint_failure(httpx.ReadError("connection reset"))
+    assert not is_endpoint_failure(ValueError("bad arguments"))
+
+
+async def test_limiter_backs_off_on_failures_and_grows_back():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=20)
+    await limiter.acquire()
+    limiter.release(0.01, failed=True)
+    assert limiter.limit == 7
+
+    for _ in range(4):
+        await limiter.acquire()
+    for _ in range(20):
+        # Growth needs at least half of the limit in use
+        limiter.release(0.01, failed=False)
+        await limiter.acquire()
+    assert limiter.limit > 7
+
+
+async def test_limiter_backs_off_on_slow_calls():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, latency_tolerance=2.0)
+    await limiter.acquire()
+    await limiter.acquire()
+    limiter.release(0.01, failed=False)
+    limiter.release(0.5, failed=False)
+
+    assert limiter.limit == 7
+
+
+async def test_limiter_rejects_calls_waiting_past_the_queue_timeout():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout=0.05)
+    await limiter.acquire()
+    with pytest.raises(ConcurrencyLimitExceededError):
+        await limiter.acquire()
+    assert limiter.stats.rejected == 1
+
+    limiter.release(0.01, failed=False)
+    await limiter.acquire()
+    assert limiter.in_flight == 1
+
+
+async def test_client_limiter_shrinks_on_endpoint_failures(server, make_client):
+    server.fail("tools/call", count=3, status=503)
+    async with make_client(
+        adaptive_concurrency=True, adaptive_concurrency_initial_limit=16, circuit_breaker=False, retry=NO_RETRY,
+    ) as client:
+        for _ in range(3):
+            with pytest.raises(McpError):
+                await client.call_tool("tool_0", {"query": "a"})
+        assert client.concurrency_limiter.limit < 16
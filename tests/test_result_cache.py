@@ -0,0 +1,125 @@
+import threading
+import time
+
+import anyio
+import pytest
+
+from frontegg_ai_sdk import DiskResultCache, MemoryResultCache, RedisResultCache, ResultCache
+from frontegg_ai_sdk.core.result_cache import InMemoryRedis, result_cache_key
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(params=["memory", "disk", "redis"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryResultCache()
+    if request.param == "disk":
+        return DiskResultCache(str(tmp_path))
+    return RedisResultCache(InMemoryRedis())
+
+
+async def test_entries_expire_after_their_ttl(cache):
+    await cache.set("key", b"value", 0.05)
+    assert await cache.get("key") == b"value"
+
+    await anyio.sleep(0.06)
+    assert await cache.get("key") is None
+
+
+async def test_delete_and_clear(cache):
+    await cache.set("a", b"1", 10)
+    await cache.set("b", b"2", 10)
+    await cache.delete("a")
+    assert await cache.get("a") is None
+    assert await cache.get("b") == b"2"
+
+    await cache.clear()
+    assert await cache.get("b") is None
+
+
+async def test_memory_cache_evicts_least_recently_used_entries():
+    cache = MemoryResultCache(max_bytes=10)
+    await cache.set("a", b"1234", 10)
+    await cache.set("b", b"1234", 10)
+    await cache.get("a")
+    await cache.set("c", b"1234", 10)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == b"1234"
+    assert cache.size == 8
+
+
+async def test_disk_cache_evicts_past_max_bytes(tmp_path):
+    cache = DiskResultCache(str(tmp_path), max_bytes=40)
+    await cache.set("a", b"x" * 16, 10)
+    await cache.set("b", b"x" * 16, 10)
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == b"x" * 16
+
+
+def test_disk_cache_keeps_an_entry_rewritten_while_a_stale_one_was_read(tmp_path):
+    cache = DiskResultCache(str(tmp_path))
+    cache._set("key", b"old", -1)
+    results = []
+    with cache._lock:
+        reader = threading.Thread(target=lambda: results.append(cache._get("key")))
+        reader.start()
+        # The reader finds the entry expired and waits for the lock to drop it
+        time.sleep(0.05)
+        DiskResultCache(str(tmp_path))._set("key", b"new", 10)
+    reader.join()
+
+    assert results == [None]
+    assert cache._get("key") == b"new"
+
+
+def test_backends_implement_every_method():
+    class Partial(ResultCache):
+        async def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+async def test_redis_clear_keeps_other_prefixes():
+    redis = InMemoryRedis()
+    mine, other = RedisResultCache(redis), RedisResultCache(redis, prefix="other:")
+    await mine.set("key", b"1", 10)
+    await other.set("key", b"2", 10)
+    await mine.clear()
+
+    assert await other.get("key") == b"2"
+
+
+def test_keys_identify_the_context():
+    headers = {"agent-id": "a", "tenant-id": "t", "user-id": "u"}
+    assert result_cache_key(headers, "tool", "h") != result_cache_key({**headers, "tenant-id": "t2"}, "tool", "h")
+    token_key = result_cache_key({"agent-id": "a", "frontegg-user-access-token": "secret"}, "tool", "h")
+    assert "secret" not in token_key
+
+
+async def test_client_serves_cached_results_until_they_expire(server, make_client):
+    async with make_client(result_cache_tools={"tool_0": 0.1}) as client:
+        first = await client.call_tool("tool_0", {"query": "a"})
+        cached = await client.call_tool("tool_0", {"query": "a"})
+        assert server.stats.tool_calls == 1
+        assert cached.content[0].text == first.content[0].text
+
+        await client.call_tool("tool_0", {"query": "b"})
+        await client.for_context("tenant-1").call_tool("tool_0", {"query": "a"})
+        assert server.stats.tool_calls == 3
+
+        await anyio.sleep(0.12)
+        await client.call_tool("tool_0", {"query": "a"})
+        assert server.stats.tool_calls == 4
+
+
+async def test_uncached_tools_always_call_the_server(server, make_client):
+    async with make_client(result_cache_tools={"tool_0": 10}) as client:
+        await client.call_tool("tool_1", {"query": "a"})
+        await client.call_tool("tool_1", {"query": "a"})
+
+    assert server.stats.tool_calls == 2
@@ -0,0 +1,108 @@
+import time
+
+import httpx
+import pytest
+from mcp.shared.exceptions import McpError
+
+from frontegg_ai_sdk.core.client_utils import is_retryable_tool_call_error, retry_after_seconds, retry_async
+from frontegg_ai_sdk.core.config import ClientRetryConfiguration
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+
+def status_error(status: int, headers=None) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "https://mcp.example.com")
+    return httpx.HTTPStatusError("failed", request=request, response=httpx.Response(status, headers=headers))
+
+
+async def test_retry_waits_for_retry_after(server, make_client):
+    server.fail("tools/call", status=429, headers={"retry-after": "0.2"})
+    async with make_client() as client:
+        started = time.monotonic()
+        result = await client.call_tool("tool_0", {"query": "a"})
+
+    assert not result.isError
+    assert time.monotonic() - started >= 0.2
+    assert server.stats.tool_calls == 1
+
+
+async def test_server_errors_are_not_retried_for_tools_with_side_effects(server, make_client):
+    server.fail("tools/call", status=503)
+    async with make_client() as client:
+        with pytest.raises(McpError):
+            await client.call_tool("tool_0", {"query": "a"})
+
+    assert server.stats.tool_calls == 0
+
+
+async def test_server_errors_are_retried_for_idempotent_tools(make_client):
+    server = StubMcpServer(tool_count=1, tool_annotations={"tool_0": {"idempotentHint": True}})
+    server.fail("tools/call", count=2, status=503)
+    async with make_client(stub=server) as client:
+        await client.list_tools()
+        result = await client.call_tool("tool_0", {"query": "a"})
+
+    assert not result.isError
+    assert server.stats.tool_calls == 1
+
+
+@pytest.mark.parametrize("error", [httpx.ReadTimeout("timed out"), httpx.ReadError("reset")])
+async def test_read_failures_are_retried_only_for_idempotent_tools(make_client, error):
+    server = StubMcpServer(tool_count=2, tool_annotations={"tool_0": {"readOnlyHint": True}})
+    async with make_client(stub=server) as client:
+        await client.list_tools()
+        server.fail("tools/call", error=error)
+        result = await client.call_tool("tool_0", {"query": "a"})
+        assert not result.isError
+
+        server.fail("tools/call", error=error)
+        with pytest.raises(McpError):
+            await client.call_tool("tool_1", {"query": "a"})
+
+
+def test_tool_call_retry_predicate():
+    for error in (httpx.ReadTimeout("timed out"), httpx.ReadError("reset"), httpx.WriteTimeout("timed out")):
+        assert is_retryable_tool_call_error(error, idempotent=True)
+        assert not is_retryable_tool_call_error(error)
+    assert is_retryable_tool_call_error(httpx.ConnectError("refused"))
+
+
+async def test_list_tools_is_retried(server, make_client):
+    server.fail("tools/list", count=2, status=502)
+    async with make_client() as client:
+        tools = await client.list_tools()
+
+    assert len(tools.tools) == 3
+
+
+async def test_retry_gives_up_at_the_deadline():
+    attempts = []
+
+    async def failing() -> None:
+        attempts.append(time.monotonic())
+        raise status_error(503)
+
+    config = ClientRetryConfiguration(tries=10, delay_in_ms=50, jitter=0, deadline=0.12)
+    with pytest.raises(httpx.HTTPStatusError):
+        await retry_async(failing, config)
+
+    assert 1 < len(attempts) < 10
+
+
+async def test_retry_stops_after_the_last_attempt():
+    attempts = []
+
+    async def failing() -> None:
+        attempts.append(1)
+        raise status_error(500)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await retry_async(failing, ClientRetryConfiguration(tries=3, delay_in_ms=1))
+
+    assert len(attempts) == 3
+
+
+def test_retry_after_header_in_seconds():
+    assert retry_after_seconds(status_error(429, {"retry-after": "3"})) == 3.0
+    assert retry_after_seconds(status_error(429)) is None
@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from frontegg_ai_sdk.core.session_pool import SessionPool
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_pooled_session_is_reused(server, make_client):
+    async with make_client() as client:
+        for index in range(3):
+            await client.call_tool("tool_0", {"query": str(index)})
+
+    assert server.stats.sessions == 1
+    assert server.stats.tool_calls == 3
+
+
+async def test_one_off_sessions_without_pooling(server, make_client):
+    async with make_client(persistent_sessions=False) as client:
+        await client.call_tool("tool_0", {"query": "a"})
+        await client.call_tool("tool_0", {"query": "b"})
+
+    assert server.stats.sessions == 2
+
+
+async def test_session_is_rebuilt_when_the_server_terminates_it(server, make_client):
+    async with make_client() as client:
+        await client.call_tool("tool_0", {"query": "a"})
+        server.expire_sessions()
+        result = await client.call_tool("tool_0", {"query": "b"})
+
+    assert not result.isError
+    assert server.stats.sessions == 2
+    assert server.stats.tool_calls == 2
+
+
+async def test_contexts_get_their_own_sessions(server, make_client):
+    async with make_client() as client:
+        await client.call_tool("tool_0", {"query": "a"})
+        await client.for_context("tenant-1").call_tool("tool_0", {"query": "a"})
+        await client.for_context("tenant-1").call_tool("tool_0", {"query": "b"})
+
+    assert server.stats.sessions == 2
+
+
+async def test_sessions_are_replaced_after_max_requests(server, make_client):
+    async with make_client(session_max_requests=3) as client:
+        for index in range(7):
+            await client.call_tool("tool_0", {"query": str(index)})
+        assert server.stats.terminated_sessions == 2
+
+    assert server.stats.sessions == 3
+
+
+async def test_sessions_are_replaced_after_max_age(server, make_client):
+    async with make_client(session_max_age=0.05) as client:
+        await client.call_tool("tool_0", {"query": "a"})
+        await asyncio.sleep(0.06)
+        await client.call_tool("tool_0", {"query": "b"})
+        assert server.stats.terminated_sessions == 1
+
+    assert server.stats.sessions == 2
+
+
+async def test_busy_session_closes_once_its_calls_finish(make_client):
+    server = StubMcpServer(tool_count=1, tool_latency={"tool_0": 0.05})
+    async with make_client(stub=server, session_max_requests=3) as client:
+        await client.call_tool("tool_0", {"query": "warm"})
+        results = await asyncio.gather(*(client.call_tool("tool_0", {"query": str(index)}) for index in range(3)))
+        assert not any(result.isError for result in results)
+        assert server.stats.sessions == 2
+        assert server.stats.terminated_sessions == 1
+
+
+def test_pool_is_bound_to_one_event_loop():
+    pool = SessionPool("https://mcp.example.com")
+    asyncio.run(pool.aclose())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(pool.aclose())
+
+
+async def test_sync_and_async_calls_use_their_own_pools(server, make_client):
+    async with make_client() as client:
+        await client.call_tool("tool_0", {"query": "a"})
+        await asyncio.get_running_loop().run_in_executor(None, client.call_tool_sync, "tool_0", {"query": "b"})
+        await client.call_tool("tool_0", {"query": "c"})
+        client.close()
+
+    assert server.stats.sessions == 2
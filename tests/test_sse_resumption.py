@@ -0,0 +1,29 @@
+import pytest
+from mcp.shared.exceptions import McpError
+
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def server():
+    return StubMcpServer(tool_count=1, sse=True)
+
+
+async def test_dropped_stream_is_resumed_with_last_event_id(server, make_client):
+    server.drop_sse_streams()
+    async with make_client(sse_reconnect_delay=0.01) as client:
+        result = await client.call_tool("tool_0", {"query": "a"})
+
+    assert result.content[0].text == '{"query": "a"}'
+    assert server.stats.resumptions == 1
+
+
+async def test_call_fails_when_the_stream_cannot_be_resumed(server, make_client):
+    server.drop_sse_streams(resumable=False)
+    async with make_client(sse_reconnect_delay=0.01, sse_reconnect_attempts=1) as client:
+        with pytest.raises(McpError):
+            await client.call_tool("tool_0", {"query": "a"})
+
+    assert server.stats.resumptions == 0
@@ -0,0 +1,49 @@
+import time
+
+import pytest
+from mcp.shared.exceptions import McpError
+
+from frontegg_ai_sdk import ToolContent, ToolResult
+from stub_server import StubMcpServer
+
+pytestmark = pytest.mark.anyio
+
+
+async def collect(client, name="tool_0", arguments=None):
+    async with client.call_tool_stream(name, arguments or {"query": "a"}) as events:
+        return [event async for event in events]
+
+
+async def test_stream_ends_with_content_and_result(server, make_client):
+    async with make_client() as client:
+        events = await collect(client)
+
+    assert [type(event) for event in events] == [ToolContent, ToolContent, ToolResult]
+    assert [event.item for event in events[:2]] == events[-1].result.content
+
+
+async def test_stream_raises_the_error_of_the_call(server, make_client):
+    server.fail("tools/call", status=400)
+    async with make_client() as client:
+        with pytest.raises(McpError):
+            await collect(client)
+
+
+async def test_stream_retries_and_caches_like_call_tool(server, make_client):
+    server.fail("tools/call", status=429)
+    async with make_client(result_cache_tools={"tool_0": 10}) as client:
+        first = await collect(client)
+        cached = await collect(client)
+
+    assert server.stats.tool_calls == 1
+    assert cached[-1].result.content == first[-1].result.content
+
+
+async def test_leaving_the_block_cancels_the_call(make_client):
+    server = StubMcpServer(tool_count=1, tool_latency={"tool_0": 1})
+    async with make_client(stub=server) as client:
+        started = time.monotonic()
+        async with client.call_tool_stream("tool_0", {"query": "a"}):
+            pass
+        assert time.monotonic() - started < 0.5
+        assert not client._progress_streams
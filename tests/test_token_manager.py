@@ -0,0 +1,46 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from frontegg_ai_sdk.core.token_manager import VendorTokenManager
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_token():
+    return {"token": "token", "expiration": datetime.now() + timedelta(hours=1)}
+
+
+async def test_concurrent_callers_share_one_refresh():
+    calls = []
+
+    async def counting_create_token():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return await create_token()
+
+    manager = VendorTokenManager(counting_create_token)
+    await asyncio.gather(*(manager.get_token() for _ in range(5)))
+
+    assert len(calls) == 1
+
+
+async def test_aclose_cancels_renewal_running_on_another_loop():
+    manager = VendorTokenManager(create_token, background_refresh=True)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(manager.get_token(), loop).result(5)
+        renewal = manager._renewal
+        assert renewal is not None and renewal.get_loop() is loop
+
+        await manager.aclose()
+        await asyncio.sleep(0.05)
+        assert renewal.cancelled()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,35 @@
+import base64
+import os
+
+import mcp.types as types
+import pytest
+
+from frontegg_ai_sdk.core.tool_results import BinaryContent, decode_binary_content
+
+DATA = os.urandom(3 * 1024 * 1024 + 5)
+
+
+@pytest.mark.parametrize("encoded", [
+    base64.b64encode(DATA).decode(),
+    base64.encodebytes(DATA).decode(),
+], ids=["plain", "wrapped"])
+def test_base64_decodes_into_buffer(encoded):
+    with BinaryContent.from_base64(encoded, 0, "image") as binary:
+        assert binary.read() == DATA
+
+
+def test_large_content_spills_to_a_file():
+    with BinaryContent.from_base64(base64.b64encode(DATA).decode(), 0, "image", spill_threshold=1024) as binary:
+        assert binary.spilled
+        assert binary.memoryview() == DATA
+
+
+def test_decoded_items_are_emptied_in_a_copy():
+    image = types.ImageContent(type="image", data=base64.b64encode(DATA).decode(), mimeType="image/png")
+    result = types.CallToolResult(content=[types.TextContent(type="text", text="done"), image])
+
+    with decode_binary_content(result, threshold=1024) as output:
+        assert output.result.content[1].data == ""
+        assert result.content[1].data == image.data
+        assert [(binary.index, binary.mimeType) for binary in output.binaries] == [(1, "image/png")]
+        assert output.binaries[0].read() == DATA